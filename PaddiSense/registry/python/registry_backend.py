@@ -11,6 +11,7 @@ This script handles all write operations for the farm registry:
 
 Data is stored in: /config/local_data/registry/config.json
 Backups are stored in: /config/local_data/registry/backups/
+Old transactions are archived to: /config/local_data/registry/transactions_archive.jsonl
 
 Usage:
   python3 registry_backend.py init
@@ -19,36 +20,214 @@ Usage:
   python3 registry_backend.py add_season --name "CY26" --start 2025-04-01 --end 2026-03-31
   python3 registry_backend.py set_active_season --id cy26
   python3 registry_backend.py migrate_from_pwm
+  python3 registry_backend.py daemon
+
+When a daemon is running, other invocations forward their command to it over
+a Unix socket instead of running it in-process.
 """
 
 import argparse
+import contextlib
+import copy
+import functools
+import hashlib
+import io
 import json
+import mmap
+import os
 import re
+import socket
 import sys
 from datetime import datetime
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
 
 # File locations
 DATA_DIR = Path("/config/local_data/registry")
 CONFIG_FILE = DATA_DIR / "config.json"
 CROPS_FILE = DATA_DIR / "crops.json"
 BACKUP_DIR = DATA_DIR / "backups"
+TRANSACTIONS_ARCHIVE_FILE = DATA_DIR / "transactions_archive.jsonl"
 
 # PWM data for migration
 PWM_CONFIG_FILE = Path("/config/local_data/pwm/config.json")
 
+# Unix socket used by daemon mode
+SOCKET_FILE = Path("/run/paddisense_registry.sock")
+
+# Seconds the daemon waits on a client's request or response before dropping it,
+# and seconds the CLI waits for the daemon to run a command and reply
+DAEMON_IO_TIMEOUT = 5
+DAEMON_REQUEST_TIMEOUT = 120
+
+# Transactions kept in config.json; once exceeded, the oldest
+# TRANSACTION_SPILL_COUNT entries are appended to the JSONL archive
+MAX_TRANSACTIONS = 1000
+TRANSACTION_SPILL_COUNT = 500
+
+# Files at least this large are memory-mapped when parsed with orjson
+MMAP_THRESHOLD = 1024 * 1024
+
+# Parsed JSON files keyed by path: ((mtime_ns, inode, size), data, content digest)
+_json_cache: dict[Path, tuple[tuple[int, int, int], dict[str, Any], bytes]] = {}
+
+# Timestamp shared by everything one command writes (reset per command)
+_command_now: str | None = None
+
+# Pending writes while run_many() is batching commands, else None
+_deferred_writes: dict[Path, dict[str, Any]] | None = None
+
+# ID generation patterns
+ID_INVALID_CHARS_REGEX = re.compile(r"[^a-z0-9]+")
+ID_REPEATED_UNDERSCORE_REGEX = re.compile(r"_+")
+
+
+def json_dumps(obj: Any) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def emit(obj: Any) -> None:
+    """Print obj as one line of JSON, writing bytes directly to stdout when possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is None or buffer is None:
+        print(json_dumps(obj))
+        return
+    sys.stdout.flush()
+    buffer.write(orjson.dumps(obj) + b"\n")
+    buffer.flush()
+
+
+def print_json_list(key: str, items: Iterable[dict[str, Any]]) -> None:
+    """Print {key: [...]} encoding each item as it is produced, without a list of dicts."""
+    sys.stdout.write(f'{{"{key}":[' + ",".join(map(json_dumps, items)) + "]}\n")
+
+
+def json_loads(data: bytes | str) -> Any:
+    """Parse JSON text or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def read_json_file(path: Path) -> Any:
+    """Parse a JSON file, memory-mapping large files to avoid an extra copy."""
+    if orjson is None or path.stat().st_size < MMAP_THRESHOLD:
+        return json_loads(path.read_bytes())
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        with memoryview(mm) as view:
+            return orjson.loads(view)
+
+
+def serialize_json_file(data: dict[str, Any]) -> bytes:
+    """Serialize data as indented UTF-8 JSON file content."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode("utf-8")
+
+
+def content_digest(content: bytes) -> bytes:
+    """Return a short digest used to detect unchanged file content."""
+    return hashlib.blake2b(content, digest_size=16).digest()
+
+
+def write_json_file(path: Path, data: dict[str, Any]) -> bytes:
+    """Atomically write data to path as indented UTF-8 JSON.
+
+    The content is written to a temporary file, fsynced and renamed over
+    the target so readers never see a partially written file. Returns the
+    digest of the written content.
+    """
+    content = serialize_json_file(data)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.tmp")
+    with tmp_path.open("wb") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return content_digest(content)
+
+
+def _file_key(path: Path) -> tuple[int, int, int]:
+    """Return a key that changes whenever the file is rewritten."""
+    st = path.stat()
+    return (st.st_mtime_ns, st.st_ino, st.st_size)
 
+
+def load_json_cached(path: Path) -> dict[str, Any] | None:
+    """Load a JSON file, reusing the parsed result while the file is unchanged.
+
+    Returns None if the file is missing or invalid. The returned dict is
+    shared with the cache, so callers must either save their changes or
+    leave it unmodified.
+    """
+    if _deferred_writes is not None and path in _deferred_writes:
+        return _deferred_writes[path]
+    try:
+        key = _file_key(path)
+        cached = _json_cache.get(path)
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        content = path.read_bytes()
+        data = json_loads(content)
+    except (json.JSONDecodeError, IOError):
+        return None
+    _json_cache[path] = (key, data, content_digest(content))
+    return data
+
+
+def matches_file(path: Path, data: dict[str, Any]) -> bool:
+    """Return True if data serializes to exactly what was last read from or written to path."""
+    cached = _json_cache.get(path)
+    if cached is None or _deferred_writes is not None:
+        return False
+    try:
+        if cached[0] != _file_key(path):
+            return False
+    except OSError:
+        return False
+    return cached[2] == content_digest(serialize_json_file(data))
+
+
+def store_json_file(path: Path, data: dict[str, Any]) -> None:
+    """Write a JSON file and refresh its cache entry (deferred inside run_many)."""
+    if _deferred_writes is not None:
+        _deferred_writes[path] = data
+        return
+    digest = write_json_file(path, data)
+    _json_cache[path] = (_file_key(path), data, digest)
+
+
+def now_iso() -> str:
+    """Return the current command's timestamp, taken once per command."""
+    global _command_now
+    if _command_now is None:
+        _command_now = datetime.now().isoformat(timespec="seconds")
+    return _command_now
+
+
+@functools.lru_cache(maxsize=1024)
 def generate_id(name: str) -> str:
-    """Generate a clean ID from the name."""
-    clean = re.sub(r"[^a-z0-9]+", "_", name.lower())
-    clean = re.sub(r"_+", "_", clean).strip("_")
+    """Generate a clean ID from the name (cached for daemon and batch runs)."""
+    clean = ID_INVALID_CHARS_REGEX.sub("_", name.lower())
+    clean = ID_REPEATED_UNDERSCORE_REGEX.sub("_", clean).strip("_")
     return clean[:30] if clean else "unknown"
 
 
 def load_config() -> dict[str, Any]:
     """Load config from JSON file, or return empty structure."""
-    if not CONFIG_FILE.exists():
+    config = load_json_cached(CONFIG_FILE)
+    if config is None:
         return {
             "initialized": False,
             "businesses": {},
@@ -58,43 +237,66 @@ def load_config() -> dict[str, Any]:
             "seasons": {},
             "version": "1.0.0",
         }
+    return config
+
+
+def archive_transactions(config: dict[str, Any]) -> None:
+    """Spill the oldest transactions to the JSONL archive once over MAX_TRANSACTIONS.
+
+    Spilling a batch at a time means the archive is only appended to every
+    TRANSACTION_SPILL_COUNT saves rather than on every save.
+    """
+    transactions = config.get("transactions")
+    if not transactions or len(transactions) <= MAX_TRANSACTIONS:
+        return
+    spill = len(transactions) - MAX_TRANSACTIONS + TRANSACTION_SPILL_COUNT
+    TRANSACTIONS_ARCHIVE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    with TRANSACTIONS_ARCHIVE_FILE.open("ab") as f:
+        f.write("".join(json_dumps(t) + "\n" for t in transactions[:spill]).encode("utf-8"))
+    del transactions[:spill]
+
+
+def count_archived_transactions() -> int:
+    """Return the number of transactions in the JSONL archive."""
     try:
-        return json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, IOError):
-        return {
-            "initialized": False,
-            "businesses": {},
-            "farms": {},
-            "paddocks": {},
-            "bays": {},
-            "seasons": {},
-            "version": "1.0.0",
-        }
+        return TRANSACTIONS_ARCHIVE_FILE.read_bytes().count(b"\n")
+    except FileNotFoundError:
+        return 0
 
 
 def save_config(config: dict[str, Any]) -> None:
-    """Save config to JSON file."""
-    config["modified"] = datetime.now().isoformat(timespec="seconds")
-    CONFIG_FILE.parent.mkdir(parents=True, exist_ok=True)
-    CONFIG_FILE.write_text(
-        json.dumps(config, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    """Save config to JSON file (skipped if nothing changed since it was loaded)."""
+    if matches_file(CONFIG_FILE, config):
+        return
+    config["modified"] = now_iso()
+    archive_transactions(config)
+    store_json_file(CONFIG_FILE, config)
 
 
-def create_backup(tag: str = "") -> Path:
-    """Create a timestamped backup of the config file."""
+def create_backup(tag: str = "", dedupe: bool = False) -> Path:
+    """Create a timestamped backup of the config file.
+
+    With dedupe, a short content hash is added to the filename and an existing
+    backup with the same tag and hash is returned instead of writing a copy.
+    """
     BACKUP_DIR.mkdir(parents=True, exist_ok=True)
     ts = datetime.now().strftime("%Y-%m-%d_%H%M%S")
     suffix = f"_{tag}" if tag else ""
+    content = CONFIG_FILE.read_bytes() if CONFIG_FILE.exists() else None
+    if dedupe and content is not None:
+        suffix += f"_{hashlib.blake2b(content, digest_size=4).hexdigest()}"
+        existing = next(BACKUP_DIR.glob(f"backup_*{suffix}.json"), None)
+        if existing is not None:
+            return existing
     backup_name = f"backup_{ts}{suffix}.json"
     backup_path = BACKUP_DIR / backup_name
-    if CONFIG_FILE.exists():
-        backup_path.write_text(CONFIG_FILE.read_text(encoding="utf-8"), encoding="utf-8")
+    if content is not None:
+        backup_path.write_bytes(content)
     return backup_path
 
 
 def log_transaction(
-    config: dict,
+    config: dict[str, Any],
     action: str,
     entity_type: str,
     entity_id: str,
@@ -104,7 +306,7 @@ def log_transaction(
     """Append a transaction record for audit trail."""
     config.setdefault("transactions", []).append(
         {
-            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "timestamp": now_iso(),
             "action": action,
             "entity_type": entity_type,
             "entity_id": entity_id,
@@ -114,29 +316,65 @@ def log_transaction(
     )
 
 
+def find_active_season_ids(config: dict[str, Any]) -> list[str]:
+    """Return the IDs of seasons currently flagged active.
+
+    Uses the stored active_season_id when it is still valid, so the common
+    case avoids scanning every season. Falls back to a full scan for older
+    configs or when another writer has changed the active flag.
+    """
+    seasons = config.get("seasons", {})
+    active_id: str | None = config.get("active_season_id")
+    if active_id is not None and seasons.get(active_id, {}).get("active"):
+        return [active_id]
+    return [sid for sid, s in seasons.items() if s.get("active")]
+
+
+def get_active_season_id(config: dict[str, Any]) -> str | None:
+    """Return the active season ID, using the stored ID when it is still valid."""
+    seasons = config.get("seasons", {})
+    active_id: str | None = config.get("active_season_id")
+    if active_id is not None and seasons.get(active_id, {}).get("active"):
+        return active_id
+    return next((sid for sid, s in seasons.items() if s.get("active")), None)
+
+
+def activate_season(config: dict[str, Any], season_id: str, now: str) -> None:
+    """Make season_id the only active season, touching only seasons that change."""
+    seasons = config.get("seasons", {})
+    for sid in find_active_season_ids(config):
+        if sid != season_id:
+            seasons[sid]["active"] = False
+            seasons[sid]["modified"] = now
+    season = seasons[season_id]
+    if not season.get("active"):
+        season["active"] = True
+        season["modified"] = now
+    config["active_season_id"] = season_id
+
+
+def stage_order(stage: dict[str, Any]) -> int:
+    """Sort key for crop stages."""
+    return stage.get("order", 0)
+
+
 def load_crops() -> dict[str, Any]:
     """Load crops config from JSON file."""
-    if not CROPS_FILE.exists():
-        return {
-            "version": "1.0.0",
-            "crops": {},
-        }
-    try:
-        return json.loads(CROPS_FILE.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, IOError):
+    crops_data = load_json_cached(CROPS_FILE)
+    if crops_data is None:
         return {
             "version": "1.0.0",
             "crops": {},
         }
+    return crops_data
 
 
 def save_crops(crops_data: dict[str, Any]) -> None:
-    """Save crops config to JSON file."""
-    crops_data["modified"] = datetime.now().isoformat(timespec="seconds")
-    CROPS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    CROPS_FILE.write_text(
-        json.dumps(crops_data, indent=2, ensure_ascii=False), encoding="utf-8"
-    )
+    """Save crops config to JSON file (skipped if nothing changed since it was loaded)."""
+    if matches_file(CROPS_FILE, crops_data):
+        return
+    crops_data["modified"] = now_iso()
+    store_json_file(CROPS_FILE, crops_data)
 
 
 # =============================================================================
@@ -154,11 +392,11 @@ def cmd_add_paddock(args: argparse.Namespace) -> int:
 
     # Check if paddock already exists
     if paddock_id in paddocks:
-        print(json.dumps({"error": f"Paddock '{paddock_id}' already exists"}))
+        emit({"error": f"Paddock '{paddock_id}' already exists"})
         return 1
 
     # Create paddock
-    now = datetime.now().isoformat(timespec="seconds")
+    now = now_iso()
     bay_prefix = args.bay_prefix or "B-"
 
     paddock_data = {
@@ -182,19 +420,18 @@ def cmd_add_paddock(args: argparse.Namespace) -> int:
     paddocks[paddock_id] = paddock_data
 
     # Create bays
-    for i in range(1, args.bay_count + 1):
-        bay_name = f"{bay_prefix}{i:02d}"
-        bay_id = f"{paddock_id}_{generate_id(bay_name)}"
-        is_last = i == args.bay_count
-
-        bays[bay_id] = {
+    bay_names = [f"{bay_prefix}{i:02d}" for i in range(1, args.bay_count + 1)]
+    bays.update({
+        f"{paddock_id}_{generate_id(bay_name)}": {
             "paddock_id": paddock_id,
             "name": bay_name,
             "order": i,
-            "is_last_bay": is_last,
+            "is_last_bay": i == args.bay_count,
             "created": now,
             "modified": now,
         }
+        for i, bay_name in enumerate(bay_names, start=1)
+    })
 
     log_transaction(
         config, "add", "paddock", paddock_id, args.name,
@@ -202,12 +439,12 @@ def cmd_add_paddock(args: argparse.Namespace) -> int:
     )
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "paddock_id": paddock_id,
         "bay_count": args.bay_count,
         "message": f"Created paddock '{args.name}' with {args.bay_count} bays"
-    }))
+    })
     return 0
 
 
@@ -217,10 +454,11 @@ def cmd_edit_paddock(args: argparse.Namespace) -> int:
     paddocks = config.get("paddocks", {})
 
     if args.id not in paddocks:
-        print(json.dumps({"error": f"Paddock '{args.id}' not found"}))
+        emit({"error": f"Paddock '{args.id}' not found"})
         return 1
 
     paddock = paddocks[args.id]
+    before = copy.deepcopy(paddock)
     changes = []
 
     if args.name is not None:
@@ -247,8 +485,7 @@ def cmd_edit_paddock(args: argparse.Namespace) -> int:
     if args.crop_1_id is not None:
         if args.crop_1_id == "" or args.crop_1_id.lower() == "none":
             # Clear crop 1
-            if "crop_1" in paddock:
-                del paddock["crop_1"]
+            if paddock.pop("crop_1", None) is not None:
                 changes.append("crop_1=cleared")
         else:
             crop_1 = paddock.setdefault("crop_1", {})
@@ -263,8 +500,7 @@ def cmd_edit_paddock(args: argparse.Namespace) -> int:
     if args.crop_2_id is not None:
         if args.crop_2_id == "" or args.crop_2_id.lower() == "none":
             # Clear crop 2
-            if "crop_2" in paddock:
-                del paddock["crop_2"]
+            if paddock.pop("crop_2", None) is not None:
                 changes.append("crop_2=cleared")
         else:
             crop_2 = paddock.setdefault("crop_2", {})
@@ -275,7 +511,15 @@ def cmd_edit_paddock(args: argparse.Namespace) -> int:
                 crop_2["end_month"] = args.crop_2_end
             changes.append(f"crop_2={args.crop_2_id}")
 
-    paddock["modified"] = datetime.now().isoformat(timespec="seconds")
+    if paddock == before:
+        emit({
+            "success": True,
+            "paddock_id": args.id,
+            "message": f"No changes to paddock '{paddock['name']}'"
+        })
+        return 0
+
+    paddock["modified"] = now_iso()
 
     log_transaction(
         config, "edit", "paddock", args.id, paddock["name"],
@@ -283,11 +527,11 @@ def cmd_edit_paddock(args: argparse.Namespace) -> int:
     )
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "paddock_id": args.id,
         "message": f"Updated paddock '{paddock['name']}'"
-    }))
+    })
     return 0
 
 
@@ -297,7 +541,7 @@ def cmd_set_current_season(args: argparse.Namespace) -> int:
     paddocks = config.get("paddocks", {})
 
     if args.id not in paddocks:
-        print(json.dumps({"error": f"Paddock '{args.id}' not found"}))
+        emit({"error": f"Paddock '{args.id}' not found"})
         return 1
 
     paddock = paddocks[args.id]
@@ -308,8 +552,17 @@ def cmd_set_current_season(args: argparse.Namespace) -> int:
     else:
         new_value = not paddock.get("current_season", True)
 
+    if paddock.get("current_season") == new_value:
+        emit({
+            "success": True,
+            "paddock_id": args.id,
+            "current_season": new_value,
+            "message": f"{paddock['name']} current_season already {new_value}"
+        })
+        return 0
+
     paddock["current_season"] = new_value
-    paddock["modified"] = datetime.now().isoformat(timespec="seconds")
+    paddock["modified"] = now_iso()
 
     log_transaction(
         config, "set_current_season", "paddock", args.id, paddock["name"],
@@ -317,12 +570,12 @@ def cmd_set_current_season(args: argparse.Namespace) -> int:
     )
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "paddock_id": args.id,
         "current_season": new_value,
         "message": f"Set {paddock['name']} current_season to {new_value}"
-    }))
+    })
     return 0
 
 
@@ -333,7 +586,7 @@ def cmd_delete_paddock(args: argparse.Namespace) -> int:
     bays = config.get("bays", {})
 
     if args.id not in paddocks:
-        print(json.dumps({"error": f"Paddock '{args.id}' not found"}))
+        emit({"error": f"Paddock '{args.id}' not found"})
         return 1
 
     # Create backup before delete
@@ -355,12 +608,12 @@ def cmd_delete_paddock(args: argparse.Namespace) -> int:
     )
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "paddock_id": args.id,
         "bays_deleted": len(bays_to_delete),
         "message": f"Deleted paddock '{paddock_name}' and {len(bays_to_delete)} bays"
-    }))
+    })
     return 0
 
 
@@ -376,21 +629,21 @@ def cmd_add_bay(args: argparse.Namespace) -> int:
     bays = config.setdefault("bays", {})
 
     if args.paddock not in paddocks:
-        print(json.dumps({"error": f"Paddock '{args.paddock}' not found"}))
+        emit({"error": f"Paddock '{args.paddock}' not found"})
         return 1
 
     paddock = paddocks[args.paddock]
     bay_id = f"{args.paddock}_{generate_id(args.name)}"
 
     if bay_id in bays:
-        print(json.dumps({"error": f"Bay '{bay_id}' already exists"}))
+        emit({"error": f"Bay '{bay_id}' already exists"})
         return 1
 
     # Determine order
     existing_bays = [b for b in bays.values() if b.get("paddock_id") == args.paddock]
     max_order = max([b.get("order", 0) for b in existing_bays], default=0)
 
-    now = datetime.now().isoformat(timespec="seconds")
+    now = now_iso()
     bays[bay_id] = {
         "paddock_id": args.paddock,
         "name": args.name,
@@ -407,11 +660,11 @@ def cmd_add_bay(args: argparse.Namespace) -> int:
     log_transaction(config, "add", "bay", bay_id, args.name, f"Added to {args.paddock}")
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "bay_id": bay_id,
         "message": f"Added bay '{args.name}' to paddock"
-    }))
+    })
     return 0
 
 
@@ -421,10 +674,11 @@ def cmd_edit_bay(args: argparse.Namespace) -> int:
     bays = config.get("bays", {})
 
     if args.id not in bays:
-        print(json.dumps({"error": f"Bay '{args.id}' not found"}))
+        emit({"error": f"Bay '{args.id}' not found"})
         return 1
 
     bay = bays[args.id]
+    before = dict(bay)
     changes = []
 
     if args.name is not None:
@@ -439,16 +693,24 @@ def cmd_edit_bay(args: argparse.Namespace) -> int:
         bay["is_last_bay"] = args.is_last
         changes.append(f"is_last={args.is_last}")
 
-    bay["modified"] = datetime.now().isoformat(timespec="seconds")
+    if bay == before:
+        emit({
+            "success": True,
+            "bay_id": args.id,
+            "message": f"No changes to bay '{bay['name']}'"
+        })
+        return 0
+
+    bay["modified"] = now_iso()
 
     log_transaction(config, "edit", "bay", args.id, bay["name"], ", ".join(changes))
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "bay_id": args.id,
         "message": f"Updated bay '{bay['name']}'"
-    }))
+    })
     return 0
 
 
@@ -459,7 +721,7 @@ def cmd_delete_bay(args: argparse.Namespace) -> int:
     paddocks = config.get("paddocks", {})
 
     if args.id not in bays:
-        print(json.dumps({"error": f"Bay '{args.id}' not found"}))
+        emit({"error": f"Bay '{args.id}' not found"})
         return 1
 
     bay = bays[args.id]
@@ -473,16 +735,16 @@ def cmd_delete_bay(args: argparse.Namespace) -> int:
         paddocks[paddock_id]["bay_count"] = len(
             [b for b in bays.values() if b.get("paddock_id") == paddock_id]
         )
-        paddocks[paddock_id]["modified"] = datetime.now().isoformat(timespec="seconds")
+        paddocks[paddock_id]["modified"] = now_iso()
 
     log_transaction(config, "delete", "bay", args.id, bay_name, "")
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "bay_id": args.id,
         "message": f"Deleted bay '{bay_name}'"
-    }))
+    })
     return 0
 
 
@@ -499,33 +761,31 @@ def cmd_add_season(args: argparse.Namespace) -> int:
     season_id = generate_id(args.name)
 
     if season_id in seasons:
-        print(json.dumps({"error": f"Season '{season_id}' already exists"}))
+        emit({"error": f"Season '{season_id}' already exists"})
         return 1
 
-    now = datetime.now().isoformat(timespec="seconds")
+    now = now_iso()
     seasons[season_id] = {
         "name": args.name,
         "start_date": args.start,
         "end_date": args.end,
-        "active": args.active or False,
+        "active": False,
         "created": now,
         "modified": now,
     }
 
-    # If this is set as active, deactivate others
+    # If this is set as active, deactivate the previous one
     if args.active:
-        for sid, season in seasons.items():
-            if sid != season_id:
-                season["active"] = False
+        activate_season(config, season_id, now)
 
     log_transaction(config, "add", "season", season_id, args.name, f"{args.start} to {args.end}")
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "season_id": season_id,
         "message": f"Created season '{args.name}'"
-    }))
+    })
     return 0
 
 
@@ -535,10 +795,11 @@ def cmd_edit_season(args: argparse.Namespace) -> int:
     seasons = config.get("seasons", {})
 
     if args.id not in seasons:
-        print(json.dumps({"error": f"Season '{args.id}' not found"}))
+        emit({"error": f"Season '{args.id}' not found"})
         return 1
 
     season = seasons[args.id]
+    before = dict(season)
     changes = []
 
     if args.name is not None:
@@ -553,16 +814,24 @@ def cmd_edit_season(args: argparse.Namespace) -> int:
         season["end_date"] = args.end
         changes.append(f"end={args.end}")
 
-    season["modified"] = datetime.now().isoformat(timespec="seconds")
+    if season == before:
+        emit({
+            "success": True,
+            "season_id": args.id,
+            "message": f"No changes to season '{season['name']}'"
+        })
+        return 0
+
+    season["modified"] = now_iso()
 
     log_transaction(config, "edit", "season", args.id, season["name"], ", ".join(changes))
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "season_id": args.id,
         "message": f"Updated season '{season['name']}'"
-    }))
+    })
     return 0
 
 
@@ -572,20 +841,22 @@ def cmd_delete_season(args: argparse.Namespace) -> int:
     seasons = config.get("seasons", {})
 
     if args.id not in seasons:
-        print(json.dumps({"error": f"Season '{args.id}' not found"}))
+        emit({"error": f"Season '{args.id}' not found"})
         return 1
 
     season_name = seasons[args.id].get("name", args.id)
     del seasons[args.id]
+    if config.get("active_season_id") == args.id:
+        del config["active_season_id"]
 
     log_transaction(config, "delete", "season", args.id, season_name, "")
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "season_id": args.id,
         "message": f"Deleted season '{season_name}'"
-    }))
+    })
     return 0
 
 
@@ -595,23 +866,20 @@ def cmd_set_active_season(args: argparse.Namespace) -> int:
     seasons = config.get("seasons", {})
 
     if args.id not in seasons:
-        print(json.dumps({"error": f"Season '{args.id}' not found"}))
+        emit({"error": f"Season '{args.id}' not found"})
         return 1
 
-    # Deactivate all, then activate the specified one
-    for sid, season in seasons.items():
-        season["active"] = sid == args.id
-        season["modified"] = datetime.now().isoformat(timespec="seconds")
+    activate_season(config, args.id, now_iso())
 
     season_name = seasons[args.id].get("name", args.id)
     log_transaction(config, "set_active", "season", args.id, season_name, "")
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "season_id": args.id,
         "message": f"Set active season to '{season_name}'"
-    }))
+    })
     return 0
 
 
@@ -628,10 +896,10 @@ def cmd_add_farm(args: argparse.Namespace) -> int:
     farm_id = generate_id(args.name)
 
     if farm_id in farms:
-        print(json.dumps({"error": f"Farm '{farm_id}' already exists"}))
+        emit({"error": f"Farm '{farm_id}' already exists"})
         return 1
 
-    now = datetime.now().isoformat(timespec="seconds")
+    now = now_iso()
     farm_data = {
         "name": args.name,
         "created": now,
@@ -649,11 +917,11 @@ def cmd_add_farm(args: argparse.Namespace) -> int:
     log_transaction(config, "add", "farm", farm_id, args.name, "")
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "farm_id": farm_id,
         "message": f"Created farm '{args.name}'"
-    }))
+    })
     return 0
 
 
@@ -663,10 +931,11 @@ def cmd_edit_farm(args: argparse.Namespace) -> int:
     farms = config.get("farms", {})
 
     if args.id not in farms:
-        print(json.dumps({"error": f"Farm '{args.id}' not found"}))
+        emit({"error": f"Farm '{args.id}' not found"})
         return 1
 
     farm = farms[args.id]
+    before = dict(farm)
     changes = []
 
     if args.name is not None:
@@ -677,8 +946,7 @@ def cmd_edit_farm(args: argparse.Namespace) -> int:
     if args.business is not None:
         if args.business == "" or args.business.lower() == "none":
             # Clear business assignment
-            if "business_id" in farm:
-                del farm["business_id"]
+            if farm.pop("business_id", None) is not None:
                 changes.append("business=cleared")
         else:
             businesses = config.get("businesses", {})
@@ -686,16 +954,24 @@ def cmd_edit_farm(args: argparse.Namespace) -> int:
                 farm["business_id"] = args.business
                 changes.append(f"business={args.business}")
 
-    farm["modified"] = datetime.now().isoformat(timespec="seconds")
+    if farm == before:
+        emit({
+            "success": True,
+            "farm_id": args.id,
+            "message": f"No changes to farm '{farm['name']}'"
+        })
+        return 0
+
+    farm["modified"] = now_iso()
 
     log_transaction(config, "edit", "farm", args.id, farm["name"], ", ".join(changes))
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "farm_id": args.id,
         "message": f"Updated farm '{farm['name']}'"
-    }))
+    })
     return 0
 
 
@@ -706,16 +982,16 @@ def cmd_delete_farm(args: argparse.Namespace) -> int:
     paddocks = config.get("paddocks", {})
 
     if args.id not in farms:
-        print(json.dumps({"error": f"Farm '{args.id}' not found"}))
+        emit({"error": f"Farm '{args.id}' not found"})
         return 1
 
-    # Check for assigned paddocks
-    assigned_paddocks = [p for p in paddocks.values() if p.get("farm_id") == args.id]
-    if assigned_paddocks:
-        print(json.dumps({
-            "error": f"Cannot delete farm with {len(assigned_paddocks)} assigned paddocks",
-            "paddock_count": len(assigned_paddocks)
-        }))
+    # Check for assigned paddocks (count only when reporting the error)
+    if any(p.get("farm_id") == args.id for p in paddocks.values()):
+        paddock_count = sum(1 for p in paddocks.values() if p.get("farm_id") == args.id)
+        emit({
+            "error": f"Cannot delete farm with {paddock_count} assigned paddocks",
+            "paddock_count": paddock_count
+        })
         return 1
 
     farm_name = farms[args.id].get("name", args.id)
@@ -724,11 +1000,11 @@ def cmd_delete_farm(args: argparse.Namespace) -> int:
     log_transaction(config, "delete", "farm", args.id, farm_name, "")
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "farm_id": args.id,
         "message": f"Deleted farm '{farm_name}'"
-    }))
+    })
     return 0
 
 
@@ -745,10 +1021,10 @@ def cmd_add_business(args: argparse.Namespace) -> int:
     business_id = generate_id(args.name)
 
     if business_id in businesses:
-        print(json.dumps({"error": f"Business '{business_id}' already exists"}))
+        emit({"error": f"Business '{business_id}' already exists"})
         return 1
 
-    now = datetime.now().isoformat(timespec="seconds")
+    now = now_iso()
     businesses[business_id] = {
         "name": args.name,
         "created": now,
@@ -758,11 +1034,11 @@ def cmd_add_business(args: argparse.Namespace) -> int:
     log_transaction(config, "add", "business", business_id, args.name, "")
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "business_id": business_id,
         "message": f"Created business '{args.name}'"
-    }))
+    })
     return 0
 
 
@@ -772,26 +1048,35 @@ def cmd_edit_business(args: argparse.Namespace) -> int:
     businesses = config.get("businesses", {})
 
     if args.id not in businesses:
-        print(json.dumps({"error": f"Business '{args.id}' not found"}))
+        emit({"error": f"Business '{args.id}' not found"})
         return 1
 
     business = businesses[args.id]
+    before = dict(business)
     changes = []
 
     if args.name is not None:
         business["name"] = args.name
         changes.append(f"name={args.name}")
 
-    business["modified"] = datetime.now().isoformat(timespec="seconds")
+    if business == before:
+        emit({
+            "success": True,
+            "business_id": args.id,
+            "message": f"No changes to business '{business['name']}'"
+        })
+        return 0
+
+    business["modified"] = now_iso()
 
     log_transaction(config, "edit", "business", args.id, business["name"], ", ".join(changes))
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "business_id": args.id,
         "message": f"Updated business '{business['name']}'"
-    }))
+    })
     return 0
 
 
@@ -799,19 +1084,20 @@ def cmd_delete_business(args: argparse.Namespace) -> int:
     """Delete a business (only if no farms assigned)."""
     config = load_config()
     businesses = config.get("businesses", {})
-    farms = config.get("farms", {})
 
     if args.id not in businesses:
-        print(json.dumps({"error": f"Business '{args.id}' not found"}))
+        emit({"error": f"Business '{args.id}' not found"})
         return 1
 
     # Check for assigned farms
-    assigned_farms = [f for f in farms.values() if f.get("business_id") == args.id]
-    if assigned_farms:
-        print(json.dumps({
-            "error": f"Cannot delete business with {len(assigned_farms)} assigned farms",
-            "farm_count": len(assigned_farms)
-        }))
+    farm_count = sum(
+        1 for f in config.get("farms", {}).values() if f.get("business_id") == args.id
+    )
+    if farm_count:
+        emit({
+            "error": f"Cannot delete business with {farm_count} assigned farms",
+            "farm_count": farm_count
+        })
         return 1
 
     business_name = businesses[args.id].get("name", args.id)
@@ -820,11 +1106,11 @@ def cmd_delete_business(args: argparse.Namespace) -> int:
     log_transaction(config, "delete", "business", args.id, business_name, "")
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "business_id": args.id,
         "message": f"Deleted business '{business_name}'"
-    }))
+    })
     return 0
 
 
@@ -841,37 +1127,47 @@ def cmd_add_crop(args: argparse.Namespace) -> int:
     crop_id = generate_id(args.name)
 
     if crop_id in crops:
-        print(json.dumps({"error": f"Crop '{crop_id}' already exists"}))
+        emit({"error": f"Crop '{crop_id}' already exists"})
         return 1
 
     # Parse stages from JSON string if provided
     stages = []
     if args.stages:
         try:
-            stages = json.loads(args.stages)
+            stages = json_loads(args.stages)
         except json.JSONDecodeError:
-            print(json.dumps({"error": "Invalid stages JSON format"}))
+            emit({"error": "Invalid stages JSON format"})
+            return 1
+        if not isinstance(stages, list) or not all(isinstance(s, dict) for s in stages):
+            emit({"error": "Invalid stages JSON format"})
             return 1
+        stages.sort(key=stage_order)
+
+    start_month = args.start_month
+    end_month = args.end_month
+    spans_new_year = (
+        start_month is not None and end_month is not None and start_month > end_month
+    )
 
     crops[crop_id] = {
         "name": args.name,
-        "typical_start_month": args.start_month or 1,
-        "typical_end_month": args.end_month or 12,
-        "spans_new_year": args.start_month and args.end_month and args.start_month > args.end_month,
+        "typical_start_month": start_month or 1,
+        "typical_end_month": end_month or 12,
+        "spans_new_year": spans_new_year,
         "stages": stages,
         "color": args.color or "#4caf50",
     }
 
     if not crops_data.get("created"):
-        crops_data["created"] = datetime.now().isoformat(timespec="seconds")
+        crops_data["created"] = now_iso()
 
     save_crops(crops_data)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "crop_id": crop_id,
         "message": f"Created crop type '{args.name}'"
-    }))
+    })
     return 0
 
 
@@ -881,49 +1177,70 @@ def cmd_edit_crop(args: argparse.Namespace) -> int:
     crops = crops_data.get("crops", {})
 
     if args.id not in crops:
-        print(json.dumps({"error": f"Crop '{args.id}' not found"}))
+        emit({"error": f"Crop '{args.id}' not found"})
         return 1
 
+    # Parse stages first so invalid input leaves the crop untouched
+    stages = None
+    if args.stages is not None:
+        try:
+            stages = json_loads(args.stages)
+        except json.JSONDecodeError:
+            emit({"error": "Invalid stages JSON format"})
+            return 1
+        if not isinstance(stages, list) or not all(isinstance(s, dict) for s in stages):
+            emit({"error": "Invalid stages JSON format"})
+            return 1
+        stages.sort(key=stage_order)
+
     crop = crops[args.id]
+    before = copy.deepcopy(crop)
     changes = []
 
     if args.name is not None:
         crop["name"] = args.name
         changes.append(f"name={args.name}")
 
-    if args.start_month is not None:
-        crop["typical_start_month"] = args.start_month
-        changes.append(f"start_month={args.start_month}")
+    start_month = args.start_month
+    end_month = args.end_month
+
+    if start_month is not None:
+        crop["typical_start_month"] = start_month
+        changes.append(f"start_month={start_month}")
 
-    if args.end_month is not None:
-        crop["typical_end_month"] = args.end_month
-        changes.append(f"end_month={args.end_month}")
+    if end_month is not None:
+        crop["typical_end_month"] = end_month
+        changes.append(f"end_month={end_month}")
 
     # Update spans_new_year based on months
-    if args.start_month is not None or args.end_month is not None:
-        start = crop.get("typical_start_month", 1)
-        end = crop.get("typical_end_month", 12)
+    if start_month is not None or end_month is not None:
+        start = crop.get("typical_start_month", 1) if start_month is None else start_month
+        end = crop.get("typical_end_month", 12) if end_month is None else end_month
         crop["spans_new_year"] = start > end
 
-    if args.stages is not None:
-        try:
-            crop["stages"] = json.loads(args.stages)
-            changes.append("stages=updated")
-        except json.JSONDecodeError:
-            print(json.dumps({"error": "Invalid stages JSON format"}))
-            return 1
+    if stages is not None:
+        crop["stages"] = stages
+        changes.append("stages=updated")
 
     if args.color is not None:
         crop["color"] = args.color
         changes.append(f"color={args.color}")
 
+    if crop == before:
+        emit({
+            "success": True,
+            "crop_id": args.id,
+            "message": f"No changes to crop '{crop['name']}'"
+        })
+        return 0
+
     save_crops(crops_data)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "crop_id": args.id,
         "message": f"Updated crop '{crop['name']}'"
-    }))
+    })
     return 0
 
 
@@ -933,7 +1250,7 @@ def cmd_delete_crop(args: argparse.Namespace) -> int:
     crops = crops_data.get("crops", {})
 
     if args.id not in crops:
-        print(json.dumps({"error": f"Crop '{args.id}' not found"}))
+        emit({"error": f"Crop '{args.id}' not found"})
         return 1
 
     crop_name = crops[args.id].get("name", args.id)
@@ -941,11 +1258,11 @@ def cmd_delete_crop(args: argparse.Namespace) -> int:
 
     save_crops(crops_data)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "crop_id": args.id,
         "message": f"Deleted crop '{crop_name}'"
-    }))
+    })
     return 0
 
 
@@ -954,18 +1271,17 @@ def cmd_list_crops(args: argparse.Namespace) -> int:
     crops_data = load_crops()
     crops = crops_data.get("crops", {})
 
-    crop_list = []
-    for crop_id, crop in crops.items():
-        crop_list.append({
+    print_json_list("crops", (
+        {
             "id": crop_id,
             "name": crop.get("name", crop_id),
             "start_month": crop.get("typical_start_month"),
             "end_month": crop.get("typical_end_month"),
             "stage_count": len(crop.get("stages", [])),
             "color": crop.get("color", "#4caf50"),
-        })
-
-    print(json.dumps({"crops": crop_list}))
+        }
+        for crop_id, crop in crops.items()
+    ))
     return 0
 
 
@@ -975,7 +1291,7 @@ def cmd_add_crop_stage(args: argparse.Namespace) -> int:
     crops = crops_data.get("crops", {})
 
     if args.crop_id not in crops:
-        print(json.dumps({"error": f"Crop '{args.crop_id}' not found"}))
+        emit({"error": f"Crop '{args.crop_id}' not found"})
         return 1
 
     crop = crops[args.crop_id]
@@ -985,11 +1301,11 @@ def cmd_add_crop_stage(args: argparse.Namespace) -> int:
 
     # Check if stage already exists
     if any(s.get("id") == stage_id for s in stages):
-        print(json.dumps({"error": f"Stage '{stage_id}' already exists in crop"}))
+        emit({"error": f"Stage '{stage_id}' already exists in crop"})
         return 1
 
-    # Determine order
-    max_order = max([s.get("order", 0) for s in stages], default=0)
+    # Determine order (stored stages may predate sorting, so scan them all)
+    max_order = max(map(stage_order, stages), default=0)
     order = args.order if args.order else max_order + 1
 
     stages.append({
@@ -997,18 +1313,16 @@ def cmd_add_crop_stage(args: argparse.Namespace) -> int:
         "name": args.name,
         "order": order,
     })
-
-    # Sort stages by order
-    stages.sort(key=lambda s: s.get("order", 0))
+    stages.sort(key=stage_order)
 
     save_crops(crops_data)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "crop_id": args.crop_id,
         "stage_id": stage_id,
         "message": f"Added stage '{args.name}' to crop '{crop['name']}'"
-    }))
+    })
     return 0
 
 
@@ -1018,28 +1332,26 @@ def cmd_delete_crop_stage(args: argparse.Namespace) -> int:
     crops = crops_data.get("crops", {})
 
     if args.crop_id not in crops:
-        print(json.dumps({"error": f"Crop '{args.crop_id}' not found"}))
+        emit({"error": f"Crop '{args.crop_id}' not found"})
         return 1
 
     crop = crops[args.crop_id]
     stages = crop.get("stages", [])
 
     # Find and remove stage
-    stage_name = args.stage_id
-    original_len = len(stages)
-    stages[:] = [s for s in stages if s.get("id") != args.stage_id]
-
-    if len(stages) == original_len:
-        print(json.dumps({"error": f"Stage '{args.stage_id}' not found in crop"}))
+    index = next((i for i, s in enumerate(stages) if s.get("id") == args.stage_id), -1)
+    if index < 0:
+        emit({"error": f"Stage '{args.stage_id}' not found in crop"})
         return 1
+    stages.pop(index)
 
     save_crops(crops_data)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "crop_id": args.crop_id,
         "message": f"Deleted stage from crop '{crop['name']}'"
-    }))
+    })
     return 0
 
 
@@ -1052,22 +1364,21 @@ def cmd_init(args: argparse.Namespace) -> int:
     """Initialize the registry system."""
     config = load_config()
 
-    # Ensure directories exist
-    DATA_DIR.mkdir(parents=True, exist_ok=True)
-    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
-
     if config.get("initialized"):
-        print(json.dumps({
+        emit({
             "success": True,
             "message": "Registry already initialized",
             "paddock_count": len(config.get("paddocks", {})),
             "bay_count": len(config.get("bays", {})),
             "season_count": len(config.get("seasons", {})),
-        }))
+        })
         return 0
 
+    # Ensure directories exist (BACKUP_DIR lives under DATA_DIR)
+    BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+
     # Initialize
-    now = datetime.now().isoformat(timespec="seconds")
+    now = now_iso()
     config["initialized"] = True
     config["version"] = "1.0.0"
     config.setdefault("paddocks", {})
@@ -1079,10 +1390,10 @@ def cmd_init(args: argparse.Namespace) -> int:
 
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "message": "Farm Registry initialized",
-    }))
+    })
     return 0
 
 
@@ -1095,11 +1406,7 @@ def cmd_status(args: argparse.Namespace) -> int:
     seasons = config.get("seasons", {})
 
     # Get active season
-    active_season = None
-    for sid, s in seasons.items():
-        if s.get("active"):
-            active_season = sid
-            break
+    active_season = get_active_season_id(config)
 
     # Count backups
     backup_count = len(list(BACKUP_DIR.glob("*.json"))) if BACKUP_DIR.exists() else 0
@@ -1112,66 +1419,70 @@ def cmd_status(args: argparse.Namespace) -> int:
         "total_bays": len(bays),
         "total_seasons": len(seasons),
         "active_season": active_season,
-        "transaction_count": len(config.get("transactions", [])),
+        "transaction_count": len(config.get("transactions", [])) + count_archived_transactions(),
         "backup_count": backup_count,
         "created": config.get("created"),
         "modified": config.get("modified"),
     }
 
-    print(json.dumps(status))
+    emit(status)
     return 0
 
 
 def cmd_migrate_from_pwm(args: argparse.Namespace) -> int:
     """Migrate paddock/bay data from PWM to registry."""
     if not PWM_CONFIG_FILE.exists():
-        print(json.dumps({"error": "PWM config not found"}))
+        emit({"error": "PWM config not found"})
         return 1
 
     try:
-        pwm_data = json.loads(PWM_CONFIG_FILE.read_text(encoding="utf-8"))
+        pwm_data = read_json_file(PWM_CONFIG_FILE)
     except (json.JSONDecodeError, IOError) as e:
-        print(json.dumps({"error": f"Failed to read PWM config: {e}"}))
+        emit({"error": f"Failed to read PWM config: {e}"})
         return 1
 
     config = load_config()
 
     # Create backup before migration
     if CONFIG_FILE.exists():
-        create_backup("pre_migration")
+        create_backup("pre_migration", dedupe=True)
 
-    now = datetime.now().isoformat(timespec="seconds")
+    now = now_iso()
 
     # Migrate paddocks (extract registry-relevant fields only)
     pwm_paddocks = pwm_data.get("paddocks", {})
     registry_paddocks = config.setdefault("paddocks", {})
 
-    for pid, paddock in pwm_paddocks.items():
-        if pid not in registry_paddocks:
-            registry_paddocks[pid] = {
-                "farm_id": paddock.get("farm_id", "farm_1"),
-                "name": paddock.get("name", pid),
-                "bay_prefix": paddock.get("bay_prefix", "B-"),
-                "bay_count": paddock.get("bay_count", 0),
-                "current_season": paddock.get("current_season", True),
-                "created": paddock.get("created", now),
-                "modified": now,
-            }
+    registry_paddocks.update({
+        pid: {
+            "farm_id": paddock.get("farm_id", "farm_1"),
+            "name": paddock.get("name", pid),
+            "bay_prefix": paddock.get("bay_prefix", "B-"),
+            "bay_count": paddock.get("bay_count", 0),
+            "current_season": paddock.get("current_season", True),
+            "created": paddock.get("created", now),
+            "modified": now,
+        }
+        for pid, paddock in pwm_paddocks.items()
+        if pid not in registry_paddocks
+    })
 
     # Migrate bays (extract registry-relevant fields only)
     pwm_bays = pwm_data.get("bays", {})
     registry_bays = config.setdefault("bays", {})
 
-    for bid, bay in pwm_bays.items():
-        if bid not in registry_bays:
-            registry_bays[bid] = {
-                "paddock_id": bay.get("paddock_id", ""),
-                "name": bay.get("name", bid),
-                "order": bay.get("order", 0),
-                "is_last_bay": bay.get("is_last_bay", False),
-                "created": bay.get("created", now) if "created" in bay else now,
-                "modified": now,
-            }
+    registry_bays.update({
+        bid: {
+            "paddock_id": bay.get("paddock_id", ""),
+            "name": bay.get("name", bid),
+            "order": bay.get("order", 0),
+            "is_last_bay": bay.get("is_last_bay", False),
+            "created": bay.get("created", now),
+            "modified": now,
+        }
+        for bid, bay in pwm_bays.items()
+        if bid not in registry_bays
+    })
 
     config["initialized"] = True
     config["version"] = "1.0.0"
@@ -1185,28 +1496,28 @@ def cmd_migrate_from_pwm(args: argparse.Namespace) -> int:
     )
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "paddocks_migrated": len(pwm_paddocks),
         "bays_migrated": len(pwm_bays),
         "message": "Migration from PWM complete"
-    }))
+    })
     return 0
 
 
 def cmd_export(args: argparse.Namespace) -> int:
     """Export config to a timestamped backup."""
     if not CONFIG_FILE.exists():
-        print(json.dumps({"error": "No config file to export"}))
+        emit({"error": "No config file to export"})
         return 1
 
     backup_path = create_backup("export")
 
-    print(json.dumps({
+    emit({
         "success": True,
         "backup_file": str(backup_path.name),
         "message": f"Exported to {backup_path.name}"
-    }))
+    })
     return 0
 
 
@@ -1215,41 +1526,41 @@ def cmd_import_backup(args: argparse.Namespace) -> int:
     backup_path = BACKUP_DIR / args.filename
 
     if not backup_path.exists():
-        print(json.dumps({"error": f"Backup file '{args.filename}' not found"}))
+        emit({"error": f"Backup file '{args.filename}' not found"})
         return 1
 
     # Create pre-import backup
     if CONFIG_FILE.exists():
-        create_backup("pre_import")
+        create_backup("pre_import", dedupe=True)
 
     try:
-        backup_data = json.loads(backup_path.read_text(encoding="utf-8"))
+        backup_data = read_json_file(backup_path)
         # Validate structure
         if "paddocks" not in backup_data and "bays" not in backup_data:
-            print(json.dumps({"error": "Invalid backup file structure"}))
+            emit({"error": "Invalid backup file structure"})
             return 1
 
         save_config(backup_data)
 
-        print(json.dumps({
+        emit({
             "success": True,
             "message": f"Imported from {args.filename}",
             "paddock_count": len(backup_data.get("paddocks", {})),
             "bay_count": len(backup_data.get("bays", {})),
-        }))
+        })
         return 0
     except (json.JSONDecodeError, IOError) as e:
-        print(json.dumps({"error": f"Failed to import: {e}"}))
+        emit({"error": f"Failed to import: {e}"})
         return 1
 
 
 def cmd_reset(args: argparse.Namespace) -> int:
     """Reset the system (requires confirmation token)."""
     if args.token != "CONFIRM_RESET":
-        print(json.dumps({
+        emit({
             "error": "Reset requires --token CONFIRM_RESET",
             "message": "This will delete all paddock, bay, and season data!"
-        }))
+        })
         return 1
 
     # Create backup before reset
@@ -1257,7 +1568,7 @@ def cmd_reset(args: argparse.Namespace) -> int:
         create_backup("pre_reset")
 
     # Reset to empty state
-    now = datetime.now().isoformat(timespec="seconds")
+    now = now_iso()
     config = {
         "initialized": True,
         "paddocks": {},
@@ -1270,29 +1581,31 @@ def cmd_reset(args: argparse.Namespace) -> int:
     }
     save_config(config)
 
-    print(json.dumps({
+    emit({
         "success": True,
         "message": "Registry reset complete. All paddocks, bays, and seasons deleted."
-    }))
+    })
     return 0
 
 
 def cmd_backup_list(args: argparse.Namespace) -> int:
     """List available backup files."""
-    if not BACKUP_DIR.exists():
-        print(json.dumps({"backups": []}))
+    try:
+        with os.scandir(BACKUP_DIR) as it:
+            backups = [(e.name, e.stat()) for e in it if e.name.endswith(".json")]
+    except FileNotFoundError:
+        emit({"backups": []})
         return 0
 
-    backups = sorted(BACKUP_DIR.glob("*.json"), key=lambda p: p.stat().st_mtime, reverse=True)
-    backup_list = []
-    for b in backups[:20]:  # Last 20
-        backup_list.append({
-            "filename": b.name,
-            "size": b.stat().st_size,
-            "modified": datetime.fromtimestamp(b.stat().st_mtime).isoformat(timespec="seconds"),
-        })
-
-    print(json.dumps({"backups": backup_list}))
+    backups.sort(key=lambda b: b[1].st_mtime, reverse=True)
+    print_json_list("backups", (
+        {
+            "filename": name,
+            "size": st.st_size,
+            "modified": datetime.fromtimestamp(st.st_mtime).isoformat(timespec="seconds"),
+        }
+        for name, st in backups[:20]  # Last 20
+    ))
     return 0
 
 
@@ -1301,194 +1614,340 @@ def cmd_backup_list(args: argparse.Namespace) -> int:
 # =============================================================================
 
 
-def main() -> int:
-    parser = argparse.ArgumentParser(description="Farm Registry Backend")
-    subparsers = parser.add_subparsers(dest="command", help="Commands")
-
-    # Paddock commands
-    p_add = subparsers.add_parser("add_paddock", help="Add a new paddock")
-    p_add.add_argument("--farm", help="Farm ID (default: farm_1)")
-    p_add.add_argument("--name", required=True, help="Paddock name")
-    p_add.add_argument("--bay_prefix", default="B-", help="Bay prefix (e.g., B-)")
-    p_add.add_argument("--bay_count", type=int, required=True, help="Number of bays")
-    p_add.add_argument("--current_season", type=lambda x: x.lower() == "true",
-                       help="Is paddock in current season (true/false)")
-    p_add.add_argument("--brown_area", type=float, help="Brown area (total paddock) in hectares")
-    p_add.add_argument("--green_area", type=float, help="Green area (cropped/irrigated) in hectares")
-
-    p_edit = subparsers.add_parser("edit_paddock", help="Edit a paddock")
-    p_edit.add_argument("--id", required=True, help="Paddock ID")
-    p_edit.add_argument("--name", help="New name")
-    p_edit.add_argument("--farm", help="Farm ID")
-    p_edit.add_argument("--current_season", type=lambda x: x.lower() == "true",
-                        help="Is paddock in current season (true/false)")
-    p_edit.add_argument("--brown_area", type=float, help="Brown area (total paddock) in hectares")
-    p_edit.add_argument("--green_area", type=float, help="Green area (cropped/irrigated) in hectares")
-    # Crop rotation arguments
-    p_edit.add_argument("--crop_1_id", help="Crop 1 ID (early season)")
-    p_edit.add_argument("--crop_1_start", type=int, help="Crop 1 start month (1-12)")
-    p_edit.add_argument("--crop_1_end", type=int, help="Crop 1 end month (1-12)")
-    p_edit.add_argument("--crop_2_id", help="Crop 2 ID (late season)")
-    p_edit.add_argument("--crop_2_start", type=int, help="Crop 2 start month (1-12)")
-    p_edit.add_argument("--crop_2_end", type=int, help="Crop 2 end month (1-12)")
-
-    p_del = subparsers.add_parser("delete_paddock", help="Delete a paddock")
-    p_del.add_argument("--id", required=True, help="Paddock ID")
-
-    p_season = subparsers.add_parser("set_current_season", help="Set paddock current_season flag")
-    p_season.add_argument("--id", required=True, help="Paddock ID")
-    p_season.add_argument("--value", type=lambda x: x.lower() == "true",
-                          help="Current season value (true/false); omit to toggle")
-
-    # Bay commands
-    b_add = subparsers.add_parser("add_bay", help="Add a bay to a paddock")
-    b_add.add_argument("--paddock", required=True, help="Paddock ID")
-    b_add.add_argument("--name", required=True, help="Bay name")
-    b_add.add_argument("--order", type=int, help="Bay order")
-    b_add.add_argument("--is_last", action="store_true", help="Mark as last bay")
+def cmd_daemon(args: argparse.Namespace) -> int:
+    """Serve registry commands over a Unix socket until interrupted.
 
-    b_edit = subparsers.add_parser("edit_bay", help="Edit bay info")
-    b_edit.add_argument("--id", required=True, help="Bay ID")
-    b_edit.add_argument("--name", help="New name")
-    b_edit.add_argument("--order", type=int, help="New order")
-    b_edit.add_argument("--is_last", type=lambda x: x.lower() == "true", help="Is last bay (true/false)")
+    Each connection sends one JSON line {"argv": [...]} and receives one JSON
+    line {"rc": int, "output": str, "stderr": str} with the command's printed
+    output. Refuses to start if another daemon is already answering.
+    """
+    global _deferred_writes
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        probe.settimeout(DAEMON_IO_TIMEOUT)
+        try:
+            probe.connect(str(SOCKET_FILE))
+        except (ConnectionRefusedError, FileNotFoundError):
+            SOCKET_FILE.unlink(missing_ok=True)  # Stale socket from a dead daemon
+        else:
+            emit({"error": f"Registry daemon already running on {SOCKET_FILE}"})
+            return 1
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as server:
+        server.bind(str(SOCKET_FILE))
+        server.listen()
+        try:
+            while True:
+                conn, _ = server.accept()
+                conn.settimeout(DAEMON_IO_TIMEOUT)
+                try:
+                    with conn, conn.makefile("rwb") as stream:
+                        line = stream.readline()
+                        if not line:
+                            continue  # Liveness probe from another daemon start
+                        output = io.StringIO()
+                        errors = io.StringIO()
+                        with contextlib.redirect_stdout(output), contextlib.redirect_stderr(errors):
+                            try:
+                                request = json.loads(line)
+                                rc = run_command(request["argv"])
+                            except SystemExit as e:
+                                rc = e.code if isinstance(e.code, int) else 1
+                            except Exception as e:  # keep serving after a bad request
+                                # The command may have mutated cached dicts before failing
+                                _json_cache.clear()
+                                _deferred_writes = None
+                                emit({"error": f"Daemon error: {e}"})
+                                rc = 1
+                        response = {
+                            "rc": rc,
+                            "output": output.getvalue(),
+                            "stderr": errors.getvalue(),
+                        }
+                        stream.write(json.dumps(response).encode("utf-8") + b"\n")
+                except OSError:
+                    pass  # Client went away or timed out
+        except KeyboardInterrupt:
+            pass
+        finally:
+            SOCKET_FILE.unlink(missing_ok=True)
+    return 0
 
-    b_del = subparsers.add_parser("delete_bay", help="Delete a bay")
-    b_del.add_argument("--id", required=True, help="Bay ID")
 
-    # Season commands
-    s_add = subparsers.add_parser("add_season", help="Add a season")
-    s_add.add_argument("--name", required=True, help="Season name (e.g., CY26)")
-    s_add.add_argument("--start", required=True, help="Start date (YYYY-MM-DD)")
-    s_add.add_argument("--end", required=True, help="End date (YYYY-MM-DD)")
-    s_add.add_argument("--active", action="store_true", help="Set as active season")
+def proxy_to_daemon(argv: list[str]) -> int | None:
+    """Run a command on the daemon. Returns None if no daemon is listening."""
+    if not SOCKET_FILE.exists():
+        return None
 
-    s_edit = subparsers.add_parser("edit_season", help="Edit a season")
-    s_edit.add_argument("--id", required=True, help="Season ID")
-    s_edit.add_argument("--name", help="New name")
-    s_edit.add_argument("--start", help="New start date")
-    s_edit.add_argument("--end", help="New end date")
+    client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    client.settimeout(DAEMON_REQUEST_TIMEOUT)
+    try:
+        client.connect(str(SOCKET_FILE))
+    except TimeoutError as e:  # Daemon is alive but not accepting; don't run alongside it
+        client.close()
+        emit({"error": f"Daemon request failed: {e}"})
+        return 1
+    except OSError:
+        client.close()
+        return None
 
-    s_del = subparsers.add_parser("delete_season", help="Delete a season")
-    s_del.add_argument("--id", required=True, help="Season ID")
+    # Once connected, never fall back: the daemon may already have run the command
+    try:
+        with client, client.makefile("rwb") as stream:
+            stream.write(json.dumps({"argv": argv}).encode("utf-8") + b"\n")
+            stream.flush()
+            response = json.loads(stream.readline())
+    except (OSError, ValueError) as e:
+        emit({"error": f"Daemon request failed: {e}"})
+        return 1
 
-    s_active = subparsers.add_parser("set_active_season", help="Set active season")
-    s_active.add_argument("--id", required=True, help="Season ID")
+    sys.stdout.write(response.get("output", ""))
+    sys.stderr.write(response.get("stderr", ""))
+    return response.get("rc", 1)
 
-    # Farm commands
-    f_add = subparsers.add_parser("add_farm", help="Add a new farm")
-    f_add.add_argument("--name", required=True, help="Farm name")
-    f_add.add_argument("--business", help="Business ID to assign farm to")
 
-    f_edit = subparsers.add_parser("edit_farm", help="Edit a farm")
-    f_edit.add_argument("--id", required=True, help="Farm ID")
-    f_edit.add_argument("--name", help="New name")
-    f_edit.add_argument("--business", help="Business ID (use empty string to clear)")
+def parse_bool(value: str) -> bool:
+    """Parse a true/false command-line value."""
+    return value.lower() == "true"
 
-    f_del = subparsers.add_parser("delete_farm", help="Delete a farm")
-    f_del.add_argument("--id", required=True, help="Farm ID")
 
+# Command name -> (help, [(flag, add_argument options), ...])
+SUBCOMMANDS: dict[str, tuple[str, list[tuple[str, dict[str, Any]]]]] = {
+    # Paddock commands
+    "add_paddock": ("Add a new paddock", [
+        ("--farm", {"help": "Farm ID (default: farm_1)"}),
+        ("--name", {"required": True, "help": "Paddock name"}),
+        ("--bay_prefix", {"default": "B-", "help": "Bay prefix (e.g., B-)"}),
+        ("--bay_count", {"type": int, "required": True, "help": "Number of bays"}),
+        ("--current_season", {"type": parse_bool, "help": "Is paddock in current season (true/false)"}),
+        ("--brown_area", {"type": float, "help": "Brown area (total paddock) in hectares"}),
+        ("--green_area", {"type": float, "help": "Green area (cropped/irrigated) in hectares"}),
+    ]),
+    "edit_paddock": ("Edit a paddock", [
+        ("--id", {"required": True, "help": "Paddock ID"}),
+        ("--name", {"help": "New name"}),
+        ("--farm", {"help": "Farm ID"}),
+        ("--current_season", {"type": parse_bool, "help": "Is paddock in current season (true/false)"}),
+        ("--brown_area", {"type": float, "help": "Brown area (total paddock) in hectares"}),
+        ("--green_area", {"type": float, "help": "Green area (cropped/irrigated) in hectares"}),
+        # Crop rotation arguments
+        ("--crop_1_id", {"help": "Crop 1 ID (early season)"}),
+        ("--crop_1_start", {"type": int, "help": "Crop 1 start month (1-12)"}),
+        ("--crop_1_end", {"type": int, "help": "Crop 1 end month (1-12)"}),
+        ("--crop_2_id", {"help": "Crop 2 ID (late season)"}),
+        ("--crop_2_start", {"type": int, "help": "Crop 2 start month (1-12)"}),
+        ("--crop_2_end", {"type": int, "help": "Crop 2 end month (1-12)"}),
+    ]),
+    "delete_paddock": ("Delete a paddock", [
+        ("--id", {"required": True, "help": "Paddock ID"}),
+    ]),
+    "set_current_season": ("Set paddock current_season flag", [
+        ("--id", {"required": True, "help": "Paddock ID"}),
+        ("--value", {"type": parse_bool, "help": "Current season value (true/false); omit to toggle"}),
+    ]),
+    # Bay commands
+    "add_bay": ("Add a bay to a paddock", [
+        ("--paddock", {"required": True, "help": "Paddock ID"}),
+        ("--name", {"required": True, "help": "Bay name"}),
+        ("--order", {"type": int, "help": "Bay order"}),
+        ("--is_last", {"action": "store_true", "help": "Mark as last bay"}),
+    ]),
+    "edit_bay": ("Edit bay info", [
+        ("--id", {"required": True, "help": "Bay ID"}),
+        ("--name", {"help": "New name"}),
+        ("--order", {"type": int, "help": "New order"}),
+        ("--is_last", {"type": parse_bool, "help": "Is last bay (true/false)"}),
+    ]),
+    "delete_bay": ("Delete a bay", [
+        ("--id", {"required": True, "help": "Bay ID"}),
+    ]),
+    # Season commands
+    "add_season": ("Add a season", [
+        ("--name", {"required": True, "help": "Season name (e.g., CY26)"}),
+        ("--start", {"required": True, "help": "Start date (YYYY-MM-DD)"}),
+        ("--end", {"required": True, "help": "End date (YYYY-MM-DD)"}),
+        ("--active", {"action": "store_true", "help": "Set as active season"}),
+    ]),
+    "edit_season": ("Edit a season", [
+        ("--id", {"required": True, "help": "Season ID"}),
+        ("--name", {"help": "New name"}),
+        ("--start", {"help": "New start date"}),
+        ("--end", {"help": "New end date"}),
+    ]),
+    "delete_season": ("Delete a season", [
+        ("--id", {"required": True, "help": "Season ID"}),
+    ]),
+    "set_active_season": ("Set active season", [
+        ("--id", {"required": True, "help": "Season ID"}),
+    ]),
+    # Farm commands
+    "add_farm": ("Add a new farm", [
+        ("--name", {"required": True, "help": "Farm name"}),
+        ("--business", {"help": "Business ID to assign farm to"}),
+    ]),
+    "edit_farm": ("Edit a farm", [
+        ("--id", {"required": True, "help": "Farm ID"}),
+        ("--name", {"help": "New name"}),
+        ("--business", {"help": "Business ID (use empty string to clear)"}),
+    ]),
+    "delete_farm": ("Delete a farm", [
+        ("--id", {"required": True, "help": "Farm ID"}),
+    ]),
     # Business commands
-    b_add = subparsers.add_parser("add_business", help="Add a new business")
-    b_add.add_argument("--name", required=True, help="Business name")
-
-    b_edit = subparsers.add_parser("edit_business", help="Edit a business")
-    b_edit.add_argument("--id", required=True, help="Business ID")
-    b_edit.add_argument("--name", help="New name")
-
-    b_del = subparsers.add_parser("delete_business", help="Delete a business")
-    b_del.add_argument("--id", required=True, help="Business ID")
-
+    "add_business": ("Add a new business", [
+        ("--name", {"required": True, "help": "Business name"}),
+    ]),
+    "edit_business": ("Edit a business", [
+        ("--id", {"required": True, "help": "Business ID"}),
+        ("--name", {"help": "New name"}),
+    ]),
+    "delete_business": ("Delete a business", [
+        ("--id", {"required": True, "help": "Business ID"}),
+    ]),
     # Crop commands
-    c_add = subparsers.add_parser("add_crop", help="Add a new crop type")
-    c_add.add_argument("--name", required=True, help="Crop name")
-    c_add.add_argument("--start_month", type=int, help="Typical start month (1-12)")
-    c_add.add_argument("--end_month", type=int, help="Typical end month (1-12)")
-    c_add.add_argument("--stages", help="JSON array of stages")
-    c_add.add_argument("--color", help="Hex color code")
-
-    c_edit = subparsers.add_parser("edit_crop", help="Edit a crop type")
-    c_edit.add_argument("--id", required=True, help="Crop ID")
-    c_edit.add_argument("--name", help="New name")
-    c_edit.add_argument("--start_month", type=int, help="Typical start month (1-12)")
-    c_edit.add_argument("--end_month", type=int, help="Typical end month (1-12)")
-    c_edit.add_argument("--stages", help="JSON array of stages")
-    c_edit.add_argument("--color", help="Hex color code")
-
-    c_del = subparsers.add_parser("delete_crop", help="Delete a crop type")
-    c_del.add_argument("--id", required=True, help="Crop ID")
-
-    subparsers.add_parser("list_crops", help="List all crop types")
-
-    cs_add = subparsers.add_parser("add_crop_stage", help="Add a stage to a crop")
-    cs_add.add_argument("--crop_id", required=True, help="Crop ID")
-    cs_add.add_argument("--name", required=True, help="Stage name")
-    cs_add.add_argument("--order", type=int, help="Stage order")
-
-    cs_del = subparsers.add_parser("delete_crop_stage", help="Delete a stage from a crop")
-    cs_del.add_argument("--crop_id", required=True, help="Crop ID")
-    cs_del.add_argument("--stage_id", required=True, help="Stage ID")
-
+    "add_crop": ("Add a new crop type", [
+        ("--name", {"required": True, "help": "Crop name"}),
+        ("--start_month", {"type": int, "help": "Typical start month (1-12)"}),
+        ("--end_month", {"type": int, "help": "Typical end month (1-12)"}),
+        ("--stages", {"help": "JSON array of stages"}),
+        ("--color", {"help": "Hex color code"}),
+    ]),
+    "edit_crop": ("Edit a crop type", [
+        ("--id", {"required": True, "help": "Crop ID"}),
+        ("--name", {"help": "New name"}),
+        ("--start_month", {"type": int, "help": "Typical start month (1-12)"}),
+        ("--end_month", {"type": int, "help": "Typical end month (1-12)"}),
+        ("--stages", {"help": "JSON array of stages"}),
+        ("--color", {"help": "Hex color code"}),
+    ]),
+    "delete_crop": ("Delete a crop type", [
+        ("--id", {"required": True, "help": "Crop ID"}),
+    ]),
+    "list_crops": ("List all crop types", []),
+    "add_crop_stage": ("Add a stage to a crop", [
+        ("--crop_id", {"required": True, "help": "Crop ID"}),
+        ("--name", {"required": True, "help": "Stage name"}),
+        ("--order", {"type": int, "help": "Stage order"}),
+    ]),
+    "delete_crop_stage": ("Delete a stage from a crop", [
+        ("--crop_id", {"required": True, "help": "Crop ID"}),
+        ("--stage_id", {"required": True, "help": "Stage ID"}),
+    ]),
     # System commands
-    subparsers.add_parser("init", help="Initialize the system")
-    subparsers.add_parser("status", help="Get system status")
-    subparsers.add_parser("export", help="Export to backup")
-    subparsers.add_parser("migrate_from_pwm", help="Migrate data from PWM config")
-
-    p_import = subparsers.add_parser("import_backup", help="Import from backup")
-    p_import.add_argument("--filename", required=True, help="Backup filename")
-
-    p_reset = subparsers.add_parser("reset", help="Reset system (destructive)")
-    p_reset.add_argument("--token", required=True, help="Confirmation token")
-
-    subparsers.add_parser("backup_list", help="List backup files")
+    "init": ("Initialize the system", []),
+    "status": ("Get system status", []),
+    "export": ("Export to backup", []),
+    "migrate_from_pwm": ("Migrate data from PWM config", []),
+    "import_backup": ("Import from backup", [
+        ("--filename", {"required": True, "help": "Backup filename"}),
+    ]),
+    "reset": ("Reset system (destructive)", [
+        ("--token", {"required": True, "help": "Confirmation token"}),
+    ]),
+    "backup_list": ("List backup files", []),
+    "daemon": ("Serve commands over a Unix socket", []),
+}
+
+
+def build_parser(command: str | None = None) -> argparse.ArgumentParser:
+    """Build the command-line parser.
+
+    When command is known only its subparser is registered, since building
+    all of them costs more than most commands do. Unknown commands and
+    top-level --help get the full parser.
+    """
+    parser = argparse.ArgumentParser(description="Farm Registry Backend")
+    subparsers = parser.add_subparsers(dest="command", help="Commands")
 
-    args = parser.parse_args()
+    names = [command] if command in SUBCOMMANDS else list(SUBCOMMANDS)
+    for name in names:
+        help_text, arguments = SUBCOMMANDS[name]
+        subparser = subparsers.add_parser(name, help=help_text)
+        for flag, options in arguments:
+            subparser.add_argument(flag, **options)
+
+    return parser
+
+
+# Command name -> handler, built once at import
+COMMANDS: dict[str, Callable[[argparse.Namespace], int]] = {
+    "add_paddock": cmd_add_paddock,
+    "edit_paddock": cmd_edit_paddock,
+    "delete_paddock": cmd_delete_paddock,
+    "set_current_season": cmd_set_current_season,
+    "add_bay": cmd_add_bay,
+    "edit_bay": cmd_edit_bay,
+    "delete_bay": cmd_delete_bay,
+    "add_season": cmd_add_season,
+    "edit_season": cmd_edit_season,
+    "delete_season": cmd_delete_season,
+    "set_active_season": cmd_set_active_season,
+    "add_farm": cmd_add_farm,
+    "edit_farm": cmd_edit_farm,
+    "delete_farm": cmd_delete_farm,
+    "add_business": cmd_add_business,
+    "edit_business": cmd_edit_business,
+    "delete_business": cmd_delete_business,
+    "add_crop": cmd_add_crop,
+    "edit_crop": cmd_edit_crop,
+    "delete_crop": cmd_delete_crop,
+    "list_crops": cmd_list_crops,
+    "add_crop_stage": cmd_add_crop_stage,
+    "delete_crop_stage": cmd_delete_crop_stage,
+    "init": cmd_init,
+    "status": cmd_status,
+    "migrate_from_pwm": cmd_migrate_from_pwm,
+    "export": cmd_export,
+    "import_backup": cmd_import_backup,
+    "reset": cmd_reset,
+    "backup_list": cmd_backup_list,
+    "daemon": cmd_daemon,
+}
+
+
+def run_command(argv: list[str]) -> int:
+    """Parse argv and run the matching command in-process."""
+    global _command_now
+    _command_now = None
+    parser = build_parser(argv[0] if argv else None)
+    args = parser.parse_args(argv)
 
     if not args.command:
         parser.print_help()
         return 1
 
-    commands = {
-        "add_paddock": cmd_add_paddock,
-        "edit_paddock": cmd_edit_paddock,
-        "delete_paddock": cmd_delete_paddock,
-        "set_current_season": cmd_set_current_season,
-        "add_bay": cmd_add_bay,
-        "edit_bay": cmd_edit_bay,
-        "delete_bay": cmd_delete_bay,
-        "add_season": cmd_add_season,
-        "edit_season": cmd_edit_season,
-        "delete_season": cmd_delete_season,
-        "set_active_season": cmd_set_active_season,
-        "add_farm": cmd_add_farm,
-        "edit_farm": cmd_edit_farm,
-        "delete_farm": cmd_delete_farm,
-        "add_business": cmd_add_business,
-        "edit_business": cmd_edit_business,
-        "delete_business": cmd_delete_business,
-        "add_crop": cmd_add_crop,
-        "edit_crop": cmd_edit_crop,
-        "delete_crop": cmd_delete_crop,
-        "list_crops": cmd_list_crops,
-        "add_crop_stage": cmd_add_crop_stage,
-        "delete_crop_stage": cmd_delete_crop_stage,
-        "init": cmd_init,
-        "status": cmd_status,
-        "migrate_from_pwm": cmd_migrate_from_pwm,
-        "export": cmd_export,
-        "import_backup": cmd_import_backup,
-        "reset": cmd_reset,
-        "backup_list": cmd_backup_list,
-    }
-
-    cmd_func = commands.get(args.command)
+    cmd_func = COMMANDS.get(args.command)
     if cmd_func:
         return cmd_func(args)
 
-    print(json.dumps({"error": f"Unknown command: {args.command}"}))
+    emit({"error": f"Unknown command: {args.command}"})
     return 1
 
 
+def run_many(commands: list[list[str]]) -> int:
+    """Run several commands against one in-memory config, writing once at the end.
+
+    Returns the highest exit code of the individual commands.
+    """
+    global _deferred_writes
+    _deferred_writes = {}
+    rc = 0
+    try:
+        for argv in commands:
+            rc = max(rc, run_command(argv))
+    finally:
+        pending, _deferred_writes = _deferred_writes, None
+        for path, data in pending.items():
+            store_json_file(path, data)
+    return rc
+
+
+def main() -> int:
+    argv = sys.argv[1:]
+    if argv[:1] != ["daemon"]:
+        rc = proxy_to_daemon(argv)
+        if rc is not None:
+            return rc
+    return run_command(argv)
+
+
 if __name__ == "__main__":
     sys.exit(main())
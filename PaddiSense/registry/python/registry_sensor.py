@@ -14,15 +14,38 @@ Output includes:
   - bays: Bay configurations from registry
   - seasons: Season definitions with active season
   - status: System status information
+
+Usage:
+    python3 registry_sensor.py                             # Full output
+    python3 registry_sensor.py --fields total_farms,farms  # Only these keys
+
+--fields skips building sections that weren't asked for (hierarchy, current
+crops, dropdown name lists, backup count). "status" is always included.
 """
 
+import argparse
+import functools
 import json
+import os
+import pickle
 import sys
+from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 # Paths
 DATA_DIR = Path("/config/local_data/registry")
 CONFIG_FILE = DATA_DIR / "config.json"
@@ -30,47 +53,90 @@ CROPS_FILE = DATA_DIR / "crops.json"
 BACKUP_DIR = DATA_DIR / "backups"
 SERVER_YAML = Path("/config/server.yaml")
 VERSION_FILE = Path("/config/PaddiSense/registry/VERSION")
+CACHE_DIR = DATA_DIR / ".cache"
 
 
+@functools.lru_cache(maxsize=None)
 def get_version() -> str:
     """Read module version from VERSION file."""
     try:
-        if VERSION_FILE.exists():
-            return VERSION_FILE.read_text(encoding="utf-8").strip()
-    except IOError:
+        return VERSION_FILE.read_bytes().decode("utf-8").strip()
+    except (IOError, UnicodeDecodeError):
+        return "unknown"
+
+
+def _cached_load(path: Path, parser: Callable[[bytes], Any]) -> Any:
+    """
+    Parse a source file, reusing a pickled copy while the source is unchanged.
+
+    The cache lives in CACHE_DIR and is keyed on the source's mtime, inode and size
+    (the backend replaces files atomically, so every save gets a new inode).
+    Missing files and parse errors propagate to the caller like a plain read.
+    """
+    st = path.stat()
+    key = (st.st_mtime_ns, st.st_ino, st.st_size)
+    cache = CACHE_DIR / f"{path.name}.pickle"
+    try:
+        cached_key, data = pickle.loads(cache.read_bytes())
+        if cached_key == key:
+            return data
+    except Exception:
+        pass  # Missing, stale or corrupt cache - reparse below
+
+    data = parser(path.read_bytes())
+    try:
+        # No parents=True: the sensor never creates the registry data dir
+        CACHE_DIR.mkdir(exist_ok=True)
+        tmp = cache.with_suffix(".tmp")
+        tmp.write_bytes(pickle.dumps((key, data), protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp, cache)
+    except OSError:
         pass
-    return "unknown"
+    return data
 
 
-def load_config() -> dict[str, Any]:
-    """Load registry config from JSON file."""
-    if not CONFIG_FILE.exists():
-        return {
-            "initialized": False,
-            "paddocks": {},
-            "bays": {},
-            "seasons": {},
-            "version": "1.0.0",
-        }
+def json_loads(content: bytes) -> Any:
+    """Parse JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def parse_yaml(content: bytes) -> Any:
+    """Parse YAML with the libyaml-backed safe loader when available."""
+    return yaml.load(content, Loader=YamlLoader)
+
+
+def default_config() -> dict[str, Any]:
+    """Return the config used when config.json is missing or unreadable."""
+    return {
+        "initialized": False,
+        "paddocks": {},
+        "bays": {},
+        "seasons": {},
+        "version": "1.0.0",
+    }
+
+
+def load_config() -> tuple[dict[str, Any], bool]:
+    """
+    Load registry config from JSON file.
+
+    Returns the config and whether config.json exists, so callers don't
+    need a separate stat to report config_ok.
+    """
     try:
-        return json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, IOError):
-        return {
-            "initialized": False,
-            "paddocks": {},
-            "bays": {},
-            "seasons": {},
-            "version": "1.0.0",
-        }
+        return _cached_load(CONFIG_FILE, json_loads), True
+    except FileNotFoundError:
+        return default_config(), False
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError):
+        return default_config(), True
 
 
 def load_server_yaml() -> dict[str, Any]:
     """Load server.yaml for grower and farm definitions."""
-    if not SERVER_YAML.exists():
-        return {}
     try:
-        content = SERVER_YAML.read_text(encoding="utf-8")
-        return yaml.safe_load(content) or {}
+        return _cached_load(SERVER_YAML, parse_yaml) or {}
     except (yaml.YAMLError, IOError):
         return {}
 
@@ -91,42 +157,24 @@ def extract_farms(server_config: dict[str, Any], registry_farms: dict[str, Any])
     Priority: config.json farms override server.yaml farms if same ID.
     This allows editing farms via UI while preserving backward compatibility.
     """
-    # Start with farms from server.yaml (pwm.farms or registry.farms)
-    pwm_config = server_config.get("pwm", {})
-    server_farms = dict(pwm_config.get("farms", {}))
-
-    # Check for dedicated registry.farms section in server.yaml
-    registry_config = server_config.get("registry", {})
-    if "farms" in registry_config:
-        server_farms.update(registry_config.get("farms", {}))
-
-    # Merge in farms from config.json (these take precedence)
-    # This allows farms to be edited via the UI
-    merged = dict(server_farms)
-    for farm_id, farm_data in registry_farms.items():
-        merged[farm_id] = farm_data
-
-    return merged
+    # Later sources win: pwm.farms < registry.farms (server.yaml) < config.json
+    return {
+        **(server_config.get("pwm", {}).get("farms") or {}),
+        **(server_config.get("registry", {}).get("farms") or {}),
+        **registry_farms,
+    }
 
 
 def get_active_season(seasons: dict[str, Any]) -> str | None:
     """Get the ID of the active season, if any."""
-    for season_id, season in seasons.items():
-        if season.get("active", False):
-            return season_id
-    return None
+    return next((sid for sid, season in seasons.items() if season.get("active", False)), None)
 
 
 def load_crops() -> dict[str, Any]:
     """Load crops config from JSON file."""
-    if not CROPS_FILE.exists():
-        return {
-            "version": "1.0.0",
-            "crops": {},
-        }
     try:
-        return json.loads(CROPS_FILE.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, IOError):
+        return _cached_load(CROPS_FILE, json_loads)
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError):
         return {
             "version": "1.0.0",
             "crops": {},
@@ -143,93 +191,129 @@ def is_in_month_range(current_month: int, start_month: int, end_month: int) -> b
         return current_month >= start_month or current_month <= end_month
 
 
-def get_current_crop_for_paddock(paddock: dict, current_month: int) -> dict | None:
-    """Determine the current crop for a paddock based on today's month."""
+@functools.lru_cache(maxsize=None)
+def month_mask(start_month: int, end_month: int) -> int:
+    """Return a 12-bit mask with bit (month - 1) set for each month in the range."""
+    return sum(
+        1 << (month - 1)
+        for month in range(1, 13)
+        if is_in_month_range(month, start_month, end_month)
+    )
+
+
+def get_current_crop_for_paddock(paddock: dict, month_bit: int) -> dict | None:
+    """
+    Determine the current crop for a paddock.
+
+    month_bit is 1 << (current_month - 1), tested against each crop's month mask.
+    """
     crop_1 = paddock.get("crop_1", {})
     crop_2 = paddock.get("crop_2", {})
 
     # Check if today falls in crop_1 range
     if crop_1 and crop_1.get("crop_id"):
-        start = crop_1.get("start_month", 1)
-        end = crop_1.get("end_month", 12)
-        if is_in_month_range(current_month, start, end):
+        if month_mask(crop_1.get("start_month", 1), crop_1.get("end_month", 12)) & month_bit:
             return crop_1
 
     # Check if today falls in crop_2 range
     if crop_2 and crop_2.get("crop_id"):
-        start = crop_2.get("start_month", 1)
-        end = crop_2.get("end_month", 12)
-        if is_in_month_range(current_month, start, end):
+        if month_mask(crop_2.get("start_month", 1), crop_2.get("end_month", 12)) & month_bit:
             return crop_2
 
     return None
 
 
-def build_current_crops(
+def current_crop_info(current: dict | None, crops: dict[str, Any]) -> dict[str, Any] | None:
+    """Describe a paddock's current crop slot using the crop type definitions."""
+    if not current:
+        return None
+    crop_id = current.get("crop_id")
+    crop_data = crops.get(crop_id, {})
+    return {
+        "crop_id": crop_id,
+        "crop_name": crop_data.get("name", crop_id),
+        "crop_color": crop_data.get("color", "#4caf50"),
+        "stages": crop_data.get("stages", []),
+    }
+
+
+def build_paddock_views(
+    farms: dict[str, Any],
     paddocks: dict[str, Any],
+    bays: dict[str, Any],
     crops: dict[str, Any],
     current_month: int
-) -> dict[str, Any]:
-    """Build a mapping of paddock_id to current crop info."""
-    current_crops = {}
+) -> tuple[dict[str, Any], dict[str, Any]]:
+    """
+    Build the hierarchy summary for the UI and the paddock_id -> current crop mapping.
+
+    Bays are bucketed by paddock first; paddocks are then walked once to fill
+    both views.
+    """
+    bays_by_paddock: dict[str, list[dict[str, Any]]] = {}
+    for bid, b in bays.items():
+        bays_by_paddock.setdefault(b.get("paddock_id"), []).append(
+            {"id": bid, "name": b.get("name"), "order": b.get("order", 0)}
+        )
+
+    order_key = itemgetter("order")
+    month_bit = 1 << (current_month - 1)
+    paddocks_by_farm: dict[str, dict[str, Any]] = {}
+    current_crops: dict[str, Any] = {}
 
     for pid, paddock in paddocks.items():
-        current = get_current_crop_for_paddock(paddock, current_month)
-        if current:
-            crop_id = current.get("crop_id")
-            crop_data = crops.get(crop_id, {})
-            current_crops[pid] = {
-                "crop_id": crop_id,
-                "crop_name": crop_data.get("name", crop_id),
-                "crop_color": crop_data.get("color", "#4caf50"),
-                "stages": crop_data.get("stages", []),
-            }
-        else:
-            current_crops[pid] = None
-
-    return current_crops
-
-
-def build_hierarchy_summary(
-    farms: dict[str, Any],
-    paddocks: dict[str, Any],
-    bays: dict[str, Any]
-) -> dict[str, Any]:
-    """Build a hierarchical summary for the UI."""
-    hierarchy = {}
-
-    for farm_id, farm in farms.items():
-        farm_paddocks = {
-            pid: p for pid, p in paddocks.items()
-            if p.get("farm_id") == farm_id
+        paddock_bays = bays_by_paddock.get(pid, [])
+        paddocks_by_farm.setdefault(paddock.get("farm_id"), {})[pid] = {
+            "name": paddock.get("name", pid),
+            "bay_count": len(paddock_bays),
+            "bays": sorted(paddock_bays, key=order_key),
         }
+        current_crops[pid] = current_crop_info(
+            get_current_crop_for_paddock(paddock, month_bit), crops
+        )
 
-        paddock_data = {}
-        for pid, paddock in farm_paddocks.items():
-            paddock_bays = [
-                {"id": bid, "name": b.get("name"), "order": b.get("order", 0)}
-                for bid, b in bays.items()
-                if b.get("paddock_id") == pid
-            ]
-            paddock_bays.sort(key=lambda x: x["order"])
-
-            paddock_data[pid] = {
-                "name": paddock.get("name", pid),
-                "bay_count": len(paddock_bays),
-                "bays": paddock_bays,
-            }
-
-        hierarchy[farm_id] = {
+    hierarchy = {
+        farm_id: {
             "name": farm.get("name", farm_id),
             "paddock_count": len(farm_paddocks),
-            "paddocks": paddock_data,
+            "paddocks": farm_paddocks,
         }
+        for farm_id, farm in farms.items()
+        for farm_paddocks in [paddocks_by_farm.get(farm_id, {})]
+    }
+    return hierarchy, current_crops
+
+
+def sorted_names(items: dict[str, Any]) -> list[str]:
+    """Return the sorted display names of a collection, falling back to the ID."""
+    return sorted(item.get("name", item_id) for item_id, item in items.items())
+
 
-    return hierarchy
+def count_backups() -> int:
+    """Count backup files without stat'ing each entry."""
+    try:
+        with os.scandir(BACKUP_DIR) as entries:
+            return sum(
+                1 for e in entries
+                if e.name.endswith(".json") and not e.name.startswith(".")
+            )
+    except FileNotFoundError:
+        return 0
 
 
 def main() -> int:
-    config = load_config()
+    parser = argparse.ArgumentParser(description="Farm Registry sensor output")
+    parser.add_argument(
+        "--fields",
+        help="Comma-separated output keys to include (default: all)",
+    )
+    args = parser.parse_args()
+    fields = set(args.fields.split(",")) | {"status"} if args.fields else None
+
+    def wanted(key: str) -> bool:
+        return fields is None or key in fields
+
+    config, config_ok = load_config()
     server = load_server_yaml()
     crops_data = load_crops()
 
@@ -245,33 +329,35 @@ def main() -> int:
 
     # System status
     initialized = config.get("initialized", False)
-    config_ok = CONFIG_FILE.exists()
 
     # Active season
     active_season = get_active_season(seasons)
 
     # Build lists for dropdowns
-    business_names = sorted([b.get("name", bid) for bid, b in businesses.items()])
-    farm_names = sorted([f.get("name", fid) for fid, f in farms.items()])
-    paddock_names = sorted([p.get("name", pid) for pid, p in paddocks.items()])
-    season_names = sorted([s.get("name", sid) for sid, s in seasons.items()])
-    crop_names = sorted([c.get("name", cid) for cid, c in crops.items()])
-
-    # Build hierarchy
-    hierarchy = build_hierarchy_summary(farms, paddocks, bays)
-
-    # Build current crops mapping (paddock_id -> current crop info)
-    from datetime import datetime
+    business_names, farm_names, paddock_names, season_names, crop_names = (
+        sorted_names(items) if wanted(f"{kind}_names") else None
+        for kind, items in (
+            ("business", businesses),
+            ("farm", farms),
+            ("paddock", paddocks),
+            ("season", seasons),
+            ("crop", crops),
+        )
+    )
+
+    # Build hierarchy and current crops mapping (paddock_id -> current crop info)
     current_month = datetime.now().month
-    current_crops = build_current_crops(paddocks, crops, current_month)
+    hierarchy = current_crops = None
+    if wanted("hierarchy") or wanted("current_crops"):
+        hierarchy, current_crops = build_paddock_views(
+            farms, paddocks, bays, crops, current_month
+        )
 
     # Count backups
-    backup_count = 0
-    if BACKUP_DIR.exists():
-        backup_count = len(list(BACKUP_DIR.glob("*.json")))
+    backup_count = count_backups() if wanted("backup_count") else None
 
     # Get version
-    version = get_version()
+    version = get_version() if wanted("version") else None
 
     # Check which modules are enabled
     modules = server.get("modules", {})
@@ -323,8 +409,15 @@ def main() -> int:
         # Enabled modules (for conditional UI)
         "modules": modules,
     }
+    if fields is not None:
+        output = {key: value for key, value in output.items() if key in fields}
 
-    print(json.dumps(output, ensure_ascii=False))
+    if orjson is not None:
+        # server.yaml sections may carry non-string keys (e.g. numeric IDs)
+        sys.stdout.buffer.write(orjson.dumps(output, option=orjson.OPT_NON_STR_KEYS) + b"\n")
+    else:
+        json.dump(output, sys.stdout, ensure_ascii=False, separators=(",", ":"))
+        sys.stdout.write("\n")
     return 0
 
 
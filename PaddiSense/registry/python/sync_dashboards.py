@@ -17,24 +17,46 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
-import re
+import os
+import string
 import sys
 from pathlib import Path
 
+import yaml
+
+try:
+    from yaml import CSafeLoader as YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as YamlLoader  # type: ignore[assignment]
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 # Paths
 CONFIG_DIR = Path("/config")
 PADDISENSE_DIR = CONFIG_DIR / "PaddiSense"
 MODULES_JSON = PADDISENSE_DIR / "modules.json"
 LOVELACE_FILE = CONFIG_DIR / "lovelace_dashboards.yaml"
+SYNC_HASH_FILE = CONFIG_DIR / ".lovelace_sync.hash"
+
+# Characters allowed in a top-level dashboard slug and in an entry property key
+SLUG_CHARS = frozenset(string.ascii_letters + string.digits + "_-")
+PROPERTY_KEY_CHARS = frozenset(string.ascii_letters + "_")
 
 
 def load_modules_json() -> dict:
     """Load modules.json."""
     try:
         if MODULES_JSON.exists():
-            return json.loads(MODULES_JSON.read_text(encoding="utf-8"))
-    except (json.JSONDecodeError, IOError) as e:
+            content = MODULES_JSON.read_bytes()
+            if orjson is not None:
+                return orjson.loads(content)
+            return json.loads(content)
+    except (json.JSONDecodeError, UnicodeDecodeError, IOError) as e:
         print(f"Error loading modules.json: {e}", file=sys.stderr)
     return {"modules": {}}
 
@@ -46,13 +68,24 @@ def is_module_installed(module_id: str) -> bool:
     return package_file.exists()
 
 
+def list_module_dirs() -> set[str]:
+    """List the directory names under PADDISENSE_DIR with a single readdir."""
+    try:
+        with os.scandir(PADDISENSE_DIR) as entries:
+            return {e.name for e in entries if e.is_dir()}
+    except OSError:
+        return set()
+
+
 def get_installed_modules(modules_data: dict) -> list[dict]:
     """Get list of installed modules with their dashboard info."""
     installed = []
     all_modules = modules_data.get("modules", {})
+    module_dirs = list_module_dirs()
 
     for module_id, module_info in all_modules.items():
-        if not is_module_installed(module_id):
+        # Only stat package.yaml for modules whose folder is present
+        if module_id not in module_dirs or not is_module_installed(module_id):
             continue
 
         # Check if module has dashboard config
@@ -79,70 +112,157 @@ def get_installed_modules(modules_data: dict) -> list[dict]:
     return installed
 
 
-def parse_lovelace_yaml() -> tuple[list[str], dict[str, dict]]:
+def is_header_line(line: str) -> bool:
+    """Check if a line belongs to the comment header (comment or blank)."""
+    return line.startswith("#") or line.strip() == ""
+
+
+def scan_lovelace_lines(lines: list[str]) -> tuple[list[str], dict[str, dict]]:
     """
-    Parse existing lovelace_dashboards.yaml.
+    Line-based fallback for lovelace_dashboards.yaml that libyaml can't parse.
     Returns (header_lines, dashboards_dict).
     """
     header_lines = []
     dashboards = {}
 
+    current_slug = None
+    current_entry = {}
+
+    for line in lines:
+        # Header comments at the start
+        if not dashboards and not current_slug:
+            if is_header_line(line):
+                header_lines.append(line)
+                continue
+
+        # Dashboard entry start (no leading whitespace, ends with :)
+        if line.endswith(":") and len(line) > 1 and SLUG_CHARS.issuperset(line[:-1]):
+            # Save previous entry
+            if current_slug:
+                dashboards[current_slug] = current_entry
+
+            current_slug = line[:-1]
+            current_entry = {"_raw_lines": [line]}
+            continue
+
+        # Property within dashboard entry
+        if current_slug and line.startswith("  "):
+            current_entry["_raw_lines"].append(line)
+            # Parse key: value
+            key, sep, value = line[2:].partition(":")
+            if sep and key and PROPERTY_KEY_CHARS.issuperset(key):
+                value = value.strip()
+                # Handle quoted strings
+                if value.startswith('"') and value.endswith('"'):
+                    value = value[1:-1]
+                elif value.startswith("'") and value.endswith("'"):
+                    value = value[1:-1]
+                # Handle booleans
+                if value.lower() == "true":
+                    value = True
+                elif value.lower() == "false":
+                    value = False
+                current_entry[key] = value
+
+    # Save last entry
+    if current_slug:
+        dashboards[current_slug] = current_entry
+
+    return header_lines, dashboards
+
+
+def parse_lovelace_yaml() -> tuple[list[str], dict[str, dict]]:
+    """
+    Parse existing lovelace_dashboards.yaml.
+    Returns (header_lines, dashboards_dict).
+
+    The file is parsed by libyaml; each top-level entry keeps its original
+    source lines in "_raw_lines" (located via the node marks) so preserved
+    dashboards are written back exactly as the user wrote them.
+    """
+    header_lines: list[str] = []
+    dashboards: dict[str, dict] = {}
+
     if not LOVELACE_FILE.exists():
         return header_lines, dashboards
 
     try:
         content = LOVELACE_FILE.read_text(encoding="utf-8")
-        lines = content.splitlines()
-
-        current_slug = None
-        current_entry = {}
-
-        for line in lines:
-            # Header comments at the start
-            if not dashboards and not current_slug:
-                if line.startswith("#") or line.strip() == "":
-                    header_lines.append(line)
-                    continue
-
-            # Dashboard entry start (no leading whitespace, ends with :)
-            match = re.match(r"^([a-zA-Z0-9_-]+):$", line)
-            if match:
-                # Save previous entry
-                if current_slug:
-                    dashboards[current_slug] = current_entry
-
-                current_slug = match.group(1)
-                current_entry = {"_raw_lines": [line]}
-                continue
+    except IOError:
+        return header_lines, dashboards
+
+    lines = content.splitlines()
+    loader = YamlLoader(content)
+    try:
+        root = loader.get_single_node()
+        data = loader.construct_document(root) if root is not None else {}
+    except yaml.YAMLError:
+        return scan_lovelace_lines(lines)
+    finally:
+        loader.dispose()
+
+    if root is None:
+        # Empty or comment-only file
+        return [line for line in lines if is_header_line(line)], dashboards
+    if not isinstance(root, yaml.MappingNode):
+        return scan_lovelace_lines(lines)
+
+    starts = [key_node.start_mark.line for key_node, _ in root.value]
+    header_end = starts[0] if starts else len(lines)
+    header_lines = [line for line in lines[:header_end] if is_header_line(line)]
+
+    for index, (key_node, _) in enumerate(root.value):
+        start = starts[index]
+        end = starts[index + 1] if index + 1 < len(starts) else len(lines)
+        # Entry body is its indented lines; top-level comments/blanks are dropped
+        raw_lines = [lines[start]] + [line for line in lines[start + 1:end] if line.startswith("  ")]
+
+        value = data.get(key_node.value) if isinstance(data, dict) else None
+        entry = dict(value) if isinstance(value, dict) else {}
+        entry["_raw_lines"] = raw_lines
+        dashboards[key_node.value] = entry
+
+    return header_lines, dashboards
+
+
+def write_file_atomic(path: Path, content: bytes) -> None:
+    """Write content to a temp file and rename it over path, so readers never see a torn file."""
+    target = path.resolve()  # Keep a symlinked lovelace file a symlink
+    tmp = target.with_name(target.name + ".tmp")
+    with open(tmp, "wb") as f:
+        f.write(content)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, target)
+
+
+def sync_state_hash(expected_slugs: set[str]) -> str | None:
+    """Hash the expected dashboard slugs together with the lovelace file's mtime and size."""
+    try:
+        st = LOVELACE_FILE.stat()
+    except OSError:
+        return None
+    key = "\n".join(sorted(expected_slugs)) + f"\n{st.st_mtime_ns}:{st.st_size}"
+    return hashlib.sha256(key.encode("utf-8")).hexdigest()
 
-            # Property within dashboard entry
-            if current_slug and line.startswith("  "):
-                current_entry["_raw_lines"].append(line)
-                # Parse key: value
-                prop_match = re.match(r"^  ([a-zA-Z_]+):\s*(.*)$", line)
-                if prop_match:
-                    key = prop_match.group(1)
-                    value = prop_match.group(2).strip()
-                    # Handle quoted strings
-                    if value.startswith('"') and value.endswith('"'):
-                        value = value[1:-1]
-                    elif value.startswith("'") and value.endswith("'"):
-                        value = value[1:-1]
-                    # Handle booleans
-                    if value.lower() == "true":
-                        value = True
-                    elif value.lower() == "false":
-                        value = False
-                    current_entry[key] = value
-
-        # Save last entry
-        if current_slug:
-            dashboards[current_slug] = current_entry
 
+def read_sync_hash() -> str | None:
+    """Read the hash recorded by the last sync that left every dashboard registered."""
+    try:
+        return SYNC_HASH_FILE.read_text(encoding="utf-8").strip()
     except IOError:
-        pass
+        return None
 
-    return header_lines, dashboards
+
+def write_sync_hash(expected_slugs: set[str]) -> None:
+    """Record that the lovelace file currently has every expected dashboard."""
+    state_hash = sync_state_hash(expected_slugs)
+    if state_hash is None:
+        return
+    try:
+        SYNC_HASH_FILE.write_text(state_hash, encoding="utf-8")
+    except IOError:
+        pass
 
 
 def generate_dashboard_entry(mod: dict) -> list[str]:
@@ -170,11 +290,19 @@ def sync_dashboards(check_only: bool = False, json_output: bool = False) -> int:
 
     installed.sort(key=sort_key)
 
+    # Build expected slug set
+    expected_slugs = {m["slug"] for m in installed}
+
+    # Nothing changed since the last complete sync - skip parsing the file
+    if not json_output:
+        state_hash = sync_state_hash(expected_slugs)
+        if state_hash is not None and state_hash == read_sync_hash():
+            print("All module dashboards are registered.")
+            return 0
+
     # Parse existing file
     header_lines, existing_dashboards = parse_lovelace_yaml()
 
-    # Build expected slug set
-    expected_slugs = {m["slug"] for m in installed}
     current_slugs = set(existing_dashboards.keys())
 
     missing = expected_slugs - current_slugs
@@ -188,10 +316,14 @@ def sync_dashboards(check_only: bool = False, json_output: bool = False) -> int:
             "current_dashboards": sorted(current_slugs),
             "missing": sorted(missing),
         }
-        print(json.dumps(result, ensure_ascii=False))
+        if orjson is not None:
+            sys.stdout.buffer.write(orjson.dumps(result) + b"\n")
+        else:
+            print(json.dumps(result, ensure_ascii=False, separators=(",", ":")))
         return 0 if not missing else 1
 
     if not missing:
+        write_sync_hash(expected_slugs)
         print("All module dashboards are registered.")
         return 0
 
@@ -231,8 +363,8 @@ def sync_dashboards(check_only: bool = False, json_output: bool = False) -> int:
 
     # Write file
     try:
-        content = "\n".join(output_lines) + "\n"
-        LOVELACE_FILE.write_text(content, encoding="utf-8")
+        write_file_atomic(LOVELACE_FILE, ("\n".join(output_lines) + "\n").encode("utf-8"))
+        write_sync_hash(expected_slugs)
         print(f"\nUpdated {LOVELACE_FILE}")
         print(f"Added: {', '.join(sorted(missing))}")
         return 0
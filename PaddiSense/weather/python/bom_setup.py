@@ -20,7 +20,10 @@ import json
 import os
 import sys
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # HA internal API (accessed from within the container)
 HA_URL = os.environ.get("HA_URL", "http://supervisor/core")
@@ -38,8 +41,21 @@ HEADERS = {
     "Content-Type": "application/json",
 }
 
+# One keep-alive session for every supervisor call, so the flow steps share a
+# connection. Retry only covers connection errors and idempotent GETs by default,
+# so config-flow POSTs are never replayed.
+SESSION = requests.Session()
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=4,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504]),
+)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
 # All observation sensor keys (from const.py)
-ALL_OBSERVATION_SENSORS = [
+ALL_OBSERVATION_SENSORS = (
     "temp",
     "temp_feels_like",
     "max_temp",
@@ -52,10 +68,10 @@ ALL_OBSERVATION_SENSORS = [
     "gust_speed_kilometre",
     "gust_speed_knot",
     "dew_point",
-]
+)
 
 # All forecast sensor keys
-ALL_FORECAST_SENSORS = [
+ALL_FORECAST_SENSORS = (
     "temp_max",
     "temp_min",
     "extended_text",
@@ -78,10 +94,11 @@ ALL_FORECAST_SENSORS = [
     "now_temp_later",
     "astronomical_sunrise_time",
     "astronomical_sunset_time",
-]
+)
 
-# Essential sensors for PaddiSense
-ESSENTIAL_OBSERVATION_SENSORS = [
+# Essential sensors for PaddiSense (filtered from the full lists to keep their order;
+# the check below fails loudly if an essential key is missing from a full list)
+_ESSENTIAL_OBSERVATIONS = frozenset({
     "temp",
     "temp_feels_like",
     "humidity",
@@ -90,9 +107,9 @@ ESSENTIAL_OBSERVATION_SENSORS = [
     "wind_direction",
     "rain_since_9am",
     "dew_point",
-]
+})
 
-ESSENTIAL_FORECAST_SENSORS = [
+_ESSENTIAL_FORECASTS = frozenset({
     "temp_max",
     "temp_min",
     "rain_amount_min",
@@ -101,15 +118,24 @@ ESSENTIAL_FORECAST_SENSORS = [
     "icon_descriptor",
     "short_text",
     "uv_category",
-]
+})
+
+for _essential, _all in (
+    (_ESSENTIAL_OBSERVATIONS, ALL_OBSERVATION_SENSORS),
+    (_ESSENTIAL_FORECASTS, ALL_FORECAST_SENSORS),
+):
+    if not _essential <= set(_all):
+        raise ValueError(f"Essential BOM sensors not in the full list: {sorted(_essential - set(_all))}")
+
+ESSENTIAL_OBSERVATION_SENSORS = tuple(k for k in ALL_OBSERVATION_SENSORS if k in _ESSENTIAL_OBSERVATIONS)
+ESSENTIAL_FORECAST_SENSORS = tuple(k for k in ALL_FORECAST_SENSORS if k in _ESSENTIAL_FORECASTS)
 
 
 def check_bom_configured():
     """Check if BOM integration is already configured."""
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{HA_URL}/api/config/config_entries/entry",
-            headers=HEADERS,
             timeout=10
         )
         response.raise_for_status()
@@ -131,9 +157,8 @@ def check_bom_configured():
 def get_ha_location():
     """Get Home Assistant's configured location."""
     try:
-        response = requests.get(
+        response = SESSION.get(
             f"{HA_URL}/api/config",
-            headers=HEADERS,
             timeout=10
         )
         response.raise_for_status()
@@ -151,9 +176,8 @@ def get_ha_location():
 def start_config_flow():
     """Start a new config flow for BOM."""
     try:
-        response = requests.post(
+        response = SESSION.post(
             f"{HA_URL}/api/config/config_entries/flow",
-            headers=HEADERS,
             json={"handler": "bureau_of_meteorology"},
             timeout=30
         )
@@ -170,9 +194,8 @@ def start_config_flow():
 
 def submit_flow_step(flow_id, user_input):
     """Submit data to a config flow step."""
-    response = requests.post(
+    response = SESSION.post(
         f"{HA_URL}/api/config/config_entries/flow/{flow_id}",
-        headers=HEADERS,
         json=user_input,
         timeout=60
     )
@@ -192,16 +215,20 @@ def setup_bom(
     print("Starting BOM Integration Setup...")
     print("-" * 40)
 
-    # Check if already configured
-    status = check_bom_configured()
+    # Check if already configured and look up the HA location at the same time;
+    # the two GETs are independent and share the session's connection pool
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        status_future = executor.submit(check_bom_configured)
+        location_future = executor.submit(get_ha_location)
+        status = status_future.result()
+        location = location_future.result()
+
     if status.get("configured"):
         print(f"BOM already configured: {status.get('title')}")
         print(f"Entry ID: {status.get('entry_id')}")
         print("To reconfigure, delete the existing integration first.")
         return {"success": False, "reason": "already_configured", "details": status}
 
-    # Get HA location
-    location = get_ha_location()
     print(f"Using location: {location['latitude']}, {location['longitude']}")
 
     # Select sensors
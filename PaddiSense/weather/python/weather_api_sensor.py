@@ -19,6 +19,10 @@ Outputs ONE JSON payload for Home Assistant command_line sensor:
 Config:
   /config/local_data/weather_api/config.json
 
+Cache (reused for ECOWITT_CACHE_TTL seconds):
+  /config/local_data/weather_api/cache/<imei>.json   Ecowitt response per station
+  /config/local_data/weather_api/cache/last.json     Full payload (+ last.sig inputs hash)
+
 Secrets expected in /config/secrets.yaml:
   ecowitt_app_key: "..."
   ecowitt_api_key: "..."
@@ -26,19 +30,40 @@ Secrets expected in /config/secrets.yaml:
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import json
+import os
+import re
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 CONFIG_DIR = Path("/config/local_data/weather_api")
 CONFIG_FILE = CONFIG_DIR / "config.json"
+CACHE_DIR = CONFIG_DIR / "cache"
+PAYLOAD_CACHE_FILE = CACHE_DIR / "last.json"
+PAYLOAD_SIG_FILE = CACHE_DIR / "last.sig"
 SECRETS_FILE = Path("/config/secrets.yaml")
 VERSION_FILE = Path("/config/PaddiSense/weather/VERSION")
 
 VALID_SLOTS = ["1", "2", "3", "4"]
 
+# The two Ecowitt credentials in secrets.yaml, one "key: value" line each
+SECRETS_REGEX = re.compile(r"^[ \t]*(ecowitt_app_key|ecowitt_api_key)[ \t]*:(.*)$", re.MULTILINE)
+
+# Ecowitt data only refreshes every few minutes; reuse a response for this long
+ECOWITT_CACHE_TTL = 60
 
+
+@functools.lru_cache(maxsize=1)
 def get_version() -> str:
     """Read module version from VERSION file."""
     try:
@@ -49,6 +74,27 @@ def get_version() -> str:
     return "unknown"
 
 
+def json_loads(data: bytes | str):
+    """Parse JSON text or bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj)
+
+
+def json_dumps_bytes(obj) -> bytes:
+    """Serialize to UTF-8 JSON bytes, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj).encode("utf-8")
+
+
 def utc_now_iso() -> str:
     return datetime.now(timezone.utc).isoformat()
 
@@ -57,11 +103,12 @@ def load_config() -> dict:
     if not CONFIG_FILE.exists():
         return {"stations": {}, "created": None, "modified": None}
     try:
-        return json.loads(CONFIG_FILE.read_text(encoding="utf-8"))
+        return json_loads(CONFIG_FILE.read_bytes())
     except Exception:
         return {"stations": {}, "created": None, "modified": None}
 
 
+@functools.lru_cache(maxsize=1)
 def read_secrets_keys() -> tuple[str | None, str | None]:
     """
     Lightweight parse of secrets.yaml without requiring PyYAML.
@@ -70,27 +117,15 @@ def read_secrets_keys() -> tuple[str | None, str | None]:
     if not SECRETS_FILE.exists():
         return None, None
 
-    app_key = None
-    api_key = None
+    keys: dict[str, str] = {}
 
     try:
-        for raw in SECRETS_FILE.read_text(encoding="utf-8").splitlines():
-            line = raw.strip()
-            if not line or line.startswith("#"):
-                continue
-            if ":" not in line:
-                continue
-
-            k, v = line.split(":", 1)
-            k = k.strip()
+        for k, v in SECRETS_REGEX.findall(SECRETS_FILE.read_text(encoding="utf-8")):
             v = v.strip().strip('"').strip("'")
+            if v:
+                keys[k] = v
 
-            if k == "ecowitt_app_key" and v:
-                app_key = v
-            if k == "ecowitt_api_key" and v:
-                api_key = v
-
-        return app_key, api_key
+        return keys.get("ecowitt_app_key"), keys.get("ecowitt_api_key")
     except Exception:
         return None, None
 
@@ -158,15 +193,45 @@ def base_station_payload(slot: str, cfg: dict) -> dict:
     return payload
 
 
-def try_fetch_ecowitt(station: dict, app_key: str, api_key: str) -> tuple[bool, dict]:
+# Payload for an unconfigured slot. Only ever serialized, never mutated, so slots
+# can share its nested (all-None) blocks.
+EMPTY_SLOT_TEMPLATE = base_station_payload("", {})
+
+
+ECOWITT_DEVICE_INFO_URL = "https://api.ecowitt.net/api/v3/device/info"
+
+
+def read_cached_response(imei_str: str) -> dict | None:
+    """Return the cached /device/info response for a station if it is younger than the TTL."""
+    cache_file = CACHE_DIR / f"{imei_str}.json"
+    try:
+        if cache_file.stat().st_mtime <= time.time() - ECOWITT_CACHE_TTL:
+            return None
+        return json_loads(cache_file.read_bytes())
+    except Exception:
+        return None
+
+
+def write_cached_response(imei_str: str, data: dict) -> None:
+    """Atomically store a successful /device/info response for a station."""
+    cache_file = CACHE_DIR / f"{imei_str}.json"
+    tmp = cache_file.with_suffix(".tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json_dumps(data), encoding="utf-8")
+        os.replace(tmp, cache_file)
+    except Exception:
+        pass
+
+
+async def try_fetch_ecowitt(session, station: dict, app_key: str, api_key: str) -> tuple[bool, dict]:
     """
     Fetch weather data from Ecowitt API using /device/info endpoint.
+    Uses the shared aiohttp session so all stations reuse one connection pool.
+    A response younger than ECOWITT_CACHE_TTL is served from CACHE_DIR instead.
     Returns (success, data_dict) tuple.
     """
-    try:
-        import requests  # type: ignore
-    except Exception:
-        return False, {}
+    import aiohttp  # type: ignore
 
     imei = station.get("imei")
     if not imei:
@@ -177,8 +242,11 @@ def try_fetch_ecowitt(station: dict, app_key: str, api_key: str) -> tuple[bool,
     if not imei_str.startswith("00"):
         imei_str = "00" + imei_str
 
+    cached = read_cached_response(imei_str)
+    if cached is not None:
+        return True, cached
+
     # Use /device/info endpoint with imei parameter
-    url = "https://api.ecowitt.net/api/v3/device/info"
     params = {
         "application_key": app_key,
         "api_key": api_key,
@@ -186,119 +254,210 @@ def try_fetch_ecowitt(station: dict, app_key: str, api_key: str) -> tuple[bool,
     }
 
     try:
-        r = requests.get(url, params=params, timeout=12)
-        if r.status_code != 200:
+        async with session.get(
+            ECOWITT_DEVICE_INFO_URL, params=params, timeout=aiohttp.ClientTimeout(total=12)
+        ) as r:
+            if r.status != 200:
+                return False, {}
+            body = await r.read()
+        if not body:
             return False, {}
-        data = r.json() if r.text else {}
+        data = json_loads(body)
         # Check for API error
         if data.get("code") != 0:
             return False, {}
+        write_cached_response(imei_str, data)
         return True, data
     except Exception:
         return False, {}
 
 
+async def fetch_all_ecowitt(stations: list[dict], app_key: str, api_key: str) -> list[tuple[bool, dict]]:
+    """Fetch every station concurrently over one session; results follow input order."""
+    try:
+        import aiohttp  # type: ignore
+    except Exception:
+        return [(False, {}) for _ in stations]
+
+    async with aiohttp.ClientSession() as session:
+        return await asyncio.gather(
+            *(try_fetch_ecowitt(session, st, app_key, api_key) for st in stations)
+        )
+
+
+def f_to_c(f: float) -> float:
+    """Fahrenheit to Celsius."""
+    return round((f - 32) * 5 / 9, 1)
+
+
+def mph_to_kmh(mph: float) -> float:
+    """Miles per hour to km/h."""
+    return round(mph * 1.60934, 1)
+
+
+def in_to_mm(inches: float) -> float:
+    """Inches to millimeters."""
+    return round(inches * 25.4, 1)
+
+
+def inhg_to_hpa(inhg: float) -> float:
+    """Inches of mercury to hectopascals."""
+    return round(inhg * 33.8639, 1)
+
+
+# Ecowitt group -> fields read from it, as
+# (payload group or None for top level, payload key, Ecowitt field, converter)
+ECOWITT_FIELD_MAP = (
+    # Outdoor (temperatures in °F → °C)
+    ("outdoor", (
+        ("outdoor", "temperature", "temperature", f_to_c),
+        ("outdoor", "humidity", "humidity", None),
+        ("outdoor", "feels_like", "feels_like", f_to_c),
+        ("outdoor", "dew_point", "dew_point", f_to_c),
+    )),
+    # Wind (mph → km/h, direction in degrees stays as-is)
+    ("wind", (
+        ("wind", "speed", "wind_speed", mph_to_kmh),
+        ("wind", "gust", "wind_gust", mph_to_kmh),
+        ("wind", "direction", "wind_direction", None),
+    )),
+    # Rain (inches → mm)
+    ("rainfall", (
+        ("rain", "rate", "rain_rate", in_to_mm),
+        ("rain", "hourly", "1_hour", in_to_mm),
+        ("rain", "daily", "daily", in_to_mm),
+        ("rain", "monthly", "monthly", in_to_mm),
+        ("rain", "yearly", "yearly", in_to_mm),
+    )),
+    # Solar / UV (W/m² stays as-is, UV index stays as-is)
+    ("solar_and_uvi", (
+        ("solar", "radiation", "solar", None),
+        ("solar", "uv_index", "uvi", None),
+    )),
+    # Pressure (inHg → hPa)
+    ("pressure", (
+        ("pressure", "relative", "relative", inhg_to_hpa),
+        ("pressure", "absolute", "absolute", inhg_to_hpa),
+    )),
+    # Battery (console battery %)
+    ("battery", (
+        (None, "battery", "ws6006_console", None),
+    )),
+)
+
+
+def get_value(group: dict, field: str) -> float | None:
+    """Extract group[field]["value"] as a float, or None if missing or not numeric."""
+    try:
+        return float(group[field]["value"])
+    except (KeyError, TypeError, ValueError):
+        return None
+
+
 def map_ecowitt_to_station(station_payload: dict, api_json: dict) -> None:
     """
     Map Ecowitt /device/info response to our stable structure.
     Data is in api_json["data"]["last_update"], with values nested as field["value"].
     Applies unit conversions: F→C, mph→km/h, in→mm, inHg→hPa.
     """
-    data = api_json.get("data") if isinstance(api_json, dict) else None
-    if not isinstance(data, dict):
-        return
-
-    src = data.get("last_update") if isinstance(data, dict) else None
-    if not isinstance(src, dict):
+    try:
+        src = api_json["data"]["last_update"]
+    except (KeyError, TypeError):
         return
 
-    def get_value(d: dict, *keys) -> float | None:
-        """Navigate nested keys and extract 'value' field."""
-        cur = d
-        for k in keys:
-            if not isinstance(cur, dict) or k not in cur:
-                return None
-            cur = cur[k]
-        if isinstance(cur, dict) and "value" in cur:
-            try:
-                return float(cur["value"])
-            except (ValueError, TypeError):
-                return None
-        return None
+    # Look each Ecowitt group up once, then read its fields
+    for src_group, fields in ECOWITT_FIELD_MAP:
+        try:
+            group = src[src_group]
+        except (KeyError, TypeError):
+            continue  # Payload fields already default to None
 
-    def f_to_c(f: float | None) -> float | None:
-        """Fahrenheit to Celsius."""
-        return round((f - 32) * 5 / 9, 1) if f is not None else None
+        for dest_group, dest_key, src_field, convert in fields:
+            value = get_value(group, src_field)
+            if convert is not None and value is not None:
+                value = convert(value)
+            target = station_payload if dest_group is None else station_payload[dest_group]
+            target[dest_key] = value
 
-    def mph_to_kmh(mph: float | None) -> float | None:
-        """Miles per hour to km/h."""
-        return round(mph * 1.60934, 1) if mph is not None else None
 
-    def in_to_mm(inches: float | None) -> float | None:
-        """Inches to millimeters."""
-        return round(inches * 25.4, 1) if inches is not None else None
+def payload_signature(app_key: str | None, api_key: str | None) -> str:
+    """Hash config.json together with the credentials that shape the payload."""
+    h = hashlib.blake2b(digest_size=8)
+    try:
+        h.update(CONFIG_FILE.read_bytes())
+    except OSError:
+        h.update(b"\0missing")
+    h.update(f"\0{app_key}\0{api_key}".encode("utf-8"))
+    return h.hexdigest()
 
-    def inhg_to_hpa(inhg: float | None) -> float | None:
-        """Inches of mercury to hectopascals."""
-        return round(inhg * 33.8639, 1) if inhg is not None else None
 
-    # Outdoor (temperatures in °F → °C)
-    station_payload["outdoor"]["temperature"] = f_to_c(get_value(src, "outdoor", "temperature"))
-    station_payload["outdoor"]["humidity"] = get_value(src, "outdoor", "humidity")
-    station_payload["outdoor"]["feels_like"] = f_to_c(get_value(src, "outdoor", "feels_like"))
-    station_payload["outdoor"]["dew_point"] = f_to_c(get_value(src, "outdoor", "dew_point"))
+def read_cached_payload(signature: str) -> bytes | None:
+    """Return the last full payload if it was built from the same inputs within the TTL."""
+    try:
+        if PAYLOAD_SIG_FILE.read_text(encoding="utf-8") != signature:
+            return None
+        if PAYLOAD_CACHE_FILE.stat().st_mtime <= time.time() - ECOWITT_CACHE_TTL:
+            return None
+        return PAYLOAD_CACHE_FILE.read_bytes()
+    except Exception:
+        return None
 
-    # Wind (mph → km/h, direction in degrees stays as-is)
-    station_payload["wind"]["speed"] = mph_to_kmh(get_value(src, "wind", "wind_speed"))
-    station_payload["wind"]["gust"] = mph_to_kmh(get_value(src, "wind", "wind_gust"))
-    station_payload["wind"]["direction"] = get_value(src, "wind", "wind_direction")
 
-    # Rain (inches → mm)
-    station_payload["rain"]["rate"] = in_to_mm(get_value(src, "rainfall", "rain_rate"))
-    station_payload["rain"]["hourly"] = in_to_mm(get_value(src, "rainfall", "1_hour"))
-    station_payload["rain"]["daily"] = in_to_mm(get_value(src, "rainfall", "daily"))
-    station_payload["rain"]["monthly"] = in_to_mm(get_value(src, "rainfall", "monthly"))
-    station_payload["rain"]["yearly"] = in_to_mm(get_value(src, "rainfall", "yearly"))
-
-    # Solar / UV (W/m² stays as-is, UV index stays as-is)
-    station_payload["solar"]["radiation"] = get_value(src, "solar_and_uvi", "solar")
-    station_payload["solar"]["uv_index"] = get_value(src, "solar_and_uvi", "uvi")
+def write_cached_payload(signature: str, output: bytes) -> None:
+    """Store the full payload and the signature of the inputs it was built from."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        for path, content in ((PAYLOAD_CACHE_FILE, output), (PAYLOAD_SIG_FILE, signature.encode("utf-8"))):
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(content)
+            os.replace(tmp, path)
+    except Exception:
+        pass
 
-    # Pressure (inHg → hPa)
-    station_payload["pressure"]["relative"] = inhg_to_hpa(get_value(src, "pressure", "relative"))
-    station_payload["pressure"]["absolute"] = inhg_to_hpa(get_value(src, "pressure", "absolute"))
 
-    # Battery (console battery %)
-    station_payload["battery"] = get_value(src, "battery", "ws6006_console")
+def main() -> int:
+    app_key, api_key = read_secrets_keys()
+    credentials_ok = bool(app_key and api_key)
 
+    # Same config and credentials as a payload built moments ago - reuse it
+    signature = payload_signature(app_key, api_key)
+    cached = read_cached_payload(signature)
+    if cached is not None:
+        sys.stdout.buffer.write(cached + b"\n")
+        return 0
 
-def main() -> int:
     config = load_config()
     initialized = CONFIG_FILE.exists()
 
-    app_key, api_key = read_secrets_keys()
-    credentials_ok = bool(app_key and api_key)
-
     stations_cfg = (config.get("stations") or {}) if isinstance(config, dict) else {}
     stations_out: dict[str, dict] = {}
 
+    to_fetch: list[dict] = []
+
     # Build stable output
     for slot in VALID_SLOTS:
         cfg = stations_cfg.get(slot) if isinstance(stations_cfg, dict) else None
-        if not isinstance(cfg, dict):
-            cfg = {}
+        if not isinstance(cfg, dict) or not cfg:
+            # Unconfigured slot: same keys as a real station, nested blocks shared
+            stations_out[slot] = EMPTY_SLOT_TEMPLATE | {"slot": slot}
+            continue
         st = base_station_payload(slot, cfg)
 
         configured = bool(st.get("name"))
         if configured and st["enabled"] and credentials_ok:
-            ok, api_json = try_fetch_ecowitt(st, app_key, api_key)  # uses st["imei"]
+            to_fetch.append(st)
+
+        stations_out[slot] = st
+
+    # Fetch enabled stations concurrently (uses st["imei"])
+    if to_fetch:
+        results = asyncio.run(fetch_all_ecowitt(to_fetch, app_key, api_key))
+        for st, (ok, api_json) in zip(to_fetch, results):
             st["connected"] = bool(ok)
-            if ok and isinstance(api_json, dict):
+            if ok:
                 map_ecowitt_to_station(st, api_json)
                 st["updated"] = utc_now_iso()
 
-        stations_out[slot] = st
-
     station_count = sum(1 for s in stations_out.values() if s.get("enabled") and s.get("name"))
 
     status = "ready"
@@ -317,7 +476,12 @@ def main() -> int:
         "stations": stations_out,
     }
 
-    print(json.dumps(payload))
+    output = json_dumps_bytes(payload)
+    # Only cache when every fetched station answered, so failures retry next poll
+    if all(st["connected"] for st in to_fetch):
+        write_cached_payload(signature, output)
+
+    sys.stdout.buffer.write(output + b"\n")
     return 0
 
 
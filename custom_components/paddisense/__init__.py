@@ -1,15 +1,24 @@
 """PaddiSense Farm Management Integration for Home Assistant."""
 from __future__ import annotations
 
+import asyncio
+import contextvars
 import logging
+import time
+from collections.abc import Callable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, NamedTuple
 
 import voluptuous as vol
 
+from homeassistant.components import persistent_notification
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.typing import ConfigType
 
 from .const import (
@@ -28,6 +37,7 @@ from .const import (
     REGISTRY_MODULE,
     # Registry services
     SERVICE_ADD_BAY,
+    SERVICE_ADD_BAYS_BULK,
     SERVICE_ADD_FARM,
     SERVICE_ADD_PADDOCK,
     SERVICE_ADD_SEASON,
@@ -64,12 +74,52 @@ from .const import (
     SERVICE_REFRESH_RTR,
 )
 from .helpers import cleanup_unlicensed_modules
-from .installer import BackupManager, ConfigWriter, GitManager, ModuleManager
 from .registry.backend import RegistryBackend
 from .rtr.backend import RTRBackend
 
+if TYPE_CHECKING:
+    from .installer import BackupManager, GitManager, ModuleManager
+
 _LOGGER = logging.getLogger(__name__)
 
+# Frontend card files shipped with the integration
+_WWW_DIR = Path(__file__).parent / "www"
+_REGISTRY_CARD_PATH = str(_WWW_DIR / "paddisense-registry-card.js")
+_MANAGER_CARD_PATH = str(_WWW_DIR / "paddisense-manager-card.js")
+
+# Dashboard slugs owned by PaddiSense modules, plus the registry dashboard
+_PADDISENSE_SLUGS = frozenset(
+    [
+        meta.get("dashboard_slug", f"{module_id}-dashboard")
+        for module_id, meta in MODULE_METADATA.items()
+    ]
+    + ["paddisense-registry"]
+)
+
+# Registry backend shared across entry reloads, dropped when the entry is removed
+_BACKEND_SINGLETON: RegistryBackend | None = None
+
+# hass.data[DOMAIN] keys set up by a config entry and dropped on unload
+_OWNED_KEYS = frozenset({
+    "backend",
+    "rtr_backend",
+    "entry_id",
+    "git_manager",
+    "module_manager",
+    "backup_manager",
+    "config_writer",
+    "_services",
+    "_executor",
+    "_sensor_debouncer",
+    "_metadata_cache",
+})
+
+# Registry changes within this window (seconds) share one sensor update
+SENSOR_UPDATE_COOLDOWN = 0.25
+
+# Seconds module metadata stays cached between installer service calls
+METADATA_CACHE_TTL = 60
+
 # =============================================================================
 # SERVICE SCHEMAS
 # =============================================================================
@@ -80,111 +130,122 @@ ADD_PADDOCK_SCHEMA = vol.Schema({
     vol.Optional("farm_id", default="farm_1"): cv.string,
     vol.Optional("bay_prefix", default="B-"): cv.string,
     vol.Optional("current_season", default=True): cv.boolean,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 EDIT_PADDOCK_SCHEMA = vol.Schema({
     vol.Required("paddock_id"): cv.string,
     vol.Optional("name"): cv.string,
     vol.Optional("farm_id"): cv.string,
     vol.Optional("current_season"): cv.boolean,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 DELETE_PADDOCK_SCHEMA = vol.Schema({
     vol.Required("paddock_id"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 SET_CURRENT_SEASON_SCHEMA = vol.Schema({
     vol.Required("paddock_id"): cv.string,
     vol.Optional("value"): cv.boolean,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 ADD_BAY_SCHEMA = vol.Schema({
     vol.Required("paddock_id"): cv.string,
     vol.Required("name"): cv.string,
     vol.Optional("order"): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
     vol.Optional("is_last", default=False): cv.boolean,
-})
+}, extra=vol.REMOVE_EXTRA)
+
+BAY_ITEM_SCHEMA = vol.Schema({
+    vol.Required("name"): cv.string,
+    vol.Optional("order"): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
+    vol.Optional("is_last", default=False): cv.boolean,
+}, extra=vol.REMOVE_EXTRA)
+
+ADD_BAYS_BULK_SCHEMA = vol.Schema({
+    vol.Required("paddock_id"): cv.string,
+    vol.Required("bays"): vol.All(cv.ensure_list, [BAY_ITEM_SCHEMA]),
+}, extra=vol.REMOVE_EXTRA)
 
 EDIT_BAY_SCHEMA = vol.Schema({
     vol.Required("bay_id"): cv.string,
     vol.Optional("name"): cv.string,
     vol.Optional("order"): vol.All(vol.Coerce(int), vol.Range(min=1, max=100)),
     vol.Optional("is_last"): cv.boolean,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 DELETE_BAY_SCHEMA = vol.Schema({
     vol.Required("bay_id"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 ADD_SEASON_SCHEMA = vol.Schema({
     vol.Required("name"): cv.string,
     vol.Required("start_date"): cv.string,
     vol.Required("end_date"): cv.string,
     vol.Optional("active", default=False): cv.boolean,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 EDIT_SEASON_SCHEMA = vol.Schema({
     vol.Required("season_id"): cv.string,
     vol.Optional("name"): cv.string,
     vol.Optional("start_date"): cv.string,
     vol.Optional("end_date"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 DELETE_SEASON_SCHEMA = vol.Schema({
     vol.Required("season_id"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 SET_ACTIVE_SEASON_SCHEMA = vol.Schema({
     vol.Required("season_id"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 ADD_FARM_SCHEMA = vol.Schema({
     vol.Required("name"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 EDIT_FARM_SCHEMA = vol.Schema({
     vol.Required("farm_id"): cv.string,
     vol.Optional("name"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 DELETE_FARM_SCHEMA = vol.Schema({
     vol.Required("farm_id"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 IMPORT_REGISTRY_SCHEMA = vol.Schema({
     vol.Required("filename"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 IMPORT_FROM_EXCEL_SCHEMA = vol.Schema({
     vol.Required("filename"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 # Installer schemas
 INSTALL_MODULE_SCHEMA = vol.Schema({
     vol.Required("module_id"): vol.In(AVAILABLE_MODULES),
-})
+}, extra=vol.REMOVE_EXTRA)
 
 REMOVE_MODULE_SCHEMA = vol.Schema({
     vol.Required("module_id"): vol.In(AVAILABLE_MODULES),
     vol.Optional("force", default=False): cv.boolean,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 UPDATE_PADDISENSE_SCHEMA = vol.Schema({
     vol.Optional("backup_first", default=True): cv.boolean,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 RESTORE_BACKUP_SCHEMA = vol.Schema({
     vol.Required("backup_id"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 ADD_LICENSE_SCHEMA = vol.Schema({
     vol.Required("license_key"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 # RTR schemas
 SET_RTR_URL_SCHEMA = vol.Schema({
     vol.Required("url"): cv.string,
-})
+}, extra=vol.REMOVE_EXTRA)
 
 
 # =============================================================================
@@ -200,43 +261,50 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up PaddiSense from a config entry."""
     from .const import FREE_MODULES
+    from .installer import BackupManager, ConfigWriter, GitManager, ModuleManager
+
+    global _BACKEND_SINGLETON
 
     hass.data.setdefault(DOMAIN, {})
+    data = entry.data
 
     # Ensure all FREE_MODULES are in license_modules (handles upgrades)
-    stored_modules = set(entry.data.get(CONF_LICENSE_MODULES, []))
+    stored_modules = set(data.get(CONF_LICENSE_MODULES, []))
     current_free = set(FREE_MODULES)
     if not current_free.issubset(stored_modules):
         # Update config entry with all free modules
-        new_data = {**entry.data, CONF_LICENSE_MODULES: list(current_free | stored_modules)}
+        new_data = {**data, CONF_LICENSE_MODULES: list(current_free | stored_modules)}
         hass.config_entries.async_update_entry(entry, data=new_data)
+        data = entry.data
         _LOGGER.info("Updated license_modules to include all free modules")
 
-    # Initialize backend
-    backend = RegistryBackend()
-    await hass.async_add_executor_job(backend.init)
-
-    # Cleanup unlicensed module folders
-    licensed_modules = entry.data.get(CONF_LICENSE_MODULES, [])
-    if licensed_modules:
-        cleanup_result = await hass.async_add_executor_job(
-            cleanup_unlicensed_modules, licensed_modules
-        )
-        if cleanup_result.get("removed"):
-            _LOGGER.info(
-                "Cleaned up unlicensed modules: %s",
-                ", ".join(cleanup_result["removed"])
-            )
+    # Initialize backends, clean up unlicensed module folders and ensure
+    # registry (core) is installed - these touch separate paths, so run
+    # them concurrently in the executor. The registry backend is kept
+    # across reloads and only initialized the first time.
+    rtr_backend = RTRBackend()
+    setup_jobs = [
+        _async_cleanup_unlicensed_modules(
+            hass, data.get(CONF_LICENSE_MODULES, [])
+        ),
+        hass.async_add_executor_job(rtr_backend.init),
+        hass.async_add_executor_job(_ensure_registry_installed),
+    ]
+    if _BACKEND_SINGLETON is None:
+        _BACKEND_SINGLETON = RegistryBackend()
+        setup_jobs.append(hass.async_add_executor_job(_BACKEND_SINGLETON.init))
+    backend = _BACKEND_SINGLETON
+    await asyncio.gather(*setup_jobs)
 
     # Initialize installer components with token from license
-    git_manager = GitManager(token=entry.data.get(CONF_GITHUB_TOKEN))
+    git_manager = GitManager(token=data.get(CONF_GITHUB_TOKEN))
     module_manager = ModuleManager()
     backup_manager = BackupManager()
     config_writer = ConfigWriter()
-
-    # Initialize RTR backend
-    rtr_backend = RTRBackend()
-    await hass.async_add_executor_job(rtr_backend.init)
+    metadata_cache = MetadataCache(module_manager.get_modules_metadata)
+    entry.async_on_unload(
+        hass.bus.async_listen(EVENT_MODULES_CHANGED, metadata_cache.invalidate)
+    )
 
     # Store references
     hass.data[DOMAIN]["backend"] = backend
@@ -246,9 +314,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     hass.data[DOMAIN]["module_manager"] = module_manager
     hass.data[DOMAIN]["backup_manager"] = backup_manager
     hass.data[DOMAIN]["config_writer"] = config_writer
-
-    # Ensure registry (core) is always installed
-    await hass.async_add_executor_job(_ensure_registry_installed)
+    hass.data[DOMAIN]["_metadata_cache"] = metadata_cache
+    hass.data[DOMAIN]["_sensor_debouncer"] = Debouncer(
+        hass,
+        _LOGGER,
+        cooldown=SENSOR_UPDATE_COOLDOWN,
+        immediate=False,
+        function=partial(_async_fire_data_updated, hass),
+    )
+    # Registry writes are read-modify-write on config.json, so they run
+    # one at a time on a dedicated worker rather than HA's shared pool
+    hass.data[DOMAIN]["_executor"] = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="paddisense-registry"
+    )
 
     # Register services
     await _async_register_registry_services(hass, backend)
@@ -280,90 +358,34 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
+        data = hass.data[DOMAIN]
+
         # Remove all services
-        all_services = [
-            # Registry
-            SERVICE_ADD_PADDOCK, SERVICE_EDIT_PADDOCK, SERVICE_DELETE_PADDOCK,
-            SERVICE_SET_CURRENT_SEASON, SERVICE_ADD_BAY, SERVICE_EDIT_BAY,
-            SERVICE_DELETE_BAY, SERVICE_ADD_SEASON, SERVICE_EDIT_SEASON,
-            SERVICE_DELETE_SEASON, SERVICE_SET_ACTIVE_SEASON, SERVICE_ADD_FARM,
-            SERVICE_EDIT_FARM, SERVICE_DELETE_FARM, SERVICE_EXPORT_REGISTRY,
-            SERVICE_IMPORT_REGISTRY, SERVICE_IMPORT_FROM_EXCEL,
-            # Installer
-            SERVICE_CHECK_UPDATES, SERVICE_UPDATE_PADDISENSE, SERVICE_INSTALL_MODULE,
-            SERVICE_REMOVE_MODULE, SERVICE_CREATE_BACKUP, SERVICE_RESTORE_BACKUP,
-            SERVICE_ROLLBACK, SERVICE_INSTALL_HACS_CARDS, SERVICE_INSTALL_MODULE_HACS,
-            # RTR
-            SERVICE_SET_RTR_URL, SERVICE_REFRESH_RTR,
-        ]
-        for service in all_services:
+        for service in data.get("_services", ()):
             hass.services.async_remove(DOMAIN, service)
 
+        debouncer = data.get("_sensor_debouncer")
+        if debouncer is not None:
+            debouncer.async_cancel()
+
+        executor = data.get("_executor")
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
         # Clean up data
-        hass.data[DOMAIN].pop("backend", None)
-        hass.data[DOMAIN].pop("rtr_backend", None)
-        hass.data[DOMAIN].pop("entry_id", None)
-        hass.data[DOMAIN].pop("git_manager", None)
-        hass.data[DOMAIN].pop("module_manager", None)
-        hass.data[DOMAIN].pop("backup_manager", None)
-        hass.data[DOMAIN].pop("config_writer", None)
+        for key in _OWNED_KEYS & data.keys():
+            del data[key]
 
     return unload_ok
 
 
 async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Handle removal of an entry - clean up dashboards and symlinks."""
-    from pathlib import Path
-    from .const import LOVELACE_DASHBOARDS_YAML, PACKAGES_DIR, MODULE_METADATA
+    global _BACKEND_SINGLETON
 
+    _BACKEND_SINGLETON = None
     _LOGGER.info("Removing PaddiSense integration - cleaning up dashboards and packages")
-
-    # Remove module symlinks from packages directory
-    if PACKAGES_DIR.exists():
-        for module_id in AVAILABLE_MODULES:
-            symlink_path = PACKAGES_DIR / f"{module_id}.yaml"
-            if symlink_path.exists() or symlink_path.is_symlink():
-                try:
-                    symlink_path.unlink()
-                    _LOGGER.info("Removed package symlink: %s", symlink_path)
-                except OSError as e:
-                    _LOGGER.warning("Failed to remove symlink %s: %s", symlink_path, e)
-
-    # Remove PaddiSense dashboards from lovelace_dashboards.yaml
-    if LOVELACE_DASHBOARDS_YAML.exists():
-        try:
-            import yaml
-            content = LOVELACE_DASHBOARDS_YAML.read_text(encoding="utf-8")
-            dashboards = yaml.safe_load(content) or {}
-
-            # Find and remove PaddiSense dashboards
-            paddisense_slugs = []
-            for module_id, meta in MODULE_METADATA.items():
-                slug = meta.get("dashboard_slug", f"{module_id}-dashboard")
-                paddisense_slugs.append(slug)
-
-            # Also check for registry dashboard
-            paddisense_slugs.append("paddisense-registry")
-
-            removed = []
-            for slug in paddisense_slugs:
-                if slug in dashboards:
-                    del dashboards[slug]
-                    removed.append(slug)
-
-            if removed:
-                # Write back
-                header = """# Lovelace Dashboards
-# Managed by Home Assistant
-
-"""
-                new_content = header + yaml.dump(dashboards, default_flow_style=False, sort_keys=False)
-                LOVELACE_DASHBOARDS_YAML.write_text(new_content, encoding="utf-8")
-                _LOGGER.info("Removed dashboards: %s", ", ".join(removed))
-
-        except Exception as e:
-            _LOGGER.warning("Failed to clean up dashboards: %s", e)
-
+    await hass.async_add_executor_job(_remove_entry_cleanup)
     _LOGGER.info("PaddiSense cleanup complete. Restart Home Assistant to apply changes.")
 
 
@@ -371,881 +393,986 @@ async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
 # REGISTRY SERVICES
 # =============================================================================
 
+class ServiceSpec(NamedTuple):
+    """A registry service forwarded to a RegistryBackend method."""
+
+    service: str
+    method: str
+    keys: tuple[str, ...]
+    defaults: Mapping[str, Any]
+    fires_update: bool
+    schema: vol.Schema | None = None
+
+
+_NO_DEFAULTS: Mapping[str, Any] = MappingProxyType({})
+
+_SERVICE_SPECS: tuple[ServiceSpec, ...] = (
+    ServiceSpec(
+        SERVICE_ADD_PADDOCK, "add_paddock",
+        ("name", "bay_count", "farm_id", "bay_prefix", "current_season"),
+        MappingProxyType({"farm_id": "farm_1", "bay_prefix": "B-", "current_season": True}),
+        True,
+        ADD_PADDOCK_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_EDIT_PADDOCK, "edit_paddock",
+        ("paddock_id", "name", "farm_id", "current_season"),
+        _NO_DEFAULTS,
+        True,
+        EDIT_PADDOCK_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_DELETE_PADDOCK, "delete_paddock",
+        ("paddock_id",),
+        _NO_DEFAULTS,
+        True,
+        DELETE_PADDOCK_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_SET_CURRENT_SEASON, "set_current_season",
+        ("paddock_id", "value"),
+        _NO_DEFAULTS,
+        True,
+        SET_CURRENT_SEASON_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_ADD_BAY, "add_bay",
+        ("paddock_id", "name", "order", "is_last"),
+        MappingProxyType({"is_last": False}),
+        True,
+        ADD_BAY_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_ADD_BAYS_BULK, "add_bays_bulk",
+        ("paddock_id", "bays"),
+        _NO_DEFAULTS,
+        True,
+        ADD_BAYS_BULK_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_EDIT_BAY, "edit_bay",
+        ("bay_id", "name", "order", "is_last"),
+        _NO_DEFAULTS,
+        True,
+        EDIT_BAY_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_DELETE_BAY, "delete_bay",
+        ("bay_id",),
+        _NO_DEFAULTS,
+        True,
+        DELETE_BAY_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_ADD_SEASON, "add_season",
+        ("name", "start_date", "end_date", "active"),
+        MappingProxyType({"active": False}),
+        True,
+        ADD_SEASON_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_EDIT_SEASON, "edit_season",
+        ("season_id", "name", "start_date", "end_date"),
+        _NO_DEFAULTS,
+        True,
+        EDIT_SEASON_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_DELETE_SEASON, "delete_season",
+        ("season_id",),
+        _NO_DEFAULTS,
+        True,
+        DELETE_SEASON_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_SET_ACTIVE_SEASON, "set_active_season",
+        ("season_id",),
+        _NO_DEFAULTS,
+        True,
+        SET_ACTIVE_SEASON_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_ADD_FARM, "add_farm",
+        ("name",),
+        _NO_DEFAULTS,
+        True,
+        ADD_FARM_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_EDIT_FARM, "edit_farm",
+        ("farm_id", "name"),
+        _NO_DEFAULTS,
+        True,
+        EDIT_FARM_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_DELETE_FARM, "delete_farm",
+        ("farm_id",),
+        _NO_DEFAULTS,
+        True,
+        DELETE_FARM_SCHEMA,
+    ),
+    ServiceSpec(SERVICE_EXPORT_REGISTRY, "export_registry", (), _NO_DEFAULTS, False),
+    ServiceSpec(
+        SERVICE_EXPORT_REGISTRY_TEMPLATE, "export_registry_template",
+        (),
+        _NO_DEFAULTS,
+        False,
+    ),
+    ServiceSpec(
+        SERVICE_IMPORT_REGISTRY, "import_registry",
+        ("filename",),
+        _NO_DEFAULTS,
+        True,
+        IMPORT_REGISTRY_SCHEMA,
+    ),
+    ServiceSpec(
+        SERVICE_IMPORT_FROM_EXCEL, "import_from_excel",
+        ("filename",),
+        _NO_DEFAULTS,
+        True,
+        IMPORT_FROM_EXCEL_SCHEMA,
+    ),
+)
+
+
+async def _async_handle_registry_service(
+    hass: HomeAssistant,
+    backend: RegistryBackend,
+    spec: ServiceSpec,
+    call: ServiceCall,
+) -> None:
+    """Forward a registry service call to its backend method."""
+    data = call.data
+    defaults = spec.defaults
+    args = tuple(data.get(key, defaults.get(key)) for key in spec.keys)
+    result = await _async_run(hass, getattr(backend, spec.method), *args)
+    _log_service_result(spec.method, result)
+    # No-op edits report changed=False and leave the sensors alone
+    if spec.fires_update and result.get("success") and result.get("changed", True):
+        await _async_update_sensors(hass)
+
+
 async def _async_register_registry_services(
     hass: HomeAssistant, backend: RegistryBackend
 ) -> None:
     """Register Farm Registry services."""
-
-    async def handle_add_paddock(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.add_paddock,
-            call.data["name"],
-            call.data["bay_count"],
-            call.data.get("farm_id", "farm_1"),
-            call.data.get("bay_prefix", "B-"),
-            call.data.get("current_season", True),
-        )
-        _log_service_result("add_paddock", result)
-        await _async_update_sensors(hass)
-
-    async def handle_edit_paddock(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.edit_paddock,
-            call.data["paddock_id"],
-            call.data.get("name"),
-            call.data.get("farm_id"),
-            call.data.get("current_season"),
+    for spec in _SERVICE_SPECS:
+        _async_register_service(
+            hass,
+            spec.service,
+            partial(_async_handle_registry_service, hass, backend, spec),
+            spec.schema,
         )
-        _log_service_result("edit_paddock", result)
-        await _async_update_sensors(hass)
 
-    async def handle_delete_paddock(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.delete_paddock,
-            call.data["paddock_id"],
-        )
-        _log_service_result("delete_paddock", result)
-        await _async_update_sensors(hass)
 
-    async def handle_set_current_season(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.set_current_season,
-            call.data["paddock_id"],
-            call.data.get("value"),
-        )
-        _log_service_result("set_current_season", result)
-        await _async_update_sensors(hass)
+# =============================================================================
+# INSTALLER SERVICES
+# =============================================================================
 
-    async def handle_add_bay(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.add_bay,
-            call.data["paddock_id"],
-            call.data["name"],
-            call.data.get("order"),
-            call.data.get("is_last", False),
-        )
-        _log_service_result("add_bay", result)
-        await _async_update_sensors(hass)
 
-    async def handle_edit_bay(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.edit_bay,
-            call.data["bay_id"],
-            call.data.get("name"),
-            call.data.get("order"),
-            call.data.get("is_last"),
-        )
-        _log_service_result("edit_bay", result)
-        await _async_update_sensors(hass)
+async def _async_handle_check_updates(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Check for PaddiSense updates and report telemetry."""
+    from .telemetry import report_update_check
+
+    # Show "checking" notification
+    persistent_notification.async_create(
+        hass,
+        "Checking for updates...",
+        title="PaddiSense",
+        notification_id="paddisense_update_check",
+    )
 
-    async def handle_delete_bay(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.delete_bay,
-            call.data["bay_id"],
-        )
-        _log_service_result("delete_bay", result)
-        await _async_update_sensors(hass)
+    git_manager: GitManager = hass.data[DOMAIN]["git_manager"]
+    module_manager: ModuleManager = hass.data[DOMAIN]["module_manager"]
 
-    async def handle_add_season(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.add_season,
-            call.data["name"],
-            call.data["start_date"],
-            call.data["end_date"],
-            call.data.get("active", False),
-        )
-        _log_service_result("add_season", result)
-        await _async_update_sensors(hass)
+    # Check for updates
+    result = await hass.async_add_executor_job(git_manager.check_for_updates)
+    _log_service_result("check_for_updates", result)
 
-    async def handle_edit_season(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.edit_season,
-            call.data["season_id"],
-            call.data.get("name"),
-            call.data.get("start_date"),
-            call.data.get("end_date"),
-        )
-        _log_service_result("edit_season", result)
-        await _async_update_sensors(hass)
+    # Get installed modules for telemetry
+    installed = await hass.async_add_executor_job(module_manager.get_installed_modules)
+    installed_ids = [m["id"] for m in installed]
 
-    async def handle_delete_season(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.delete_season,
-            call.data["season_id"],
+    # Report telemetry (non-blocking, fire and forget)
+    hass.async_create_task(
+        report_update_check(
+            installed_modules=installed_ids,
+            local_version=result.get("local_version"),
+            remote_version=result.get("remote_version"),
+            update_available=result.get("update_available", False),
         )
-        _log_service_result("delete_season", result)
-        await _async_update_sensors(hass)
+    )
 
-    async def handle_set_active_season(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.set_active_season,
-            call.data["season_id"],
+    # Update version sensor with check results
+    if result.get("success"):
+        hass.bus.async_fire(EVENT_MODULES_CHANGED)
+        # Fire event to update the version sensor
+        hass.bus.async_fire(
+            f"{DOMAIN}_update_checked",
+            {
+                "latest_version": result.get("remote_version"),
+                "update_available": result.get("update_available", False),
+            }
         )
-        _log_service_result("set_active_season", result)
-        await _async_update_sensors(hass)
 
-    async def handle_add_farm(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.add_farm,
-            call.data["name"],
-        )
-        _log_service_result("add_farm", result)
-        await _async_update_sensors(hass)
+    # Show result notification
+    local_ver = result.get("local_version", "unknown")
+    remote_ver = result.get("remote_version", "unknown")
+    update_available = result.get("update_available", False)
 
-    async def handle_edit_farm(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.edit_farm,
-            call.data["farm_id"],
-            call.data.get("name"),
-        )
-        _log_service_result("edit_farm", result)
-        await _async_update_sensors(hass)
+    if update_available:
+        msg = f"Update available!\n\nCurrent: v{local_ver}\nLatest: v{remote_ver}\n\nGo to the Modules tab to update."
+    else:
+        msg = f"You're up to date!\n\nVersion: v{local_ver}"
 
-    async def handle_delete_farm(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.delete_farm,
-            call.data["farm_id"],
-        )
-        _log_service_result("delete_farm", result)
-        await _async_update_sensors(hass)
+    persistent_notification.async_create(
+        hass,
+        msg,
+        title="PaddiSense Update Check",
+        notification_id="paddisense_update_check",
+    )
 
-    async def handle_export_registry(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(backend.export_registry)
-        _log_service_result("export_registry", result)
 
-    async def handle_export_registry_template(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(backend.export_registry_template)
-        _log_service_result("export_registry_template", result)
+async def _async_handle_update_paddisense(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Update PaddiSense to latest version."""
+    backup_manager: BackupManager = hass.data[DOMAIN]["backup_manager"]
+    git_manager: GitManager = hass.data[DOMAIN]["git_manager"]
+
+    # Show "updating" notification
+    persistent_notification.async_create(
+        hass,
+        "Updating PaddiSense... Please wait.",
+        title="PaddiSense",
+        notification_id="paddisense_update",
+    )
 
-    async def handle_import_registry(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.import_registry,
-            call.data["filename"],
+    # Create backup first if requested
+    if call.data.get("backup_first", True):
+        persistent_notification.async_create(
+            hass,
+            "Creating backup before update...",
+            title="PaddiSense",
+            notification_id="paddisense_update",
         )
-        _log_service_result("import_registry", result)
-        await _async_update_sensors(hass)
+        backup_result = await hass.async_add_executor_job(
+            backup_manager.create_backup, "pre_update"
+        )
+        if not backup_result.get("success"):
+            _LOGGER.error("Backup failed, aborting update")
+            persistent_notification.async_create(
+                hass,
+                "Backup failed. Update aborted to protect your data.",
+                title="PaddiSense Update Failed",
+                notification_id="paddisense_update",
+            )
+            return
 
-    async def handle_import_from_excel(call: ServiceCall) -> None:
-        result = await hass.async_add_executor_job(
-            backend.import_from_excel,
-            call.data["filename"],
+    # Pull latest changes
+    persistent_notification.async_create(
+        hass,
+        "Downloading latest version...",
+        title="PaddiSense",
+        notification_id="paddisense_update",
+    )
+    result = await hass.async_add_executor_job(git_manager.pull)
+    _log_service_result("update_paddisense", result)
+
+    if result.get("success"):
+        # Trigger restart
+        _LOGGER.info("PaddiSense updated, triggering restart")
+        persistent_notification.async_create(
+            hass,
+            "Update complete! Restarting Home Assistant...",
+            title="PaddiSense",
+            notification_id="paddisense_update",
         )
-        _log_service_result("import_from_excel", result)
-        await _async_update_sensors(hass)
+        await hass.services.async_call("homeassistant", "restart")
+    else:
+        # Rollback on failure
+        _LOGGER.error("Update failed, attempting rollback")
+        persistent_notification.async_create(
+            hass,
+            f"Update failed: {result.get('error', 'Unknown error')}\n\nAttempting rollback...",
+            title="PaddiSense Update Failed",
+            notification_id="paddisense_update",
+        )
+        await hass.async_add_executor_job(backup_manager.rollback)
 
-    # Register all registry services
-    hass.services.async_register(DOMAIN, SERVICE_ADD_PADDOCK, handle_add_paddock, ADD_PADDOCK_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_EDIT_PADDOCK, handle_edit_paddock, EDIT_PADDOCK_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_DELETE_PADDOCK, handle_delete_paddock, DELETE_PADDOCK_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_SET_CURRENT_SEASON, handle_set_current_season, SET_CURRENT_SEASON_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_ADD_BAY, handle_add_bay, ADD_BAY_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_EDIT_BAY, handle_edit_bay, EDIT_BAY_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_DELETE_BAY, handle_delete_bay, DELETE_BAY_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_ADD_SEASON, handle_add_season, ADD_SEASON_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_EDIT_SEASON, handle_edit_season, EDIT_SEASON_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_DELETE_SEASON, handle_delete_season, DELETE_SEASON_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_SET_ACTIVE_SEASON, handle_set_active_season, SET_ACTIVE_SEASON_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_ADD_FARM, handle_add_farm, ADD_FARM_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_EDIT_FARM, handle_edit_farm, EDIT_FARM_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_DELETE_FARM, handle_delete_farm, DELETE_FARM_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_EXPORT_REGISTRY, handle_export_registry)
-    hass.services.async_register(DOMAIN, SERVICE_EXPORT_REGISTRY_TEMPLATE, handle_export_registry_template)
-    hass.services.async_register(DOMAIN, SERVICE_IMPORT_REGISTRY, handle_import_registry, IMPORT_REGISTRY_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_IMPORT_FROM_EXCEL, handle_import_from_excel, IMPORT_FROM_EXCEL_SCHEMA)
 
+async def _async_handle_install_module(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Install a PaddiSense module."""
+    module_id = call.data["module_id"]
+    module_manager: ModuleManager = hass.data[DOMAIN]["module_manager"]
+
+    # Get module name for notifications
+    metadata = await hass.data[DOMAIN]["_metadata_cache"].async_get(hass)
+    meta = metadata.get(module_id, MODULE_METADATA.get(module_id, {}))
+    module_name = meta.get("name", module_id)
+
+    # Show installing notification
+    persistent_notification.async_create(
+        hass,
+        f"Installing module '{module_name}'...",
+        title="PaddiSense",
+        notification_id="paddisense_module_install",
+    )
 
-# =============================================================================
-# INSTALLER SERVICES
-# =============================================================================
+    # Install required HACS integrations and cards first
+    required_integrations = MODULE_HACS_INTEGRATIONS.get(module_id, [])
+    required_cards = MODULE_HACS_CARDS.get(module_id, [])
 
-async def _async_register_installer_services(hass: HomeAssistant) -> None:
-    """Register installer services."""
+    if required_integrations or required_cards:
+        # Check if HACS is available - use multiple detection methods
+        hacs_service_available = hass.services.has_service("hacs", "install")
+        hacs_component_exists = Path("/config/custom_components/hacs").exists()
 
-    async def handle_check_updates(call: ServiceCall) -> None:
-        """Check for PaddiSense updates and report telemetry."""
-        from .telemetry import report_update_check
+        if hacs_service_available:
+            persistent_notification.async_create(
+                hass,
+                f"Installing HACS requirements for '{module_name}'...",
+                title="PaddiSense",
+                notification_id="paddisense_module_install",
+            )
 
-        # Show "checking" notification
-        await hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "PaddiSense",
-                "message": "Checking for updates...",
-                "notification_id": "paddisense_update_check",
-            },
-        )
+            # Install integrations
+            for integration in required_integrations:
+                try:
+                    _LOGGER.info("Installing HACS integration: %s", integration["repository"])
+                    await hass.services.async_call(
+                        "hacs", "install",
+                        {
+                            "repository": integration["repository"],
+                            "category": "integration",
+                        },
+                    )
+                except Exception as e:
+                    _LOGGER.warning("Could not install %s: %s", integration["repository"], e)
 
-        git_manager: GitManager = hass.data[DOMAIN]["git_manager"]
-        module_manager: ModuleManager = hass.data[DOMAIN]["module_manager"]
+            # Install cards
+            for card in required_cards:
+                try:
+                    _LOGGER.info("Installing HACS card: %s", card["repository"])
+                    await hass.services.async_call(
+                        "hacs", "install",
+                        {
+                            "repository": card["repository"],
+                            "category": "plugin",
+                        },
+                    )
+                except Exception as e:
+                    _LOGGER.warning("Could not install %s: %s", card["repository"], e)
+
+            persistent_notification.async_create(
+                hass,
+                f"Installing module '{module_name}'...",
+                title="PaddiSense",
+                notification_id="paddisense_module_install",
+            )
+        elif hacs_component_exists:
+            # HACS installed but service not ready
+            _LOGGER.warning("HACS service not ready, skipping HACS requirements for %s - try again after restart", module_id)
+        else:
+            _LOGGER.warning("HACS not installed, skipping HACS requirements for %s", module_id)
 
-        # Check for updates
-        result = await hass.async_add_executor_job(git_manager.check_for_updates)
-        _log_service_result("check_for_updates", result)
+    result = await hass.async_add_executor_job(
+        module_manager.install_module,
+        module_id,
+    )
+    _log_service_result("install_module", result)
 
-        # Get installed modules for telemetry
-        installed = await hass.async_add_executor_job(module_manager.get_installed_modules)
-        installed_ids = [m["id"] for m in installed]
+    if result.get("success"):
+        if result.get("restart_required"):
+            # Notify user before restart
+            version = result.get("version", "unknown")
+
+            # Module-specific post-install messages
+            post_install_msg = ""
+            if module_id == "rtr":
+                post_install_msg = (
+                    "\n\n**Next Step:** After restart, go to the RTR dashboard "
+                    "and enter your Real Time Rice URL to see predictions."
+                )
+            elif module_id == "weather":
+                post_install_msg = (
+                    "\n\n**Auto-Setup:** After restart, BOM Weather will be configured "
+                    "automatically. The Weather dashboard will show data shortly."
+                )
 
-        # Report telemetry (non-blocking, fire and forget)
-        hass.async_create_task(
-            report_update_check(
-                installed_modules=installed_ids,
-                local_version=result.get("local_version"),
-                remote_version=result.get("remote_version"),
-                update_available=result.get("update_available", False),
+            persistent_notification.async_create(
+                hass,
+                f"Module '{module_name}' v{version} installed successfully.{post_install_msg}\n\nRestarting Home Assistant...",
+                title="PaddiSense",
+                notification_id="paddisense_module_install",
             )
+            hass.bus.async_fire(EVENT_MODULES_CHANGED)
+            await hass.services.async_call("homeassistant", "restart")
+    else:
+        # Show error notification to user
+        error_msg = result.get("error", "Unknown error")
+        preflight = result.get("preflight", {})
+
+        if preflight:
+            errors = preflight.get("errors", [])
+            if errors:
+                error_msg = f"Installation failed:\n• " + "\n• ".join(errors)
+
+        persistent_notification.async_create(
+            hass,
+            error_msg,
+            title="PaddiSense - Module Installation Failed",
+            notification_id="paddisense_module_install",
         )
 
-        # Update version sensor with check results
-        if result.get("success"):
-            hass.bus.async_fire(EVENT_MODULES_CHANGED)
-            # Fire event to update the version sensor
-            hass.bus.async_fire(
-                f"{DOMAIN}_update_checked",
-                {
-                    "latest_version": result.get("remote_version"),
-                    "update_available": result.get("update_available", False),
-                }
+
+async def _async_handle_remove_module(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Remove a PaddiSense module."""
+    module_id = call.data["module_id"]
+    module_manager: ModuleManager = hass.data[DOMAIN]["module_manager"]
+
+    # Get module name for notifications
+    metadata = await hass.data[DOMAIN]["_metadata_cache"].async_get(hass)
+    meta = metadata.get(module_id, MODULE_METADATA.get(module_id, {}))
+    module_name = meta.get("name", module_id)
+
+    result = await hass.async_add_executor_job(
+        module_manager.remove_module,
+        module_id,
+        call.data.get("force", False),
+    )
+    _log_service_result("remove_module", result)
+
+    if result.get("success"):
+        if result.get("restart_required"):
+            # Notify user before restart
+            persistent_notification.async_create(
+                hass,
+                f"Module '{module_name}' removed successfully.\n\nRestarting Home Assistant...",
+                title="PaddiSense",
+                notification_id="paddisense_module_remove",
             )
+            hass.bus.async_fire(EVENT_MODULES_CHANGED)
+            await hass.services.async_call("homeassistant", "restart")
+    else:
+        # Show error notification to user
+        error_msg = result.get("error", "Unknown error")
+        dependents = result.get("dependents", [])
+
+        if dependents:
+            # Get dependent module names
+            dep_names = []
+            for dep_id in dependents:
+                dep_meta = metadata.get(dep_id, MODULE_METADATA.get(dep_id, {}))
+                dep_names.append(dep_meta.get("name", dep_id))
+            error_msg = f"Cannot remove '{module_name}' because it is required by: {', '.join(dep_names)}.\n\nRemove those modules first, or use force removal."
+
+        persistent_notification.async_create(
+            hass,
+            error_msg,
+            title="PaddiSense - Module Removal Failed",
+            notification_id="paddisense_module_remove",
+        )
 
-        # Show result notification
-        local_ver = result.get("local_version", "unknown")
-        remote_ver = result.get("remote_version", "unknown")
-        update_available = result.get("update_available", False)
 
-        if update_available:
-            msg = f"Update available!\n\nCurrent: v{local_ver}\nLatest: v{remote_ver}\n\nGo to the Modules tab to update."
-        else:
-            msg = f"You're up to date!\n\nVersion: v{local_ver}"
+async def _async_handle_create_backup(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Create a PaddiSense backup."""
+    backup_manager: BackupManager = hass.data[DOMAIN]["backup_manager"]
+    result = await hass.async_add_executor_job(
+        backup_manager.create_backup, "manual"
+    )
+    _log_service_result("create_backup", result)
 
-        await hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "PaddiSense Update Check",
-                "message": msg,
-                "notification_id": "paddisense_update_check",
-            },
-        )
 
-    async def handle_update_paddisense(call: ServiceCall) -> None:
-        """Update PaddiSense to latest version."""
-        backup_manager: BackupManager = hass.data[DOMAIN]["backup_manager"]
-        git_manager: GitManager = hass.data[DOMAIN]["git_manager"]
+async def _async_handle_restore_backup(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Restore from a backup."""
+    backup_manager: BackupManager = hass.data[DOMAIN]["backup_manager"]
+    result = await hass.async_add_executor_job(
+        backup_manager.restore_backup,
+        call.data["backup_id"],
+    )
+    _log_service_result("restore_backup", result)
+
+    if result.get("success") and result.get("restart_required"):
+        await hass.services.async_call("homeassistant", "restart")
 
-        # Show "updating" notification
-        await hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "PaddiSense",
-                "message": "Updating PaddiSense... Please wait.",
-                "notification_id": "paddisense_update",
-            },
+
+async def _async_handle_rollback(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Rollback to previous version."""
+    backup_manager: BackupManager = hass.data[DOMAIN]["backup_manager"]
+    result = await hass.async_add_executor_job(backup_manager.rollback)
+    _log_service_result("rollback", result)
+
+    if result.get("success") and result.get("restart_required"):
+        await hass.services.async_call("homeassistant", "restart")
+
+
+async def _async_handle_add_license(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Add a license key to unlock modules (PWM, WSS)."""
+    from .helpers import save_license_key
+    from .license import validate_license, LicenseError
+
+    license_key = call.data["license_key"].strip()
+
+    try:
+        # Validate the license first
+        license_info = await hass.async_add_executor_job(validate_license, license_key)
+
+        # Save it (adds to array, doesn't replace)
+        await hass.async_add_executor_job(save_license_key, license_key)
+
+        _LOGGER.info(
+            "License added for %s - modules: %s (expires: %s)",
+            license_info.email,
+            ", ".join(license_info.modules),
+            license_info.expiry,
         )
 
-        # Create backup first if requested
-        if call.data.get("backup_first", True):
-            await hass.services.async_call(
-                "persistent_notification", "create",
-                {
-                    "title": "PaddiSense",
-                    "message": "Creating backup before update...",
-                    "notification_id": "paddisense_update",
-                },
-            )
-            backup_result = await hass.async_add_executor_job(
-                backup_manager.create_backup, "pre_update"
-            )
-            if not backup_result.get("success"):
-                _LOGGER.error("Backup failed, aborting update")
-                await hass.services.async_call(
-                    "persistent_notification", "create",
-                    {
-                        "title": "PaddiSense Update Failed",
-                        "message": "Backup failed. Update aborted to protect your data.",
-                        "notification_id": "paddisense_update",
-                    },
-                )
-                return
+        # Notify user of success
+        persistent_notification.async_create(
+            hass,
+            (
+                f"License validated successfully!\n\n"
+                f"**Modules unlocked:** {', '.join(license_info.modules)}\n"
+                f"**Expires:** {license_info.expiry}\n\n"
+                f"You can now install the licensed modules."
+            ),
+            title="PaddiSense - License Added",
+            notification_id="paddisense_license",
+        )
 
-        # Pull latest changes
-        await hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "PaddiSense",
-                "message": "Downloading latest version...",
-                "notification_id": "paddisense_update",
-            },
+        # Fire event so UI can update
+        hass.bus.async_fire(f"{DOMAIN}_license_updated", {
+            "modules": license_info.modules,
+            "expiry": license_info.expiry.isoformat(),
+        })
+
+    except LicenseError as err:
+        error_msg = str(err)
+        if error_msg == "expired":
+            user_msg = "This license has expired. Please contact PaddiSense for a renewal."
+        elif error_msg == "invalid_format":
+            user_msg = "Invalid license format. License should start with 'PADDISENSE.'"
+        else:
+            user_msg = f"Invalid license: {error_msg}"
+
+        _LOGGER.warning("License validation failed: %s", error_msg)
+
+        persistent_notification.async_create(
+            hass,
+            user_msg,
+            title="PaddiSense - License Error",
+            notification_id="paddisense_license",
         )
-        result = await hass.async_add_executor_job(git_manager.pull)
-        _log_service_result("update_paddisense", result)
 
-        if result.get("success"):
-            # Trigger restart
-            _LOGGER.info("PaddiSense updated, triggering restart")
-            await hass.services.async_call(
-                "persistent_notification", "create",
-                {
-                    "title": "PaddiSense",
-                    "message": "Update complete! Restarting Home Assistant...",
-                    "notification_id": "paddisense_update",
-                },
+
+async def _async_handle_install_hacs_cards(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Install required HACS frontend cards."""
+    # Check if HACS is available - use multiple detection methods
+    hacs_service_available = hass.services.has_service("hacs", "install")
+    hacs_component_exists = Path("/config/custom_components/hacs").exists()
+    hacs_config_entries = hass.config_entries.async_entries("hacs")
+
+    if not hacs_service_available:
+        if hacs_component_exists or hacs_config_entries:
+            # HACS is installed but service not ready - likely needs restart
+            _LOGGER.warning("HACS is installed but service not available - may need restart")
+            persistent_notification.async_create(
+                hass,
+                (
+                    "HACS is installed but not fully loaded.\n\n"
+                    "Please try:\n"
+                    "1. Wait 30 seconds and try again\n"
+                    "2. Restart Home Assistant if issue persists\n\n"
+                    "HACS services may take time to load after startup."
+                ),
+                title="PaddiSense",
             )
-            await hass.services.async_call("homeassistant", "restart")
         else:
-            # Rollback on failure
-            _LOGGER.error("Update failed, attempting rollback")
+            _LOGGER.error("HACS is not installed")
+            persistent_notification.async_create(
+                hass,
+                (
+                    "HACS is not installed.\n\n"
+                    "Please install HACS from: https://hacs.xyz/docs/use/download/download\n\n"
+                    "After installing, restart Home Assistant and try again."
+                ),
+                title="PaddiSense",
+            )
+        return
+
+    installed = []
+    failed = []
+
+    for card in REQUIRED_HACS_CARDS:
+        try:
+            _LOGGER.info("Installing HACS card: %s", card["repository"])
             await hass.services.async_call(
-                "persistent_notification", "create",
+                "hacs", "install",
                 {
-                    "title": "PaddiSense Update Failed",
-                    "message": f"Update failed: {result.get('error', 'Unknown error')}\n\nAttempting rollback...",
-                    "notification_id": "paddisense_update",
+                    "repository": card["repository"],
+                    "category": card["category"],
                 },
             )
-            await hass.async_add_executor_job(backup_manager.rollback)
+            installed.append(card["repository"])
+        except Exception as e:
+            _LOGGER.error("Failed to install %s: %s", card["repository"], e)
+            failed.append(card["repository"])
 
-    async def handle_install_module(call: ServiceCall) -> None:
-        """Install a PaddiSense module."""
-        module_id = call.data["module_id"]
-        module_manager: ModuleManager = hass.data[DOMAIN]["module_manager"]
+    # Notify user
+    if installed:
+        msg = f"Installed: {', '.join(installed)}"
+        if failed:
+            msg += f"\nFailed: {', '.join(failed)}"
+        msg += "\n\nPlease refresh your browser (Ctrl+F5) to load the new cards."
+    else:
+        msg = f"Failed to install cards: {', '.join(failed)}"
 
-        # Get module name for notifications
-        metadata = await hass.async_add_executor_job(module_manager.get_modules_metadata)
-        meta = metadata.get(module_id, MODULE_METADATA.get(module_id, {}))
-        module_name = meta.get("name", module_id)
+    persistent_notification.async_create(
+        hass,
+        msg,
+        title="PaddiSense - HACS Cards",
+    )
 
-        # Show installing notification
-        await hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "PaddiSense",
-                "message": f"Installing module '{module_name}'...",
-                "notification_id": "paddisense_module_install",
-            },
-        )
 
-        # Install required HACS integrations and cards first
-        required_integrations = MODULE_HACS_INTEGRATIONS.get(module_id, [])
-        required_cards = MODULE_HACS_CARDS.get(module_id, [])
-
-        if required_integrations or required_cards:
-            # Check if HACS is available - use multiple detection methods
-            hacs_service_available = hass.services.has_service("hacs", "install")
-            hacs_component_exists = Path("/config/custom_components/hacs").exists()
-
-            if hacs_service_available:
-                await hass.services.async_call(
-                    "persistent_notification", "create",
-                    {
-                        "title": "PaddiSense",
-                        "message": f"Installing HACS requirements for '{module_name}'...",
-                        "notification_id": "paddisense_module_install",
-                    },
-                )
+async def _async_handle_install_module_hacs(
+    hass: HomeAssistant, call: ServiceCall
+) -> None:
+    """Install required HACS integrations and cards for a module."""
+    module_id = call.data["module_id"]
+
+    # Check if HACS is available - use multiple detection methods
+    hacs_service_available = hass.services.has_service("hacs", "install")
+    hacs_component_exists = Path("/config/custom_components/hacs").exists()
+    hacs_config_entries = hass.config_entries.async_entries("hacs")
+
+    if not hacs_service_available:
+        if hacs_component_exists or hacs_config_entries:
+            # HACS is installed but service not ready
+            _LOGGER.warning("HACS is installed but service not available - may need restart")
+            persistent_notification.async_create(
+                hass,
+                (
+                    "HACS is installed but not fully loaded.\n\n"
+                    "Please wait 30 seconds and try again, or restart Home Assistant."
+                ),
+                title="PaddiSense",
+            )
+        else:
+            _LOGGER.error("HACS is not installed")
+            persistent_notification.async_create(
+                hass,
+                "HACS is not installed. Please install HACS first.",
+                title="PaddiSense",
+            )
+        return
 
-                # Install integrations
-                for integration in required_integrations:
-                    try:
-                        _LOGGER.info("Installing HACS integration: %s", integration["repository"])
-                        await hass.services.async_call(
-                            "hacs", "install",
-                            {
-                                "repository": integration["repository"],
-                                "category": "integration",
-                            },
-                        )
-                    except Exception as e:
-                        _LOGGER.warning("Could not install %s: %s", integration["repository"], e)
-
-                # Install cards
-                for card in required_cards:
-                    try:
-                        _LOGGER.info("Installing HACS card: %s", card["repository"])
-                        await hass.services.async_call(
-                            "hacs", "install",
-                            {
-                                "repository": card["repository"],
-                                "category": "plugin",
-                            },
-                        )
-                    except Exception as e:
-                        _LOGGER.warning("Could not install %s: %s", card["repository"], e)
-
-                await hass.services.async_call(
-                    "persistent_notification", "create",
-                    {
-                        "title": "PaddiSense",
-                        "message": f"Installing module '{module_name}'...",
-                        "notification_id": "paddisense_module_install",
-                    },
-                )
-            elif hacs_component_exists:
-                # HACS installed but service not ready
-                _LOGGER.warning("HACS service not ready, skipping HACS requirements for %s - try again after restart", module_id)
-            else:
-                _LOGGER.warning("HACS not installed, skipping HACS requirements for %s", module_id)
+    # Get required integrations and cards for this module
+    required_integrations = MODULE_HACS_INTEGRATIONS.get(module_id, [])
+    required_cards = MODULE_HACS_CARDS.get(module_id, [])
 
-        result = await hass.async_add_executor_job(
-            module_manager.install_module,
-            module_id,
+    if not required_integrations and not required_cards:
+        _LOGGER.info("Module %s has no HACS requirements", module_id)
+        persistent_notification.async_create(
+            hass,
+            f"Module '{module_id}' has no HACS requirements.",
+            title="PaddiSense",
         )
-        _log_service_result("install_module", result)
-
-        if result.get("success"):
-            if result.get("restart_required"):
-                # Notify user before restart
-                version = result.get("version", "unknown")
-
-                # Module-specific post-install messages
-                post_install_msg = ""
-                if module_id == "rtr":
-                    post_install_msg = (
-                        "\n\n**Next Step:** After restart, go to the RTR dashboard "
-                        "and enter your Real Time Rice URL to see predictions."
-                    )
-                elif module_id == "weather":
-                    post_install_msg = (
-                        "\n\n**Auto-Setup:** After restart, BOM Weather will be configured "
-                        "automatically. The Weather dashboard will show data shortly."
-                    )
+        return
 
-                await hass.services.async_call(
-                    "persistent_notification", "create",
-                    {
-                        "title": "PaddiSense",
-                        "message": f"Module '{module_name}' v{version} installed successfully.{post_install_msg}\n\nRestarting Home Assistant...",
-                        "notification_id": "paddisense_module_install",
-                    },
-                )
-                hass.bus.async_fire(EVENT_MODULES_CHANGED)
-                await hass.services.async_call("homeassistant", "restart")
-        else:
-            # Show error notification to user
-            error_msg = result.get("error", "Unknown error")
-            preflight = result.get("preflight", {})
+    # Check what's already installed
+    module_manager: ModuleManager = hass.data[DOMAIN]["module_manager"]
+    installed_domains = await hass.async_add_executor_job(
+        module_manager.get_installed_hacs_integrations
+    )
+    installed_card_folders = await hass.async_add_executor_job(
+        module_manager.get_installed_hacs_cards
+    )
+
+    installed = []
+    failed = []
+    skipped = []
+
+    # Install integrations
+    for integration in required_integrations:
+        domain = integration["domain"]
+        repo = integration["repository"]
+        name = integration.get("name", repo)
 
-            if preflight:
-                errors = preflight.get("errors", [])
-                if errors:
-                    error_msg = f"Installation failed:\n• " + "\n• ".join(errors)
+        # Skip if already installed
+        if domain in installed_domains:
+            skipped.append(name)
+            _LOGGER.info("HACS integration %s already installed", name)
+            continue
 
+        try:
+            _LOGGER.info("Installing HACS integration: %s", repo)
             await hass.services.async_call(
-                "persistent_notification", "create",
+                "hacs", "install",
                 {
-                    "title": "PaddiSense - Module Installation Failed",
-                    "message": error_msg,
-                    "notification_id": "paddisense_module_install",
+                    "repository": repo,
+                    "category": "integration",
                 },
             )
+            installed.append(f"{name} (integration)")
+        except Exception as e:
+            _LOGGER.error("Failed to install %s: %s", repo, e)
+            failed.append(name)
 
-    async def handle_remove_module(call: ServiceCall) -> None:
-        """Remove a PaddiSense module."""
-        module_id = call.data["module_id"]
-        module_manager: ModuleManager = hass.data[DOMAIN]["module_manager"]
+    # Install cards
+    repo_to_folder = {
+        "Makin-Things/platinum-weather-card": "platinum-weather-card",
+        "Makin-Things/lovelace-windrose-card": "lovelace-windrose-card",
+        "Makin-Things/weather-radar-card": "weather-radar-card",
+    }
 
-        # Get module name for notifications
-        metadata = await hass.async_add_executor_job(module_manager.get_modules_metadata)
-        meta = metadata.get(module_id, MODULE_METADATA.get(module_id, {}))
-        module_name = meta.get("name", module_id)
+    for card in required_cards:
+        repo = card["repository"]
+        folder = repo_to_folder.get(repo, repo.split("/")[-1])
+        name = folder
 
-        result = await hass.async_add_executor_job(
-            module_manager.remove_module,
-            module_id,
-            call.data.get("force", False),
-        )
-        _log_service_result("remove_module", result)
-
-        if result.get("success"):
-            if result.get("restart_required"):
-                # Notify user before restart
-                await hass.services.async_call(
-                    "persistent_notification", "create",
-                    {
-                        "title": "PaddiSense",
-                        "message": f"Module '{module_name}' removed successfully.\n\nRestarting Home Assistant...",
-                        "notification_id": "paddisense_module_remove",
-                    },
-                )
-                hass.bus.async_fire(EVENT_MODULES_CHANGED)
-                await hass.services.async_call("homeassistant", "restart")
-        else:
-            # Show error notification to user
-            error_msg = result.get("error", "Unknown error")
-            dependents = result.get("dependents", [])
-
-            if dependents:
-                # Get dependent module names
-                dep_names = []
-                for dep_id in dependents:
-                    dep_meta = metadata.get(dep_id, MODULE_METADATA.get(dep_id, {}))
-                    dep_names.append(dep_meta.get("name", dep_id))
-                error_msg = f"Cannot remove '{module_name}' because it is required by: {', '.join(dep_names)}.\n\nRemove those modules first, or use force removal."
+        # Skip if already installed
+        if folder in installed_card_folders:
+            skipped.append(name)
+            _LOGGER.info("HACS card %s already installed", name)
+            continue
 
+        try:
+            _LOGGER.info("Installing HACS card: %s", repo)
             await hass.services.async_call(
-                "persistent_notification", "create",
+                "hacs", "install",
                 {
-                    "title": "PaddiSense - Module Removal Failed",
-                    "message": error_msg,
-                    "notification_id": "paddisense_module_remove",
+                    "repository": repo,
+                    "category": "plugin",
                 },
             )
+            installed.append(f"{name} (card)")
+        except Exception as e:
+            _LOGGER.error("Failed to install %s: %s", repo, e)
+            failed.append(name)
 
-    async def handle_create_backup(call: ServiceCall) -> None:
-        """Create a PaddiSense backup."""
-        backup_manager: BackupManager = hass.data[DOMAIN]["backup_manager"]
-        result = await hass.async_add_executor_job(
-            backup_manager.create_backup, "manual"
-        )
-        _log_service_result("create_backup", result)
-
-    async def handle_restore_backup(call: ServiceCall) -> None:
-        """Restore from a backup."""
-        backup_manager: BackupManager = hass.data[DOMAIN]["backup_manager"]
-        result = await hass.async_add_executor_job(
-            backup_manager.restore_backup,
-            call.data["backup_id"],
-        )
-        _log_service_result("restore_backup", result)
+    # Build notification message
+    msg_parts = []
+    if installed:
+        msg_parts.append(f"Installed: {', '.join(installed)}")
+    if skipped:
+        msg_parts.append(f"Already installed: {', '.join(skipped)}")
+    if failed:
+        msg_parts.append(f"Failed: {', '.join(failed)}")
 
-        if result.get("success") and result.get("restart_required"):
-            await hass.services.async_call("homeassistant", "restart")
+    if installed:
+        msg_parts.append("\nPlease restart Home Assistant to activate. Then refresh your browser (Ctrl+F5).")
 
-    async def handle_rollback(call: ServiceCall) -> None:
-        """Rollback to previous version."""
-        backup_manager: BackupManager = hass.data[DOMAIN]["backup_manager"]
-        result = await hass.async_add_executor_job(backup_manager.rollback)
-        _log_service_result("rollback", result)
+    msg = "\n".join(msg_parts) if msg_parts else "All requirements already installed."
 
-        if result.get("success") and result.get("restart_required"):
-            await hass.services.async_call("homeassistant", "restart")
+    persistent_notification.async_create(
+        hass,
+        msg,
+        title=f"PaddiSense - {module_id} HACS Requirements",
+    )
 
-    async def handle_add_license(call: ServiceCall) -> None:
-        """Add a license key to unlock modules (PWM, WSS)."""
-        from .helpers import save_license_key
-        from .license import validate_license, LicenseError
 
-        license_key = call.data["license_key"].strip()
+async def _async_register_installer_services(hass: HomeAssistant) -> None:
+    """Register installer services."""
+    # Register installer services
+    _async_register_service(hass, SERVICE_CHECK_UPDATES, partial(_async_handle_check_updates, hass))
+    _async_register_service(hass, SERVICE_UPDATE_PADDISENSE, partial(_async_handle_update_paddisense, hass), UPDATE_PADDISENSE_SCHEMA)
+    _async_register_service(hass, SERVICE_INSTALL_MODULE, partial(_async_handle_install_module, hass), INSTALL_MODULE_SCHEMA)
+    _async_register_service(hass, SERVICE_REMOVE_MODULE, partial(_async_handle_remove_module, hass), REMOVE_MODULE_SCHEMA)
+    _async_register_service(hass, SERVICE_CREATE_BACKUP, partial(_async_handle_create_backup, hass))
+    _async_register_service(hass, SERVICE_RESTORE_BACKUP, partial(_async_handle_restore_backup, hass), RESTORE_BACKUP_SCHEMA)
+    _async_register_service(hass, SERVICE_ROLLBACK, partial(_async_handle_rollback, hass))
+    _async_register_service(hass, SERVICE_ADD_LICENSE, partial(_async_handle_add_license, hass), ADD_LICENSE_SCHEMA)
+    _async_register_service(hass, SERVICE_INSTALL_HACS_CARDS, partial(_async_handle_install_hacs_cards, hass))
+    _async_register_service(hass, SERVICE_INSTALL_MODULE_HACS, partial(_async_handle_install_module_hacs, hass), INSTALL_MODULE_SCHEMA)
 
-        try:
-            # Validate the license first
-            license_info = await hass.async_add_executor_job(validate_license, license_key)
 
-            # Save it (adds to array, doesn't replace)
-            await hass.async_add_executor_job(save_license_key, license_key)
+# =============================================================================
+# RTR SERVICES
+# =============================================================================
 
-            _LOGGER.info(
-                "License added for %s - modules: %s (expires: %s)",
-                license_info.email,
-                ", ".join(license_info.modules),
-                license_info.expiry,
-            )
 
-            # Notify user of success
-            await hass.services.async_call(
-                "persistent_notification", "create",
-                {
-                    "title": "PaddiSense - License Added",
-                    "message": (
-                        f"License validated successfully!\n\n"
-                        f"**Modules unlocked:** {', '.join(license_info.modules)}\n"
-                        f"**Expires:** {license_info.expiry}\n\n"
-                        f"You can now install the licensed modules."
-                    ),
-                    "notification_id": "paddisense_license",
-                },
-            )
+async def _async_handle_set_rtr_url(
+    hass: HomeAssistant, rtr_backend: RTRBackend, call: ServiceCall
+) -> None:
+    """Set the RTR dashboard URL."""
+    result = await hass.async_add_executor_job(
+        rtr_backend.set_url,
+        call.data["url"],
+    )
+    _log_service_result("set_rtr_url", result)
 
-            # Fire event so UI can update
-            hass.bus.async_fire(f"{DOMAIN}_license_updated", {
-                "modules": license_info.modules,
-                "expiry": license_info.expiry.isoformat(),
-            })
-
-        except LicenseError as err:
-            error_msg = str(err)
-            if error_msg == "expired":
-                user_msg = "This license has expired. Please contact PaddiSense for a renewal."
-            elif error_msg == "invalid_format":
-                user_msg = "Invalid license format. License should start with 'PADDISENSE.'"
-            else:
-                user_msg = f"Invalid license: {error_msg}"
+    if result.get("success"):
+        # Auto-refresh data after setting URL
+        refresh_result = await hass.async_add_executor_job(rtr_backend.refresh_data)
+        _log_service_result("refresh_rtr_data", refresh_result)
+        hass.bus.async_fire(EVENT_RTR_UPDATED)
 
-            _LOGGER.warning("License validation failed: %s", error_msg)
 
-            await hass.services.async_call(
-                "persistent_notification", "create",
-                {
-                    "title": "PaddiSense - License Error",
-                    "message": user_msg,
-                    "notification_id": "paddisense_license",
-                },
-            )
+async def _async_handle_refresh_rtr(
+    hass: HomeAssistant, rtr_backend: RTRBackend, call: ServiceCall
+) -> None:
+    """Refresh RTR data from CSV endpoint."""
+    result = await hass.async_add_executor_job(rtr_backend.refresh_data)
+    _log_service_result("refresh_rtr_data", result)
 
-    async def handle_install_hacs_cards(call: ServiceCall) -> None:
-        """Install required HACS frontend cards."""
-        # Check if HACS is available - use multiple detection methods
-        hacs_service_available = hass.services.has_service("hacs", "install")
-        hacs_component_exists = Path("/config/custom_components/hacs").exists()
-        hacs_config_entries = hass.config_entries.async_entries("hacs")
-
-        if not hacs_service_available:
-            if hacs_component_exists or hacs_config_entries:
-                # HACS is installed but service not ready - likely needs restart
-                _LOGGER.warning("HACS is installed but service not available - may need restart")
-                await hass.services.async_call(
-                    "persistent_notification", "create",
-                    {
-                        "title": "PaddiSense",
-                        "message": "HACS is installed but not fully loaded.\n\n"
-                                   "Please try:\n"
-                                   "1. Wait 30 seconds and try again\n"
-                                   "2. Restart Home Assistant if issue persists\n\n"
-                                   "HACS services may take time to load after startup.",
-                    },
-                )
-            else:
-                _LOGGER.error("HACS is not installed")
-                await hass.services.async_call(
-                    "persistent_notification", "create",
-                    {
-                        "title": "PaddiSense",
-                        "message": "HACS is not installed.\n\n"
-                                   "Please install HACS from: https://hacs.xyz/docs/use/download/download\n\n"
-                                   "After installing, restart Home Assistant and try again.",
-                    },
-                )
-            return
+    if result.get("success"):
+        hass.bus.async_fire(EVENT_RTR_UPDATED)
 
-        installed = []
-        failed = []
 
-        for card in REQUIRED_HACS_CARDS:
-            try:
-                _LOGGER.info("Installing HACS card: %s", card["repository"])
-                await hass.services.async_call(
-                    "hacs", "install",
-                    {
-                        "repository": card["repository"],
-                        "category": card["category"],
-                    },
-                )
-                installed.append(card["repository"])
-            except Exception as e:
-                _LOGGER.error("Failed to install %s: %s", card["repository"], e)
-                failed.append(card["repository"])
-
-        # Notify user
-        if installed:
-            msg = f"Installed: {', '.join(installed)}"
-            if failed:
-                msg += f"\nFailed: {', '.join(failed)}"
-            msg += "\n\nPlease refresh your browser (Ctrl+F5) to load the new cards."
-        else:
-            msg = f"Failed to install cards: {', '.join(failed)}"
+async def _async_register_rtr_services(
+    hass: HomeAssistant, rtr_backend: RTRBackend
+) -> None:
+    """Register RTR (Real Time Rice) services."""
+    _async_register_service(
+        hass,
+        SERVICE_SET_RTR_URL,
+        partial(_async_handle_set_rtr_url, hass, rtr_backend),
+        SET_RTR_URL_SCHEMA,
+    )
+    _async_register_service(
+        hass, SERVICE_REFRESH_RTR, partial(_async_handle_refresh_rtr, hass, rtr_backend)
+    )
 
-        await hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "PaddiSense - HACS Cards",
-                "message": msg,
-            },
-        )
 
-    async def handle_install_module_hacs(call: ServiceCall) -> None:
-        """Install required HACS integrations and cards for a module."""
-        module_id = call.data["module_id"]
+# =============================================================================
+# HELPERS
+# =============================================================================
 
-        # Check if HACS is available - use multiple detection methods
-        hacs_service_available = hass.services.has_service("hacs", "install")
-        hacs_component_exists = Path("/config/custom_components/hacs").exists()
-        hacs_config_entries = hass.config_entries.async_entries("hacs")
-
-        if not hacs_service_available:
-            if hacs_component_exists or hacs_config_entries:
-                # HACS is installed but service not ready
-                _LOGGER.warning("HACS is installed but service not available - may need restart")
-                await hass.services.async_call(
-                    "persistent_notification", "create",
-                    {
-                        "title": "PaddiSense",
-                        "message": "HACS is installed but not fully loaded.\n\n"
-                                   "Please wait 30 seconds and try again, or restart Home Assistant.",
-                    },
-                )
+def _remove_entry_cleanup() -> None:
+    """Remove module symlinks and PaddiSense dashboards (runs in executor)."""
+    # Remove module symlinks from packages directory
+    if PACKAGES_DIR.exists():
+        for module_id in AVAILABLE_MODULES:
+            symlink_path = PACKAGES_DIR / f"{module_id}.yaml"
+            try:
+                symlink_path.unlink()
+            except FileNotFoundError:
+                continue
+            except OSError as e:
+                _LOGGER.warning("Failed to remove symlink %s: %s", symlink_path, e)
             else:
-                _LOGGER.error("HACS is not installed")
-                await hass.services.async_call(
-                    "persistent_notification", "create",
-                    {
-                        "title": "PaddiSense",
-                        "message": "HACS is not installed. Please install HACS first.",
-                    },
-                )
-            return
+                _LOGGER.info("Removed package symlink: %s", symlink_path)
 
-        # Get required integrations and cards for this module
-        required_integrations = MODULE_HACS_INTEGRATIONS.get(module_id, [])
-        required_cards = MODULE_HACS_CARDS.get(module_id, [])
+    # Remove PaddiSense dashboards from lovelace_dashboards.yaml
+    if LOVELACE_DASHBOARDS_YAML.exists():
+        _remove_paddisense_dashboards()
 
-        if not required_integrations and not required_cards:
-            _LOGGER.info("Module %s has no HACS requirements", module_id)
-            await hass.services.async_call(
-                "persistent_notification", "create",
-                {
-                    "title": "PaddiSense",
-                    "message": f"Module '{module_id}' has no HACS requirements.",
-                },
-            )
-            return
 
-        # Check what's already installed
-        module_manager: ModuleManager = hass.data[DOMAIN]["module_manager"]
-        installed_domains = await hass.async_add_executor_job(
-            module_manager.get_installed_hacs_integrations
-        )
-        installed_card_folders = await hass.async_add_executor_job(
-            module_manager.get_installed_hacs_cards
-        )
+def _remove_paddisense_dashboards() -> None:
+    """Remove PaddiSense dashboards from lovelace_dashboards.yaml."""
+    import yaml
 
-        installed = []
-        failed = []
-        skipped = []
+    try:
+        from yaml import CSafeDumper as YamlDumper, CSafeLoader as YamlLoader
+    except ImportError:
+        from yaml import SafeDumper as YamlDumper, SafeLoader as YamlLoader  # type: ignore[assignment]
 
-        # Install integrations
-        for integration in required_integrations:
-            domain = integration["domain"]
-            repo = integration["repository"]
-            name = integration.get("name", repo)
+    try:
+        content = LOVELACE_DASHBOARDS_YAML.read_text(encoding="utf-8")
+        dashboards = yaml.load(content, Loader=YamlLoader) or {}
 
-            # Skip if already installed
-            if domain in installed_domains:
-                skipped.append(name)
-                _LOGGER.info("HACS integration %s already installed", name)
-                continue
+        # Find and remove PaddiSense dashboards
+        removed = sorted(_PADDISENSE_SLUGS & dashboards.keys())
+        for slug in removed:
+            del dashboards[slug]
 
-            try:
-                _LOGGER.info("Installing HACS integration: %s", repo)
-                await hass.services.async_call(
-                    "hacs", "install",
-                    {
-                        "repository": repo,
-                        "category": "integration",
-                    },
-                )
-                installed.append(f"{name} (integration)")
-            except Exception as e:
-                _LOGGER.error("Failed to install %s: %s", repo, e)
-                failed.append(name)
-
-        # Install cards
-        repo_to_folder = {
-            "Makin-Things/platinum-weather-card": "platinum-weather-card",
-            "Makin-Things/lovelace-windrose-card": "lovelace-windrose-card",
-            "Makin-Things/weather-radar-card": "weather-radar-card",
-        }
-
-        for card in required_cards:
-            repo = card["repository"]
-            folder = repo_to_folder.get(repo, repo.split("/")[-1])
-            name = folder
-
-            # Skip if already installed
-            if folder in installed_card_folders:
-                skipped.append(name)
-                _LOGGER.info("HACS card %s already installed", name)
-                continue
+        if removed:
+            # Write back
+            header = """# Lovelace Dashboards
+# Managed by Home Assistant
 
-            try:
-                _LOGGER.info("Installing HACS card: %s", repo)
-                await hass.services.async_call(
-                    "hacs", "install",
-                    {
-                        "repository": repo,
-                        "category": "plugin",
-                    },
-                )
-                installed.append(f"{name} (card)")
-            except Exception as e:
-                _LOGGER.error("Failed to install %s: %s", repo, e)
-                failed.append(name)
-
-        # Build notification message
-        msg_parts = []
-        if installed:
-            msg_parts.append(f"Installed: {', '.join(installed)}")
-        if skipped:
-            msg_parts.append(f"Already installed: {', '.join(skipped)}")
-        if failed:
-            msg_parts.append(f"Failed: {', '.join(failed)}")
+"""
+            new_content = header + yaml.dump(
+                dashboards, Dumper=YamlDumper, default_flow_style=False, sort_keys=False
+            )
+            LOVELACE_DASHBOARDS_YAML.write_text(new_content, encoding="utf-8")
+            _LOGGER.info("Removed dashboards: %s", ", ".join(removed))
 
-        if installed:
-            msg_parts.append("\nPlease restart Home Assistant to activate. Then refresh your browser (Ctrl+F5).")
+    except Exception as e:
+        _LOGGER.warning("Failed to clean up dashboards: %s", e)
 
-        msg = "\n".join(msg_parts) if msg_parts else "All requirements already installed."
 
-        await hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": f"PaddiSense - {module_id} HACS Requirements",
-                "message": msg,
-            },
-        )
+class MetadataCache:
+    """Module metadata kept in memory between installer service calls."""
 
-    # Register installer services
-    hass.services.async_register(DOMAIN, SERVICE_CHECK_UPDATES, handle_check_updates)
-    hass.services.async_register(DOMAIN, SERVICE_UPDATE_PADDISENSE, handle_update_paddisense, UPDATE_PADDISENSE_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_INSTALL_MODULE, handle_install_module, INSTALL_MODULE_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_REMOVE_MODULE, handle_remove_module, REMOVE_MODULE_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_CREATE_BACKUP, handle_create_backup)
-    hass.services.async_register(DOMAIN, SERVICE_RESTORE_BACKUP, handle_restore_backup, RESTORE_BACKUP_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_ROLLBACK, handle_rollback)
-    hass.services.async_register(DOMAIN, SERVICE_ADD_LICENSE, handle_add_license, ADD_LICENSE_SCHEMA)
-    hass.services.async_register(DOMAIN, SERVICE_INSTALL_HACS_CARDS, handle_install_hacs_cards)
-    hass.services.async_register(DOMAIN, SERVICE_INSTALL_MODULE_HACS, handle_install_module_hacs, INSTALL_MODULE_SCHEMA)
+    def __init__(self, loader: Callable[[], dict[str, Any]]) -> None:
+        """Initialize the cache with the blocking metadata loader."""
+        self._loader = loader
+        self._data: dict[str, Any] | None = None
+        self._expires = 0.0
 
+    @callback
+    def invalidate(self, _event: Any = None) -> None:
+        """Drop the cached metadata (also used as the modules-changed listener)."""
+        self._data = None
 
-# =============================================================================
-# RTR SERVICES
-# =============================================================================
+    async def async_get(self, hass: HomeAssistant) -> dict[str, Any]:
+        """Return module metadata, reloading it once the TTL has passed."""
+        now = time.monotonic()
+        if self._data is None or now >= self._expires:
+            self._data = await hass.async_add_executor_job(self._loader)
+            self._expires = now + METADATA_CACHE_TTL
+        return self._data
 
-async def _async_register_rtr_services(
-    hass: HomeAssistant, rtr_backend: RTRBackend
-) -> None:
-    """Register RTR (Real Time Rice) services."""
 
-    async def handle_set_rtr_url(call: ServiceCall) -> None:
-        """Set the RTR dashboard URL."""
-        result = await hass.async_add_executor_job(
-            rtr_backend.set_url,
-            call.data["url"],
-        )
-        _log_service_result("set_rtr_url", result)
+async def _async_run(hass: HomeAssistant, func: Any, *args: Any) -> Any:
+    """Run a blocking registry call on the PaddiSense executor.
+
+    The caller's context is copied into the worker thread, as
+    asyncio.to_thread does.
+    """
+    ctx = contextvars.copy_context()
+    return await hass.loop.run_in_executor(
+        hass.data[DOMAIN]["_executor"], partial(ctx.run, func, *args)
+    )
 
-        if result.get("success"):
-            # Auto-refresh data after setting URL
-            refresh_result = await hass.async_add_executor_job(rtr_backend.refresh_data)
-            _log_service_result("refresh_rtr_data", refresh_result)
-            hass.bus.async_fire(EVENT_RTR_UPDATED)
 
-    async def handle_refresh_rtr(call: ServiceCall) -> None:
-        """Refresh RTR data from CSV endpoint."""
-        result = await hass.async_add_executor_job(rtr_backend.refresh_data)
-        _log_service_result("refresh_rtr_data", result)
+@callback
+def _async_register_service(
+    hass: HomeAssistant,
+    service: str,
+    handler: Any,
+    schema: vol.Schema | None = None,
+) -> None:
+    """Register a PaddiSense service and record it for unload."""
+    hass.services.async_register(DOMAIN, service, handler, schema)
+    hass.data[DOMAIN].setdefault("_services", set()).add(service)
 
-        if result.get("success"):
-            hass.bus.async_fire(EVENT_RTR_UPDATED)
 
-    # Register RTR services
-    hass.services.async_register(
-        DOMAIN, SERVICE_SET_RTR_URL, handle_set_rtr_url, SET_RTR_URL_SCHEMA
+async def _async_cleanup_unlicensed_modules(
+    hass: HomeAssistant, licensed_modules: list[str]
+) -> None:
+    """Cleanup unlicensed module folders."""
+    if not licensed_modules:
+        return
+    cleanup_result = await hass.async_add_executor_job(
+        cleanup_unlicensed_modules, licensed_modules
     )
-    hass.services.async_register(DOMAIN, SERVICE_REFRESH_RTR, handle_refresh_rtr)
+    if cleanup_result.get("removed"):
+        _LOGGER.info(
+            "Cleaned up unlicensed modules: %s",
+            ", ".join(cleanup_result["removed"])
+        )
 
 
-# =============================================================================
-# HELPERS
-# =============================================================================
-
 def _ensure_registry_installed() -> None:
     """Ensure the registry package and dashboard are installed (core component)."""
     import yaml
@@ -1300,13 +1427,24 @@ def _ensure_registry_installed() -> None:
 def _log_service_result(service: str, result: dict[str, Any]) -> None:
     """Log service result."""
     if result.get("success"):
-        _LOGGER.info("PaddiSense %s: %s", service, result.get("message", "Success"))
+        if _LOGGER.isEnabledFor(logging.INFO):
+            _LOGGER.info("PaddiSense %s: %s", service, result.get("message", "Success"))
     else:
         _LOGGER.error("PaddiSense %s failed: %s", service, result.get("error", "Unknown error"))
 
 
 async def _async_update_sensors(hass: HomeAssistant) -> None:
-    """Trigger sensor update after data change."""
+    """Trigger sensor update after data change.
+
+    Changes made within SENSOR_UPDATE_COOLDOWN of each other fire a single
+    update event, so bulk edits refresh the sensors once.
+    """
+    hass.data[DOMAIN]["_sensor_debouncer"].async_schedule_call()
+
+
+@callback
+def _async_fire_data_updated(hass: HomeAssistant) -> None:
+    """Fire the sensor update event."""
     hass.bus.async_fire(EVENT_DATA_UPDATED)
 
 
@@ -1320,18 +1458,16 @@ async def _async_install_required_hacs(hass: HomeAssistant) -> None:
 
     if not hacs_installed:
         _LOGGER.info("HACS not installed, skipping automatic card installation")
-        await hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "PaddiSense - HACS Recommended",
-                "message": (
-                    "HACS (Home Assistant Community Store) is recommended for PaddiSense dashboards.\n\n"
-                    "Install HACS for automatic dashboard card installation:\n"
-                    "https://hacs.xyz/docs/use/download/download\n\n"
-                    "Or manually install required cards from the Settings tab."
-                ),
-                "notification_id": "paddisense_hacs_required",
-            },
+        persistent_notification.async_create(
+            hass,
+            (
+                "HACS (Home Assistant Community Store) is recommended for PaddiSense dashboards.\n\n"
+                "Install HACS for automatic dashboard card installation:\n"
+                "https://hacs.xyz/docs/use/download/download\n\n"
+                "Or manually install required cards from the Settings tab."
+            ),
+            title="PaddiSense - HACS Recommended",
+            notification_id="paddisense_hacs_required",
         )
         return
 
@@ -1386,13 +1522,11 @@ async def _async_install_required_hacs(hass: HomeAssistant) -> None:
     _LOGGER.info("Installing %d required HACS cards...", len(cards_to_install))
 
     # Notify user that installation is starting
-    await hass.services.async_call(
-        "persistent_notification", "create",
-        {
-            "title": "PaddiSense Setup",
-            "message": f"Installing {len(cards_to_install)} required HACS cards...\n\nThis may take a minute.",
-            "notification_id": "paddisense_hacs_install",
-        },
+    persistent_notification.async_create(
+        hass,
+        f"Installing {len(cards_to_install)} required HACS cards...\n\nThis may take a minute.",
+        title="PaddiSense Setup",
+        notification_id="paddisense_hacs_install",
     )
 
     installed = []
@@ -1420,13 +1554,11 @@ async def _async_install_required_hacs(hass: HomeAssistant) -> None:
             msg += f"\n\nFailed to install:\n- " + "\n- ".join(failed)
         msg += "\n\nPlease refresh your browser (Ctrl+F5) to load the new cards."
 
-        await hass.services.async_call(
-            "persistent_notification", "create",
-            {
-                "title": "PaddiSense - HACS Cards Installed",
-                "message": msg,
-                "notification_id": "paddisense_hacs_install",
-            },
+        persistent_notification.async_create(
+            hass,
+            msg,
+            title="PaddiSense - HACS Cards Installed",
+            notification_id="paddisense_hacs_install",
         )
 
 
@@ -1438,12 +1570,12 @@ async def _async_register_frontend(hass: HomeAssistant) -> None:
     await hass.http.async_register_static_paths([
         StaticPathConfig(
             "/paddisense/paddisense-registry-card.js",
-            hass.config.path("custom_components/paddisense/www/paddisense-registry-card.js"),
+            _REGISTRY_CARD_PATH,
             cache_headers=False,
         ),
         StaticPathConfig(
             "/paddisense/paddisense-manager-card.js",
-            hass.config.path("custom_components/paddisense/www/paddisense-manager-card.js"),
+            _MANAGER_CARD_PATH,
             cache_headers=False,
         ),
     ])
@@ -201,6 +201,7 @@ SERVICE_EDIT_PADDOCK = "edit_paddock"
 SERVICE_DELETE_PADDOCK = "delete_paddock"
 SERVICE_SET_CURRENT_SEASON = "set_current_season"
 SERVICE_ADD_BAY = "add_bay"
+SERVICE_ADD_BAYS_BULK = "add_bays_bulk"
 SERVICE_EDIT_BAY = "edit_bay"
 SERVICE_DELETE_BAY = "delete_bay"
 SERVICE_ADD_SEASON = "add_season"
@@ -200,18 +200,26 @@ class RegistryBackend:
         paddock = paddocks[paddock_id]
         changes = []
 
-        if name is not None:
+        if name is not None and name != paddock.get("name"):
             paddock["name"] = name
             changes.append(f"name={name}")
 
-        if farm_id is not None:
+        if farm_id is not None and farm_id != paddock.get("farm_id"):
             paddock["farm_id"] = farm_id
             changes.append(f"farm={farm_id}")
 
-        if current_season is not None:
+        if current_season is not None and current_season != paddock.get("current_season"):
             paddock["current_season"] = current_season
             changes.append(f"current_season={current_season}")
 
+        if not changes:
+            return {
+                "success": True,
+                "paddock_id": paddock_id,
+                "changed": False,
+                "message": f"No changes to paddock '{paddock['name']}'",
+            }
+
         paddock["modified"] = datetime.now().isoformat(timespec="seconds")
 
         self._log_transaction(
@@ -277,6 +285,15 @@ class RegistryBackend:
         else:
             new_value = not paddock.get("current_season", True)
 
+        if new_value == paddock.get("current_season"):
+            return {
+                "success": True,
+                "paddock_id": paddock_id,
+                "current_season": new_value,
+                "changed": False,
+                "message": f"{paddock['name']} current_season already {new_value}",
+            }
+
         paddock["current_season"] = new_value
         paddock["modified"] = datetime.now().isoformat(timespec="seconds")
 
@@ -349,6 +366,64 @@ class RegistryBackend:
             "message": f"Added bay '{name}' to paddock",
         }
 
+    def add_bays_bulk(
+        self, paddock_id: str, bays_to_add: list[dict[str, Any]]
+    ) -> dict[str, Any]:
+        """Add several bays to an existing paddock with a single save.
+
+        Each item takes the add_bay arguments (name, order, is_last). Either
+        every bay is added or, on a conflict, none are.
+        """
+        config = load_registry_config()
+        paddocks = config.get("paddocks", {})
+        bays = config.setdefault("bays", {})
+
+        if paddock_id not in paddocks:
+            return {"success": False, "error": f"Paddock '{paddock_id}' not found"}
+
+        paddock = paddocks[paddock_id]
+        bay_ids = [f"{paddock_id}_{generate_id(item['name'])}" for item in bays_to_add]
+
+        existing = [bay_id for bay_id in bay_ids if bay_id in bays]
+        if existing:
+            return {"success": False, "error": f"Bays already exist: {', '.join(existing)}"}
+        if len(set(bay_ids)) != len(bay_ids):
+            return {"success": False, "error": "Duplicate bay names in request"}
+
+        max_order = max(
+            [b.get("order", 0) for b in bays.values() if b.get("paddock_id") == paddock_id],
+            default=0,
+        )
+
+        now = datetime.now().isoformat(timespec="seconds")
+        for bay_id, item in zip(bay_ids, bays_to_add):
+            order = item.get("order") or max_order + 1
+            max_order = max(max_order, order)
+            bays[bay_id] = {
+                "paddock_id": paddock_id,
+                "name": item["name"],
+                "order": order,
+                "is_last_bay": item.get("is_last", False),
+                "created": now,
+                "modified": now,
+            }
+            self._log_transaction(
+                config, "add", "bay", bay_id, item["name"], f"Added to {paddock_id}"
+            )
+
+        paddock["bay_count"] = len(
+            [b for b in bays.values() if b.get("paddock_id") == paddock_id]
+        )
+        paddock["modified"] = now
+
+        save_registry_config(config)
+
+        return {
+            "success": True,
+            "bay_ids": bay_ids,
+            "message": f"Added {len(bay_ids)} bays to paddock",
+        }
+
     def edit_bay(
         self,
         bay_id: str,
@@ -366,18 +441,26 @@ class RegistryBackend:
         bay = bays[bay_id]
         changes = []
 
-        if name is not None:
+        if name is not None and name != bay.get("name"):
             bay["name"] = name
             changes.append(f"name={name}")
 
-        if order is not None:
+        if order is not None and order != bay.get("order"):
             bay["order"] = order
             changes.append(f"order={order}")
 
-        if is_last is not None:
+        if is_last is not None and is_last != bay.get("is_last_bay"):
             bay["is_last_bay"] = is_last
             changes.append(f"is_last={is_last}")
 
+        if not changes:
+            return {
+                "success": True,
+                "bay_id": bay_id,
+                "changed": False,
+                "message": f"No changes to bay '{bay['name']}'",
+            }
+
         bay["modified"] = datetime.now().isoformat(timespec="seconds")
 
         self._log_transaction(
@@ -486,18 +569,26 @@ class RegistryBackend:
         season = seasons[season_id]
         changes = []
 
-        if name is not None:
+        if name is not None and name != season.get("name"):
             season["name"] = name
             changes.append(f"name={name}")
 
-        if start_date is not None:
+        if start_date is not None and start_date != season.get("start_date"):
             season["start_date"] = start_date
             changes.append(f"start={start_date}")
 
-        if end_date is not None:
+        if end_date is not None and end_date != season.get("end_date"):
             season["end_date"] = end_date
             changes.append(f"end={end_date}")
 
+        if not changes:
+            return {
+                "success": True,
+                "season_id": season_id,
+                "changed": False,
+                "message": f"No changes to season '{season['name']}'",
+            }
+
         season["modified"] = datetime.now().isoformat(timespec="seconds")
 
         self._log_transaction(
@@ -539,11 +630,22 @@ class RegistryBackend:
         if season_id not in seasons:
             return {"success": False, "error": f"Season '{season_id}' not found"}
 
+        season_name = seasons[season_id].get("name", season_id)
+        if all(
+            season.get("active", False) == (sid == season_id)
+            for sid, season in seasons.items()
+        ):
+            return {
+                "success": True,
+                "season_id": season_id,
+                "changed": False,
+                "message": f"'{season_name}' is already the active season",
+            }
+
         for sid, season in seasons.items():
             season["active"] = sid == season_id
             season["modified"] = datetime.now().isoformat(timespec="seconds")
 
-        season_name = seasons[season_id].get("name", season_id)
         self._log_transaction(
             config, "set_active", "season", season_id, season_name, ""
         )
@@ -596,10 +698,18 @@ class RegistryBackend:
         farm = farms[farm_id]
         changes = []
 
-        if name is not None:
+        if name is not None and name != farm.get("name"):
             farm["name"] = name
             changes.append(f"name={name}")
 
+        if not changes:
+            return {
+                "success": True,
+                "farm_id": farm_id,
+                "changed": False,
+                "message": f"No changes to farm '{farm['name']}'",
+            }
+
         farm["modified"] = datetime.now().isoformat(timespec="seconds")
 
         self._log_transaction(